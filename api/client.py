@@ -15,15 +15,20 @@ class ExchangeRateClient:
     # API의 기본 URL을 정의합니다.
     BASE_URL = "https://oapi.koreaexim.go.kr/site/program/financial/exchangeJSON"
 
-    def __init__(self, authkey: str):
+    def __init__(self, authkey: str, base_url: str | None = None, timeout: float = 10.0):
         """
         ExchangeRateClient의 생성자입니다.
         API 인증키를 초기화합니다.
 
         Args:
             authkey (str): 한국수출입은행 API 인증키.
+            base_url (str, optional): 요청을 보낼 URL. 기본값은 None (BASE_URL 사용).
+                                      로컬 대역 서버(api/local_stub_server.py)로 테스트할 때 지정합니다.
+            timeout (float, optional): 요청 타임아웃(초). 기본값은 10초.
         """
         self.authkey = authkey # 전달받은 인증키를 인스턴스 변수로 저장
+        self.base_url = base_url or self.BASE_URL # 요청 대상 URL (지정하지 않으면 실제 API)
+        self.timeout = timeout # 응답이 없을 때 무한정 기다리지 않도록 타임아웃 설정
 
     def get_exchange_rates(self, searchdate: str, data: str = "AP01") -> dict | None:
         """
@@ -46,7 +51,7 @@ class ExchangeRateClient:
         try:
             # requests.get()을 사용하여 API에 GET 요청을 보냅니다.
             # verify=False는 SSL 인증서 검증을 비활성화합니다. (개발/테스트 환경에서 유용할 수 있으나, 프로덕션에서는 주의 필요)
-            response = requests.get(self.BASE_URL, verify=False, params=params)
+            response = requests.get(self.base_url, verify=False, params=params, timeout=self.timeout)
             # HTTP 응답 상태 코드가 200 (성공)이 아니면 예외를 발생시킵니다.
             response.raise_for_status() 
             # 응답 본문을 JSON 형태로 파싱하여 반환합니다.
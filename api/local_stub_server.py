@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import argparse # 명령행 인자 처리를 위해 사용
+import datetime # 주말 여부 판단을 위해 사용
+import json # 응답 본문 직렬화를 위해 사용
+import threading # 서버를 백그라운드 스레드에서 실행하기 위해 사용
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer # 표준 라이브러리 HTTP 서버
+from urllib.parse import urlparse, parse_qs # 요청 URL의 쿼리 파라미터 파싱을 위해 사용
+
+# 대역 서버가 돌려줄 통화 목록 (통화 코드, 통화명, 기준 매매 기준율)
+STUB_CURRENCIES = [
+    ("USD", "미국 달러", 1350.0),
+    ("JPY(100)", "일본 옌", 905.0),
+    ("EUR", "유로", 1460.0),
+    ("CNH", "위안화", 186.0),
+]
+
+
+def build_exchange_rates(searchdate: str) -> list[dict]:
+    """
+    한국수출입은행 AP01 응답과 같은 형식의 가짜 환율 데이터를 만듭니다.
+    주말에는 실제 API처럼 빈 리스트를 반환합니다.
+
+    Args:
+        searchdate (str): 조회 날짜 (YYYYMMDD 형식의 문자열).
+
+    Returns:
+        list[dict]: 통화별 환율 정보 딕셔너리 리스트.
+    """
+    date = datetime.datetime.strptime(searchdate, "%Y%m%d").date()
+    if date.weekday() >= 5: # 토요일(5), 일요일(6)은 데이터 없음
+        return []
+    offset = date.toordinal() % 50 # 날짜마다 값이 조금씩 달라지도록 오프셋 적용
+    rates = []
+    for code, name, base in STUB_CURRENCIES:
+        deal = base + offset
+        rates.append({
+            "result": 1,
+            "cur_unit": code,
+            "ttb": f"{deal * 0.99:,.2f}",
+            "tts": f"{deal * 1.01:,.2f}",
+            "deal_bas_r": f"{deal:,.2f}",
+            "bkpr": f"{int(deal):,}",
+            "yy_efee_r": "0",
+            "ten_dd_efee_r": "0",
+            "kftc_bkpr": f"{int(deal):,}",
+            "kftc_deal_bas_r": f"{deal:,.2f}",
+            "cur_nm": name,
+        })
+    return rates
+
+
+def build_interest_rates(searchdate: str, data: str) -> list[dict]:
+    """
+    한국수출입은행 AP02(대출금리), AP03(국제금리) 응답과 같은 형식의 가짜 금리 데이터를 만듭니다.
+    주말에는 빈 리스트를 반환합니다.
+
+    Args:
+        searchdate (str): 조회 날짜 (YYYYMMDD 형식의 문자열).
+        data (str): 데이터 종류 ("AP02" 또는 "AP03").
+
+    Returns:
+        list[dict]: 금리 정보 딕셔너리 리스트.
+    """
+    date = datetime.datetime.strptime(searchdate, "%Y%m%d").date()
+    if date.weekday() >= 5:
+        return []
+    offset = (date.toordinal() % 20) / 100
+    if data == "AP02":
+        return [
+            {"result": 1, "sfln_intrc_nm": "수출자금대출", "int_r": f"{3.5 + offset:.2f}"},
+            {"result": 1, "sfln_intrc_nm": "해외투자자금대출", "int_r": f"{4.1 + offset:.2f}"},
+        ]
+    return [
+        {"result": 1, "cur_fund": "USD", "sfln_intrc_nm": "SOFR", "int_r": f"{5.3 + offset:.2f}"},
+        {"result": 1, "cur_fund": "EUR", "sfln_intrc_nm": "EURIBOR 3M", "int_r": f"{3.8 + offset:.2f}"},
+    ]
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """
+    한국수출입은행 API를 흉내 내는 요청 핸들러입니다.
+    스케줄러와 서비스를 실제 할당량을 쓰지 않고 확인할 때 사용합니다.
+    """
+    request_count = 0 # 서버가 받은 전체 요청 수
+    _count_lock = threading.Lock() # 요청 수 집계용 락
+
+    def do_GET(self):
+        """
+        GET 요청을 처리합니다. searchdate와 data 파라미터에 따라 가짜 데이터를 반환합니다.
+        """
+        with StubRequestHandler._count_lock:
+            StubRequestHandler.request_count += 1
+        params = parse_qs(urlparse(self.path).query)
+        searchdate = params.get("searchdate", [datetime.date.today().strftime("%Y%m%d")])[0]
+        data = params.get("data", ["AP01"])[0]
+        body = build_exchange_rates(searchdate) if data == "AP01" else build_interest_rates(searchdate, data)
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        """
+        기본 접근 로그 출력을 끕니다.
+        """
+        pass
+
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """
+    대역 서버를 백그라운드 스레드에서 시작합니다.
+
+    Args:
+        host (str, optional): 바인딩할 주소. 기본값은 "127.0.0.1".
+        port (int, optional): 바인딩할 포트. 기본값은 0 (임의의 빈 포트).
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버. server_address로 실제 포트를 확인하고, shutdown()으로 종료합니다.
+    """
+    server = ThreadingHTTPServer((host, port), StubRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="한국수출입은행 API 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    httpd = ThreadingHTTPServer((args.host, args.port), StubRequestHandler)
+    print(f"대역 서버 실행 중: http://{args.host}:{args.port}/ (API_BASE_URL로 지정하여 사용)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
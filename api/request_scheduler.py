@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import datetime # 일일 할당량 기준 날짜(KST) 계산을 위해 사용
+import heapq # 우선순위 대기열 구현을 위해 사용
+import itertools # 대기열 내 순서 보장을 위한 일련번호 생성에 사용
+import json # 할당량 사용 내역을 파일로 저장/로드하기 위해 사용
+import os # 파일 존재 여부 확인을 위해 사용
+import threading # 여러 스레드에서 동시에 요청할 때 상태를 보호하기 위해 사용
+import time # 토큰 버킷 충전 시간 계산을 위해 사용
+from enum import IntEnum # 요청 우선순위 정의를 위해 사용
+from typing import Callable
+
+from api.client import ExchangeRateClient # 실제 API 요청을 보내는 클라이언트
+
+# 한국수출입은행 API의 일일 할당량은 한국 표준시(KST) 자정을 기준으로 초기화됩니다.
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+
+class RequestPriority(IntEnum):
+    """
+    API 요청의 우선순위를 정의하는 열거형입니다.
+    값이 작을수록 먼저 처리됩니다.
+    """
+    INTERACTIVE = 0 # 사용자가 직접 요청한 새로고침
+    BACKGROUND = 1  # 과거 데이터 백필 등 백그라운드 작업
+
+
+class RequestDeferred(Exception):
+    """
+    남은 할당량이 부족하여 요청이 보류되었을 때 발생하는 예외입니다.
+    """
+    def __init__(self, priority: RequestPriority, remaining: int):
+        super().__init__(f"API 할당량 부족으로 요청이 보류되었습니다. (우선순위: {priority.name}, 남은 할당량: {remaining})")
+        self.priority = priority # 보류된 요청의 우선순위
+        self.remaining = remaining # 보류 시점의 남은 할당량
+
+
+class TokenBucket:
+    """
+    짧은 시간 동안 요청이 몰리지 않도록 초당 요청 수를 제한하는 토큰 버킷입니다.
+    """
+    def __init__(self, rate: float, capacity: int):
+        """
+        TokenBucket의 생성자입니다.
+
+        Args:
+            rate (float): 초당 충전되는 토큰 수.
+            capacity (int): 버킷에 담을 수 있는 최대 토큰 수 (순간 허용 요청 수).
+        """
+        self.rate = rate # 초당 충전 속도
+        self.capacity = capacity # 최대 토큰 수
+        self._tokens = float(capacity) # 처음에는 버킷을 가득 채운 상태로 시작
+        self._last_refill = time.monotonic() # 마지막 충전 시각
+
+    def _refill(self):
+        """
+        마지막 충전 이후 경과한 시간만큼 토큰을 충전합니다.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def try_acquire(self) -> bool:
+        """
+        토큰 하나를 꺼냅니다.
+
+        Returns:
+            bool: 토큰을 꺼냈으면 True, 버킷이 비어 있으면 False.
+        """
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def time_until_available(self) -> float:
+        """
+        다음 토큰을 사용할 수 있을 때까지 남은 시간(초)을 반환합니다.
+        """
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+
+class DailyQuota:
+    """
+    하루 동안 사용한 API 요청 수를 집계하고 JSON 파일로 저장하는 클래스입니다.
+    애플리케이션을 재시작해도 같은 날의 사용량이 유지됩니다.
+    """
+    def __init__(self, limit: int, file_path: str = 'quota.json'):
+        """
+        DailyQuota의 생성자입니다.
+
+        Args:
+            limit (int): 하루 최대 요청 수.
+            file_path (str, optional): 사용량을 저장할 파일 경로. 기본값은 'quota.json'.
+        """
+        self.limit = limit # 일일 최대 요청 수
+        self.file_path = file_path # 사용량 저장 파일 경로
+        self._date = self._today() # 사용량 집계 기준 날짜 (YYYYMMDD)
+        self._used = 0 # 오늘 사용한 요청 수
+        self._load()
+
+    @staticmethod
+    def _today() -> str:
+        """
+        한국 표준시 기준 오늘 날짜를 YYYYMMDD 형식으로 반환합니다.
+        """
+        return datetime.datetime.now(KST).strftime("%Y%m%d")
+
+    def _load(self):
+        """
+        파일에서 오늘 날짜의 사용량을 불러옵니다. 날짜가 다르면 사용량을 0으로 시작합니다.
+        """
+        if not os.path.exists(self.file_path):
+            return
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('date') == self._date:
+                self._used = int(saved.get('used', 0))
+        except (OSError, ValueError) as e:
+            print(f"할당량 파일을 읽는 중 오류 발생: {e}. 사용량을 0으로 시작합니다.")
+
+    def _save(self):
+        """
+        현재 사용량을 파일에 저장합니다.
+        """
+        try:
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                json.dump({'date': self._date, 'used': self._used}, f)
+        except OSError as e:
+            print(f"할당량 파일을 저장하는 중 오류 발생: {e}")
+
+    def _roll_over(self):
+        """
+        날짜가 바뀌었으면 사용량을 초기화합니다.
+        """
+        today = self._today()
+        if today != self._date:
+            self._date = today
+            self._used = 0
+
+    @property
+    def used(self) -> int:
+        """
+        오늘 사용한 요청 수를 반환합니다.
+        """
+        self._roll_over()
+        return self._used
+
+    @property
+    def remaining(self) -> int:
+        """
+        오늘 남은 요청 수를 반환합니다.
+        """
+        return max(0, self.limit - self.used)
+
+    def consume(self):
+        """
+        요청 하나를 사용한 것으로 기록하고 파일에 저장합니다.
+        """
+        self._roll_over()
+        self._used += 1
+        self._save()
+
+
+class RequestScheduler:
+    """
+    ExchangeRateClient 앞에서 API 요청을 조절하는 스케줄러입니다.
+    토큰 버킷으로 초당 요청 수를 제한하고, 일일 할당량을 집계하며,
+    할당량이 부족해지면 백그라운드 요청을 먼저 보류하여 사용자 새로고침에 사용할 여유분을 남겨둡니다.
+    """
+    def __init__(self, client: ExchangeRateClient, daily_limit: int = 1000, background_reserve: int = 100,
+                 rate: float = 5.0, burst: int = 5, quota_file: str = 'quota.json'):
+        """
+        RequestScheduler의 생성자입니다.
+
+        Args:
+            client (ExchangeRateClient): 실제 요청을 보낼 API 클라이언트.
+            daily_limit (int, optional): 인증키당 하루 최대 요청 수. 기본값은 1000.
+            background_reserve (int, optional): 백그라운드 요청이 사용할 수 없는, 사용자 요청용 예비 할당량. 기본값은 100.
+            rate (float, optional): 초당 허용 요청 수. 기본값은 5.
+            burst (int, optional): 순간적으로 허용하는 최대 요청 수. 기본값은 5.
+            quota_file (str, optional): 할당량 사용 내역을 저장할 파일 경로. 기본값은 'quota.json'.
+        """
+        self.client = client # 실제 요청을 보낼 클라이언트
+        self.background_reserve = background_reserve # 사용자 요청용 예비 할당량
+        self._bucket = TokenBucket(rate, burst) # 초당 요청 수 제한
+        self._quota = DailyQuota(daily_limit, quota_file) # 일일 할당량 집계
+        self._lock = threading.Lock() # 버킷과 할당량 상태 보호용 락
+        self._pending: list = [] # (우선순위, 일련번호, searchdate, data, callback) 형태의 우선순위 대기열
+        self._sequence = itertools.count() # 같은 우선순위 안에서 요청 순서를 유지하기 위한 일련번호
+        self._pending_keys: set[tuple[str, str]] = set() # 대기열에 있는 (searchdate, data) (같은 요청 중복 방지)
+        self._listeners: list[Callable[[int, int], None]] = [] # 할당량 변경을 통지받을 콜백 목록
+
+    @property
+    def remaining(self) -> int:
+        """
+        오늘 남은 요청 수를 반환합니다.
+        """
+        with self._lock:
+            return self._quota.remaining
+
+    @property
+    def daily_limit(self) -> int:
+        """
+        하루 최대 요청 수를 반환합니다.
+        """
+        return self._quota.limit
+
+    @property
+    def pending_count(self) -> int:
+        """
+        대기열에 남아 있는 요청 수를 반환합니다.
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def add_listener(self, listener: Callable[[int, int], None]):
+        """
+        할당량이 변경될 때마다 (남은 요청 수, 일일 한도)로 호출될 콜백을 등록합니다.
+
+        Args:
+            listener (Callable[[int, int], None]): 등록할 콜백.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, remaining: int):
+        """
+        등록된 모든 콜백에 현재 할당량을 알립니다.
+        """
+        for listener in self._listeners:
+            listener(remaining, self._quota.limit)
+
+    def _admit(self, priority: RequestPriority):
+        """
+        요청을 보낼 수 있는지 확인하고, 보낼 수 있으면 토큰과 할당량을 차감합니다.
+        토큰이 부족하면 충전될 때까지 기다리고, 할당량이 부족하면 RequestDeferred 예외를 발생시킵니다.
+
+        Args:
+            priority (RequestPriority): 요청 우선순위.
+
+        Returns:
+            int: 차감 후 남은 할당량.
+        """
+        while True:
+            with self._lock:
+                remaining = self._quota.remaining
+                # 백그라운드 요청은 예비 할당량을 건드리지 않습니다.
+                floor = self.background_reserve if priority == RequestPriority.BACKGROUND else 0
+                if remaining <= floor:
+                    raise RequestDeferred(priority, remaining)
+                if self._bucket.try_acquire():
+                    self._quota.consume()
+                    return self._quota.remaining
+                wait = self._bucket.time_until_available()
+            time.sleep(wait) # 락을 놓은 상태에서 토큰이 충전될 때까지 대기
+
+    def get_exchange_rates(self, searchdate: str, data: str = "AP01",
+                           priority: RequestPriority = RequestPriority.INTERACTIVE) -> dict | None:
+        """
+        할당량과 요청 속도를 확인한 뒤 API 클라이언트를 통해 데이터를 요청합니다.
+
+        Args:
+            searchdate (str): 조회할 날짜 (YYYYMMDD 형식의 문자열).
+            data (str, optional): 요청할 데이터 종류. 기본값은 "AP01" (환율 정보).
+            priority (RequestPriority, optional): 요청 우선순위. 기본값은 INTERACTIVE.
+
+        Returns:
+            dict | None: API 클라이언트의 응답을 그대로 반환합니다.
+
+        Raises:
+            RequestDeferred: 남은 할당량이 부족하여 요청을 보내지 않은 경우.
+        """
+        remaining = self._admit(priority)
+        self._notify(remaining)
+        return self.client.get_exchange_rates(searchdate, data)
+
+    def schedule(self, searchdate: str, callback: Callable[[str, dict | None], None], data: str = "AP01",
+                 priority: RequestPriority = RequestPriority.BACKGROUND) -> bool:
+        """
+        요청을 대기열에 추가합니다. 대기열의 요청은 run_pending() 호출 시 우선순위 순으로 처리됩니다.
+        같은 날짜와 데이터 종류의 요청이 이미 대기 중이면(예: 이전 백필이 중단되어 남은 요청) 다시 추가하지 않습니다.
+
+        Args:
+            searchdate (str): 조회할 날짜 (YYYYMMDD 형식의 문자열).
+            callback (Callable[[str, dict | None], None]): (searchdate, 응답)으로 호출될 콜백.
+            data (str, optional): 요청할 데이터 종류. 기본값은 "AP01".
+            priority (RequestPriority, optional): 요청 우선순위. 기본값은 BACKGROUND.
+
+        Returns:
+            bool: 대기열에 새로 추가했으면 True, 이미 대기 중이면 False.
+        """
+        with self._lock:
+            if (searchdate, data) in self._pending_keys:
+                return False
+            self._pending_keys.add((searchdate, data))
+            heapq.heappush(self._pending, (priority, next(self._sequence), searchdate, data, callback))
+            return True
+
+    def run_pending(self, max_requests: int | None = None) -> int:
+        """
+        대기열의 요청을 우선순위 순으로 처리합니다.
+        할당량이 부족하여 요청이 보류되면 해당 요청을 대기열에 남겨두고 처리를 멈춥니다.
+
+        Args:
+            max_requests (int, optional): 이번 호출에서 처리할 최대 요청 수. 기본값은 None (제한 없음).
+
+        Returns:
+            int: 처리한 요청 수.
+        """
+        processed = 0
+        while max_requests is None or processed < max_requests:
+            with self._lock:
+                if not self._pending:
+                    break
+                job = heapq.heappop(self._pending)
+                priority, _, searchdate, data, callback = job
+                self._pending_keys.discard((searchdate, data))
+            try:
+                response = self.get_exchange_rates(searchdate, data, priority)
+            except RequestDeferred as e:
+                # 보류된 요청은 다음 기회(예: 다음 날 할당량 초기화 이후)에 다시 처리할 수 있도록 되돌려 놓습니다.
+                with self._lock:
+                    if (searchdate, data) not in self._pending_keys: # 그사이 같은 요청이 다시 추가되지 않았을 때만
+                        self._pending_keys.add((searchdate, data))
+                        heapq.heappush(self._pending, job)
+                print(e)
+                break
+            callback(searchdate, response)
+            processed += 1
+        return processed
@@ -9,15 +9,21 @@ from PySide6.QtWidgets import (
     QMainWindow,  # 메인 윈도우 클래스
     QWidget,      # 기본 위젯 클래스
     QVBoxLayout,  # 수직 레이아웃
-    QHBoxLayout   # 수평 레이아웃
+    QHBoxLayout,  # 수평 레이아웃
+    QTabWidget    # 탭 위젯 (환율/대출금리/국제금리 화면 전환)
 )
 
 # 프로젝트의 다른 부분에서 정의된 클래스들을 임포트합니다.
 from ui.data_view import DataViewWidget         # 환율 데이터를 표시하는 뷰 위젯
 from ui.control_panel import ControlPanelWidget # 통화 선택 및 제어 패널 위젯
+from ui.interest_rate_view import InterestRateViewWidget # 대출금리/국제금리를 표시하는 뷰 위젯
+from ui.portfolio_panel import PortfolioPanelWidget # 외화 보유 내역 평가를 표시하는 뷰 위젯
 from service.exchange_rate_service import ExchangeRateService # 환율 데이터를 가져오는 서비스
 from service.settings_manager import SettingsManager         # 애플리케이션 설정을 저장/로드하는 매니저
 from viewmodel.exchange_rate_viewmodel import ExchangeRateViewModel # 뷰와 모델을 연결하는 뷰모델
+from viewmodel.portfolio_viewmodel import PortfolioViewModel # 외화 보유 내역 평가 뷰모델
+from server.rate_server import RateServer # 다른 내부 프로그램에 환율을 제공하는 로컬 서버 (선택)
+from ui.stall_watchdog import StallWatchdog # GUI 이벤트 루프 멈춤 감시 (선택)
 
 from qt_material import apply_stylesheet
 
@@ -43,10 +49,27 @@ class MainWindow(QMainWindow):
             print("AUTH_KEY 환경 변수가 설정되지 않았습니다. .env 파일을 확인해주세요.")
             sys.exit(1)
 
-        self.exchange_service = ExchangeRateService(AUTH_KEY) # ExchangeRateService 인스턴스 생성
+        # API_BASE_URL을 지정하면 실제 API 대신 로컬 대역 서버(api/local_stub_server.py)로 요청합니다.
+        API_BASE_URL = os.getenv("API_BASE_URL")
+        DAILY_QUOTA = int(os.getenv("DAILY_QUOTA", "1000")) # 인증키당 일일 요청 한도
+        self.exchange_service = ExchangeRateService(AUTH_KEY, API_BASE_URL, DAILY_QUOTA) # ExchangeRateService 인스턴스 생성
         self.settings_manager = SettingsManager()             # SettingsManager 인스턴스 생성 (설정 저장/로드)
         # 2. ViewModel 초기화: View와 Service(Model) 사이의 중재자 역할
         self.exchange_viewmodel = ExchangeRateViewModel(self.exchange_service, self.settings_manager)
+        # 환율 새로고침마다 외화 보유 내역(PORTFOLIO_FILE, 기본값 portfolio.csv)을 원화로 다시 평가
+        self.portfolio_viewmodel = PortfolioViewModel(
+            self.exchange_service, self.exchange_viewmodel, os.getenv("PORTFOLIO_FILE", "portfolio.csv")
+        )
+
+        # 3. (선택) 로컬 환율 서버: RATE_SERVER_PORT가 설정된 경우에만 실행
+        #    다른 내부 프로그램이 API를 직접 호출하는 대신 이 애플리케이션의 캐시를 공유합니다.
+        self.rate_server = None
+        RATE_SERVER_PORT = os.getenv("RATE_SERVER_PORT")
+        if RATE_SERVER_PORT:
+            self.rate_server = RateServer(self.exchange_service, port=int(RATE_SERVER_PORT))
+            self.rate_server.start()
+            # 새로고침으로 환율이 갱신될 때마다 서버의 응답을 교체하고 WebSocket 구독자에게 전송
+            self.exchange_viewmodel.rates_refreshed.connect(lambda rates: self.rate_server.publish())
 
         # --- UI 컴포넌트 설정 ---
         self._create_menu_bar() # 메뉴바 생성
@@ -58,9 +81,20 @@ class MainWindow(QMainWindow):
         self.control_panel = ControlPanelWidget() # ControlPanelWidget 인스턴스 생성
         main_horizontal_layout.addWidget(self.control_panel) # 레이아웃에 추가
 
-        # 우측 데이터 뷰 위젯 생성 및 레이아웃에 추가
+        # 우측 데이터 뷰 위젯 생성 및 탭에 추가
         self.data_view = DataViewWidget(self.exchange_viewmodel) # DataViewWidget 인스턴스 생성 (뷰모델 전달)
-        main_horizontal_layout.addWidget(self.data_view) # 레이아웃에 추가
+        # 대출금리(AP02), 국제금리(AP03) 뷰 위젯 생성
+        self.loan_interest_view = InterestRateViewWidget("대출금리", ["금리 종류", "금리(%)"], ["sfln_intrc_nm", "int_r"])
+        self.international_interest_view = InterestRateViewWidget(
+            "국제금리", ["통화", "금리 종류", "금리(%)"], ["cur_fund", "sfln_intrc_nm", "int_r"]
+        )
+        self.tab_widget = QTabWidget() # 환율/금리 화면을 탭으로 전환
+        self.tab_widget.addTab(self.data_view, "환율")
+        self.tab_widget.addTab(self.loan_interest_view, "대출금리")
+        self.tab_widget.addTab(self.international_interest_view, "국제금리")
+        self.portfolio_panel = PortfolioPanelWidget(self.portfolio_viewmodel) # 외화 보유 내역 평가 패널
+        self.tab_widget.addTab(self.portfolio_panel, "포트폴리오")
+        main_horizontal_layout.addWidget(self.tab_widget) # 레이아웃에 추가
 
         # 중앙 위젯 설정: 생성된 레이아웃을 메인 윈도우의 중앙 위젯으로 설정
         central_widget = QWidget() # 빈 QWidget 생성
@@ -75,6 +109,10 @@ class MainWindow(QMainWindow):
         # ViewModel의 available_currencies_changed 시그널이 발생하면 ControlPanel의 populate_currencies 슬롯 호출
         self.exchange_viewmodel.available_currencies_changed.connect(self.control_panel.populate_currencies)
 
+        # ViewModel의 금리 데이터 변경 시그널이 발생하면 각 금리 뷰의 update_rates 슬롯 호출
+        self.exchange_viewmodel.loan_interest_rates_changed.connect(self.loan_interest_view.update_rates)
+        self.exchange_viewmodel.international_interest_rates_changed.connect(self.international_interest_view.update_rates)
+
         # ControlPanel의 visibility_changed 시그널이 발생하면 ViewModel의 set_currency_visibility 슬롯 호출
         self.control_panel.visibility_changed.connect(self.exchange_viewmodel.set_currency_visibility)
         # ControlPanel의 select_all_requested 시그널이 발생하면 ViewModel의 select_all_currencies 슬롯 호출
@@ -85,8 +123,15 @@ class MainWindow(QMainWindow):
         # DataViewWidget 내부에 있는 새로고침 버튼의 clicked 시그널을 ViewModel의 fetch_exchange_rates 슬롯에 연결
         self.data_view.refresh_button.clicked.connect(self.exchange_viewmodel.fetch_exchange_rates)
 
+        # 과거 이력 백필이 끝나면 상태 라벨에 결과 표시
+        self.exchange_viewmodel.history_updated.connect(
+            lambda added: self.data_view.status_label.setText(f"환율 이력 {added}일 추가 완료")
+        )
+
         # 애플리케이션 시작 시 초기 환율 정보 로드 요청
         self.exchange_viewmodel.fetch_exchange_rates()
+        # 이전 실행에서 저장한 환율을 먼저 표시한 경우에도 보유 내역 평가를 바로 보여줍니다.
+        self.portfolio_viewmodel.revalue(self.exchange_service.get_all_exchange_rates())
 
     def _create_menu_bar(self):
         """
@@ -95,11 +140,28 @@ class MainWindow(QMainWindow):
         menu_bar = self.menuBar() # 메인 윈도우의 메뉴바 객체 가져오기
         file_menu = menu_bar.addMenu("파일") # '파일' 메뉴 추가
 
+        # '과거 이력 가져오기' 액션 생성 및 메뉴에 추가 (분석에 사용할 최근 1년 이력을 백그라운드로 요청)
+        backfill_action = QAction("과거 이력 가져오기 (1년)", self)
+        backfill_action.triggered.connect(lambda: self.exchange_viewmodel.backfill_history(365))
+        file_menu.addAction(backfill_action)
+
         # '종료' 액션 생성 및 메뉴에 추가
         exit_action = QAction("종료", self) # '종료'라는 텍스트를 가진 QAction 생성
         exit_action.triggered.connect(self.close) # 액션이 트리거되면 윈도우 닫기 메서드 연결
         file_menu.addAction(exit_action) # '파일' 메뉴에 '종료' 액션 추가
 
+    def closeEvent(self, event):
+        """
+        메인 윈도우가 닫힐 때 호출됩니다. 뷰모델이 사용하는 자원을 정리합니다.
+
+        Args:
+            event (QCloseEvent): 닫기 이벤트 객체.
+        """
+        self.exchange_viewmodel.shutdown()
+        if self.rate_server is not None:
+            self.rate_server.stop()
+        super().closeEvent(event)
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -137,6 +199,14 @@ if __name__ == "__main__":
     else:
         print("기본 폰트 등록 실패")
 
+    # (선택) STALL_WATCHDOG_MS가 설정되면 그 시간 이상 이벤트 루프가 멈출 때마다 메인 스레드 스택을 기록하고,
+    # 종료 시 호출 위치별 멈춤 시간 보고서를 출력 및 저장합니다. (윈도우 생성 전에 시작하여 시작 과정도 기록)
+    STALL_WATCHDOG_MS = os.getenv("STALL_WATCHDOG_MS")
+    if STALL_WATCHDOG_MS:
+        stall_watchdog = StallWatchdog(threshold_ms=float(STALL_WATCHDOG_MS))
+        stall_watchdog.start()
+        app.aboutToQuit.connect(stall_watchdog.stop)
+
     # 메인 윈도우 실행
     window = MainWindow()
     window.show()
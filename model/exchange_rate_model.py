@@ -20,4 +20,20 @@ class ExchangeRate:
     ten_dd_efee_r: str   # 10일환가료율
     kftc_bkpr: str       # 서울외국환중개 장부가격
     kftc_deal_bas_r: str # 서울외국환중개 매매기준율
-    cur_nm: str          # 통화명 (예: 미국 달러, 일본 옌)
\ No newline at end of file
+    cur_nm: str          # 통화명 (예: 미국 달러, 일본 옌)
+
+
+def parse_rate(value: str) -> float:
+    """
+    API가 문자열로 내려주는 환율 값(예: "1,385.5")을 실수로 변환합니다.
+
+    Args:
+        value (str): 쉼표가 포함될 수 있는 환율 문자열.
+
+    Returns:
+        float: 변환된 값. 비어 있거나 숫자가 아니면 NaN을 반환합니다.
+    """
+    try:
+        return float(value.replace(',', ''))
+    except (AttributeError, ValueError):
+        return float('nan')
\ No newline at end of file
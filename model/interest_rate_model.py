@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+# dataclasses 모듈을 임포트합니다. 데이터 클래스를 쉽게 생성할 수 있도록 돕습니다.
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class LoanInterestRate:
+    """
+    대출금리 정보(AP02)를 담는 데이터 클래스입니다.
+    필드 수가 적고 날짜마다 많이 만들어지므로 __slots__를 사용해 메모리를 줄입니다.
+    """
+    result: int          # 결과 코드 (1: 성공, 4: 조회 결과 없음 등)
+    sfln_intrc_nm: str   # 금리 종류 (예: 대출금리명)
+    int_r: str           # 금리
+
+
+@dataclass(slots=True)
+class InternationalInterestRate:
+    """
+    국제금리 정보(AP03)를 담는 데이터 클래스입니다.
+    """
+    result: int          # 결과 코드 (1: 성공, 4: 조회 결과 없음 등)
+    cur_fund: str        # 통화 (예: USD, EUR)
+    sfln_intrc_nm: str   # 금리 종류 (예: LIBOR 3M)
+    int_r: str           # 금리
\ No newline at end of file
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import asyncio # 비동기 소켓 서버 구현을 위해 사용
+import base64 # WebSocket 핸드셰이크 응답 키 생성을 위해 사용
+import hashlib # WebSocket 핸드셰이크 응답 키 생성을 위해 사용
+import json # 응답 본문 직렬화를 위해 사용
+import re # 이력 조회 경로의 날짜 형식 확인을 위해 사용
+import struct # WebSocket 프레임 길이 필드 인코딩/디코딩을 위해 사용
+import threading # 서버 이벤트 루프를 UI 스레드와 분리된 스레드에서 실행하기 위해 사용
+from dataclasses import asdict # 데이터 모델을 딕셔너리로 변환하기 위해 사용
+
+from service.exchange_rate_service import ExchangeRateService # 캐시된 환율/금리 정보를 제공하는 서비스
+
+# RFC 6455에 정의된 WebSocket 핸드셰이크용 고정 GUID
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_HEADER_SIZE = 8192 # 요청 헤더 최대 크기 (바이트)
+MAX_WRITE_BUFFER = 1024 * 1024 # 구독자 송신 버퍼가 이 크기를 넘으면 느린 구독자로 보고 연결을 끊음
+HISTORY_DATE_PATTERN = re.compile(r"[0-9]{8}") # /history/<YYYYMMDD> 경로의 날짜 형식
+MAX_WEBSOCKET_FRAME = 64 * 1024 # 클라이언트 WebSocket 프레임 최대 크기 (바이트). 클라이언트는 ping/close만 보냄
+CLOSE_PROTOCOL_ERROR = 1002 # WebSocket 종료 코드: 프로토콜 위반 (마스크 없는 클라이언트 프레임)
+CLOSE_MESSAGE_TOO_BIG = 1009 # WebSocket 종료 코드: 프레임이 너무 큼
+
+
+def normalize_path(path: str) -> str:
+    """
+    요청 경로에서 쿼리 문자열과 끝의 '/'를 제거합니다. 예: "/ws/?x=1" → "/ws"
+    """
+    return path.split("?", 1)[0].rstrip("/") or "/"
+
+
+def build_http_response(status: str, body: bytes, content_type: str = "application/json; charset=utf-8") -> bytes:
+    """
+    상태 줄, 헤더, 본문을 포함한 완전한 HTTP/1.1 응답 바이트를 만듭니다.
+    응답은 미리 만들어 두고 요청마다 그대로 전송합니다.
+
+    Args:
+        status (str): 상태 줄 (예: "200 OK").
+        body (bytes): 응답 본문.
+        content_type (str, optional): Content-Type 헤더 값.
+
+    Returns:
+        bytes: 전송할 응답 바이트.
+    """
+    headers = (
+        f"HTTP/1.1 {status}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Cache-Control: no-cache\r\n"
+        "\r\n"
+    )
+    return headers.encode("ascii") + body
+
+
+def encode_websocket_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """
+    서버에서 클라이언트로 보내는 WebSocket 프레임(마스크 없음)을 만듭니다.
+
+    Args:
+        payload (bytes): 전송할 데이터.
+        opcode (int, optional): 프레임 종류. 기본값은 0x1 (텍스트).
+
+    Returns:
+        bytes: 인코딩된 프레임.
+    """
+    header = bytes([0x80 | opcode]) # FIN 비트 + opcode
+    length = len(payload)
+    if length < 126:
+        header += bytes([length])
+    elif length < 65536:
+        header += bytes([126]) + struct.pack("!H", length)
+    else:
+        header += bytes([127]) + struct.pack("!Q", length)
+    return header + payload
+
+
+def unmask_websocket_payload(payload: bytes, mask: bytes) -> bytes:
+    """
+    클라이언트 프레임의 마스크를 풉니다. 바이트 단위 반복 대신 정수 하나로 XOR합니다.
+
+    Args:
+        payload (bytes): 마스크된 데이터.
+        mask (bytes): 4바이트 마스크 키.
+
+    Returns:
+        bytes: 마스크를 푼 데이터.
+    """
+    length = len(payload)
+    if not length:
+        return payload
+    key = (mask * (length // 4 + 1))[:length] # 마스크 키를 데이터 길이만큼 반복
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+
+
+NOT_FOUND_RESPONSE = build_http_response("404 Not Found", b'{"error": "not found"}')
+BAD_REQUEST_RESPONSE = build_http_response("400 Bad Request", b'{"error": "bad request"}')
+NO_DATA_RESPONSE = build_http_response("503 Service Unavailable", b'{"error": "no data yet"}')
+
+
+class RateServer:
+    """
+    다른 내부 프로그램에 환율 정보를 제공하는 로컬 HTTP/WebSocket 서버입니다.
+    서비스에 캐시된 데이터만 제공하며 한국수출입은행 API를 직접 호출하지 않으므로 할당량을 쓰지 않습니다.
+    응답은 데이터가 갱신될 때 한 번만 직렬화해 두고, 요청마다 같은 바이트를 그대로 전송합니다.
+
+    제공 경로:
+        GET /rates            현재 환율 전체
+        GET /rates/<통화코드>  특정 통화의 현재 환율
+        GET /interest         현재 대출금리/국제금리
+        GET /history/<YYYYMMDD> 이력에 저장된 특정 날짜의 환율
+        GET /ws               WebSocket. 연결 즉시 현재 환율을 보내고, 갱신될 때마다 새 환율을 전송
+    """
+    def __init__(self, service: ExchangeRateService, host: str = "127.0.0.1", port: int = 8766):
+        """
+        RateServer의 생성자입니다.
+
+        Args:
+            service (ExchangeRateService): 캐시된 환율/금리 정보를 제공하는 서비스.
+            host (str, optional): 바인딩할 주소. 기본값은 "127.0.0.1" (로컬 전용).
+            port (int, optional): 바인딩할 포트. 기본값은 8766. 0이면 임의의 빈 포트.
+        """
+        self._service = service # 데이터 제공 서비스
+        self.host = host # 바인딩 주소
+        self.port = port # 바인딩 포트 (start() 이후 실제 포트로 갱신)
+        self._loop: asyncio.AbstractEventLoop | None = None # 서버 전용 이벤트 루프
+        self._server: asyncio.base_events.Server | None = None # asyncio 서버 객체
+        self._thread: threading.Thread | None = None # 이벤트 루프 실행 스레드
+        self._responses: dict[str, bytes] = {} # 경로 → 미리 직렬화된 HTTP 응답
+        self._snapshot_frame: bytes | None = None # 현재 환율을 담은 WebSocket 프레임
+        self._history_responses: dict[str, bytes] = {} # 날짜 → 미리 직렬화된 이력 응답 (요청 시 채움)
+        self._history_version = -1 # 이력 응답 캐시를 만든 시점의 이력 버전
+        self._subscribers: set[asyncio.StreamWriter] = set() # WebSocket 구독자
+
+    def start(self):
+        """
+        별도 스레드에서 이벤트 루프를 만들고 서버를 시작합니다. 서버가 포트를 열 때까지 기다립니다.
+        """
+        ready = threading.Event()
+        errors: list[BaseException] = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._server = self._loop.run_until_complete(
+                    asyncio.start_server(self._handle_connection, self.host, self.port, limit=MAX_HEADER_SIZE)
+                )
+                self.port = self._server.sockets[0].getsockname()[1] # 임의 포트를 지정한 경우 실제 포트 반영
+            except OSError as e:
+                errors.append(e)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="rate-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        self.publish() # 서비스에 이미 있는 데이터로 응답을 준비
+        print(f"환율 서버 실행 중: http://{self.host}:{self.port}/rates, ws://{self.host}:{self.port}/ws")
+
+    def stop(self):
+        """
+        서버와 이벤트 루프를 종료합니다.
+        """
+        if self._loop is None:
+            return
+
+        async def shutdown():
+            self._server.close()
+            self._subscribers.clear()
+            # keep-alive 및 WebSocket 연결을 처리 중인 작업을 모두 취소하고 끝날 때까지 기다립니다.
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+
+    def publish(self):
+        """
+        서비스의 현재 데이터를 직렬화하여 응답을 교체하고, WebSocket 구독자에게 새 환율을 전송합니다.
+        어느 스레드에서 호출해도 됩니다. 직렬화는 호출한 스레드에서 하고, 교체와 전송만 서버 루프에서 수행합니다.
+        """
+        date = self._service.exchange_rates_date
+        rates = self._service.get_all_exchange_rates()
+        responses: dict[str, bytes] = {}
+        frame = None
+        if rates:
+            snapshot = json.dumps(
+                {"date": date, "rates": [asdict(rate) for rate in rates]}, ensure_ascii=False
+            ).encode("utf-8")
+            responses["/rates"] = build_http_response("200 OK", snapshot)
+            frame = encode_websocket_frame(snapshot)
+            for rate in rates:
+                body = json.dumps({"date": date, "rate": asdict(rate)}, ensure_ascii=False).encode("utf-8")
+                responses[f"/rates/{rate.cur_unit}"] = build_http_response("200 OK", body)
+        interest = json.dumps({
+            "loan_interest_rates": [asdict(rate) for rate in self._service.get_loan_interest_rates()],
+            "international_interest_rates": [asdict(rate) for rate in self._service.get_international_interest_rates()],
+        }, ensure_ascii=False).encode("utf-8")
+        responses["/interest"] = build_http_response("200 OK", interest)
+
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._apply, responses, frame)
+
+    def _apply(self, responses: dict[str, bytes], frame: bytes | None):
+        """
+        서버 루프에서 미리 만든 응답을 교체하고 구독자에게 프레임을 전송합니다.
+        """
+        self._responses = responses
+        if frame is None or frame == self._snapshot_frame:
+            return # 내용이 바뀌지 않았으면 구독자에게 다시 보내지 않음
+        self._snapshot_frame = frame
+        for writer in list(self._subscribers):
+            self._send_frame(writer, frame)
+
+    def _send_frame(self, writer: asyncio.StreamWriter, frame: bytes):
+        """
+        구독자에게 프레임을 보냅니다. 송신 버퍼가 너무 쌓인 느린 구독자는 연결을 끊습니다.
+        """
+        if writer.transport.is_closing() or writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self._subscribers.discard(writer)
+            writer.close()
+            return
+        writer.write(frame)
+
+    def _history_response(self, date: str) -> bytes:
+        """
+        이력에 저장된 날짜의 응답을 반환합니다. 처음 요청될 때 직렬화하고, 이력이 바뀌면 캐시를 비웁니다.
+        이력 락을 기다릴 수 있으므로 스레드 풀에서 호출됩니다.
+        """
+        history = self._service.history
+        if history.version != self._history_version:
+            self._history_responses.clear()
+            self._history_version = history.version
+        response = self._history_responses.get(date)
+        if response is None:
+            rates = history.get_day(date)
+            if not rates:
+                return NOT_FOUND_RESPONSE
+            body = json.dumps({"date": date, "rates": [asdict(rate) for rate in rates]}, ensure_ascii=False)
+            response = build_http_response("200 OK", body.encode("utf-8"))
+            self._history_responses[date] = response
+        return response
+
+    async def _route(self, path: str) -> bytes:
+        """
+        요청 경로에 해당하는 미리 만든 응답을 반환합니다.
+        캐시되지 않은 이력 조회는 저장 중인 이력의 락을 기다릴 수 있으므로 이벤트 루프가 아닌 스레드 풀에서 실행합니다.
+        """
+        path = normalize_path(path)
+        response = self._responses.get(path)
+        if response is not None:
+            return response
+        if path == "/rates":
+            return NO_DATA_RESPONSE
+        if path.startswith("/history/"):
+            date = path[len("/history/"):]
+            if not HISTORY_DATE_PATTERN.fullmatch(date): # 날짜 형식이 아니면 이력을 조회하지 않음
+                return BAD_REQUEST_RESPONSE
+            response = self._history_responses.get(date)
+            if response is not None and self._history_version == self._service.history.version:
+                return response # 이미 직렬화한 응답은 락 없이 바로 반환
+            return await asyncio.get_running_loop().run_in_executor(None, self._history_response, date)
+        return NOT_FOUND_RESPONSE
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        클라이언트 연결 하나를 처리합니다. HTTP keep-alive로 여러 요청을 이어서 처리하고,
+        WebSocket 업그레이드 요청이면 구독자로 등록합니다.
+        """
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                parts = lines[0].split(" ")
+                if len(parts) != 3:
+                    writer.write(BAD_REQUEST_RESPONSE)
+                    break
+                method, path, version = parts
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                if normalize_path(path) == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                    await self._serve_websocket(reader, writer, headers)
+                    return
+                if method != "GET":
+                    writer.write(BAD_REQUEST_RESPONSE)
+                    break
+
+                writer.write(await self._route(path))
+                # 송신 버퍼가 많이 쌓였을 때만 기다려 대부분의 요청은 추가 대기 없이 처리합니다.
+                if writer.transport.get_write_buffer_size() > 64 * 1024:
+                    await writer.drain()
+                connection = headers.get("connection", "").lower()
+                if connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive"):
+                    break
+            await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass # 클라이언트가 연결을 끊었거나 서버 종료로 작업이 취소된 경우
+        finally:
+            writer.close()
+
+    async def _serve_websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, headers: dict):
+        """
+        WebSocket 핸드셰이크를 수행하고, 연결이 끊길 때까지 클라이언트 프레임(ping/close)을 처리합니다.
+        """
+        key = headers.get("sec-websocket-key")
+        if not key:
+            writer.write(BAD_REQUEST_RESPONSE)
+            return
+        accept = base64.b64encode(hashlib.sha1(key.encode("ascii") + WEBSOCKET_GUID).digest()).decode("ascii")
+        writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n"
+            "\r\n"
+        ).encode("ascii"))
+        self._subscribers.add(writer)
+        if self._snapshot_frame is not None:
+            writer.write(self._snapshot_frame) # 연결 즉시 현재 환율 전송
+        try:
+            while True:
+                first, second = await reader.readexactly(2)
+                opcode = first & 0x0F
+                length = second & 0x7F
+                if length == 126:
+                    length = struct.unpack("!H", await reader.readexactly(2))[0]
+                elif length == 127:
+                    length = struct.unpack("!Q", await reader.readexactly(8))[0]
+                if not second & 0x80: # RFC 6455: 클라이언트 프레임은 반드시 마스크되어야 함
+                    writer.write(encode_websocket_frame(struct.pack("!H", CLOSE_PROTOCOL_ERROR), opcode=0x8))
+                    break
+                if length > MAX_WEBSOCKET_FRAME: # 본문을 읽기 전에 거절하여 큰 프레임을 메모리에 올리지 않음
+                    writer.write(encode_websocket_frame(struct.pack("!H", CLOSE_MESSAGE_TOO_BIG), opcode=0x8))
+                    break
+                mask = await reader.readexactly(4)
+                payload = unmask_websocket_payload(await reader.readexactly(length), mask)
+                if opcode == 0x8: # close
+                    writer.write(encode_websocket_frame(payload[:2], opcode=0x8))
+                    break
+                if opcode == 0x9: # ping
+                    writer.write(encode_websocket_frame(payload, opcode=0xA))
+                # 그 밖의 클라이언트 메시지는 사용하지 않으므로 무시합니다.
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._subscribers.discard(writer)
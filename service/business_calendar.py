@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import datetime # 날짜 계산을 위해 사용
+import json # 사용자 휴일/영업일 파일을 읽기 위해 사용
+import os # 파일 존재 여부 확인을 위해 사용
+
+from api.request_scheduler import KST # 한국 표준시 (API 고시 시각 기준)
+
+PUBLICATION_TIME = datetime.time(11, 0) # 한국수출입은행이 당일 환율을 고시하는 시각 (KST)
+
+# 매년 같은 날짜인 양력 공휴일 (월, 일, 이름)
+SOLAR_HOLIDAYS = [
+    (1, 1, "신정"), (3, 1, "삼일절"), (5, 1, "근로자의 날"), (5, 5, "어린이날"), (6, 6, "현충일"),
+    (8, 15, "광복절"), (10, 3, "개천절"), (10, 9, "한글날"), (12, 25, "성탄절"),
+]
+
+# 음력 공휴일의 양력 날짜 (연도 → (설날, 부처님 오신 날, 추석)). 설날과 추석은 전날과 다음 날도 휴일입니다.
+LUNAR_HOLIDAYS = {
+    2015: ((2, 19), (5, 25), (9, 27)),
+    2016: ((2, 8), (5, 14), (9, 15)),
+    2017: ((1, 28), (5, 3), (10, 4)),
+    2018: ((2, 16), (5, 22), (9, 24)),
+    2019: ((2, 5), (5, 12), (9, 13)),
+    2020: ((1, 25), (4, 30), (10, 1)),
+    2021: ((2, 12), (5, 19), (9, 21)),
+    2022: ((2, 1), (5, 8), (9, 10)),
+    2023: ((1, 22), (5, 27), (9, 29)),
+    2024: ((2, 10), (5, 15), (9, 17)),
+    2025: ((1, 29), (5, 5), (10, 6)),
+    2026: ((2, 17), (5, 24), (9, 25)),
+    2027: ((2, 7), (5, 13), (9, 15)),
+    2028: ((1, 27), (5, 2), (10, 3)),
+    2029: ((2, 13), (5, 20), (9, 22)),
+    2030: ((2, 3), (5, 9), (9, 12)),
+}
+
+# 선거일 및 임시공휴일 (YYYYMMDD → 이름)
+SPECIAL_HOLIDAYS = {
+    "20150814": "임시공휴일",
+    "20160413": "국회의원 선거",
+    "20160506": "임시공휴일",
+    "20170509": "대통령 선거",
+    "20171002": "임시공휴일",
+    "20180613": "지방선거",
+    "20200415": "국회의원 선거",
+    "20200817": "임시공휴일",
+    "20220309": "대통령 선거",
+    "20220601": "지방선거",
+    "20231002": "임시공휴일",
+    "20240410": "국회의원 선거",
+    "20241001": "임시공휴일",
+    "20250127": "임시공휴일",
+    "20250603": "대통령 선거",
+    "20260603": "지방선거",
+}
+
+# 대체공휴일 적용 시작일 (이름 → 시작일). 설날/추석은 일요일과 겹치거나 다른 공휴일과 겹칠 때,
+# 나머지는 토요일/일요일과 겹치거나 다른 공휴일과 겹칠 때 다음 평일을 대체공휴일로 지정합니다.
+SUBSTITUTE_RULES = {
+    "설날": datetime.date(2014, 1, 1),
+    "추석": datetime.date(2014, 1, 1),
+    "어린이날": datetime.date(2014, 1, 1),
+    "삼일절": datetime.date(2021, 8, 4),
+    "광복절": datetime.date(2021, 8, 4),
+    "개천절": datetime.date(2021, 8, 4),
+    "한글날": datetime.date(2021, 8, 4),
+    "부처님 오신 날": datetime.date(2023, 5, 4),
+    "성탄절": datetime.date(2023, 5, 4),
+}
+LUNAR_PERIODS = ("설날", "추석") # 전날/당일/다음 날 3일 연휴인 명절
+
+
+def to_date(value) -> datetime.date:
+    """
+    YYYYMMDD 문자열 또는 date 객체를 date 객체로 변환합니다.
+    """
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.datetime.strptime(str(value), "%Y%m%d").date()
+
+
+class BusinessCalendar:
+    """
+    한국 은행 영업일 달력입니다. 주말, 양력/음력 공휴일, 대체공휴일, 선거일 및 임시공휴일, 근로자의 날을 휴일로 봅니다.
+    내장 목록에 없는 휴일이나 영업일은 로컬 파일로 추가할 수 있습니다.
+    한국수출입은행 API는 영업일에만 환율을 고시하므로, 데이터가 없는 날짜에 요청을 보내지 않는 데 사용합니다.
+    """
+    def __init__(self, file_path: str | None = 'holidays.json'):
+        """
+        BusinessCalendar의 생성자입니다.
+
+        Args:
+            file_path (str, optional): 추가 휴일/영업일 파일 경로. 기본값은 'holidays.json'.
+                                       형식: {"holidays": {"YYYYMMDD": "이름", ...}, "workdays": ["YYYYMMDD", ...]}
+        """
+        self.file_path = file_path # 추가 휴일/영업일 파일 경로
+        self._years: dict[int, dict[datetime.date, str]] = {} # 연도 → (휴일 → 이름) 캐시
+        self._extra_holidays: dict[datetime.date, str] = {} # 파일에서 추가한 휴일
+        self._workdays: set[datetime.date] = set() # 파일에서 영업일로 지정한 날짜 (휴일 목록보다 우선)
+        self._load()
+
+    def _load(self):
+        """
+        추가 휴일/영업일 파일을 불러옵니다. 파일이 없으면 내장 목록만 사용합니다.
+        """
+        if not self.file_path or not os.path.exists(self.file_path):
+            return
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            self._extra_holidays = {to_date(date): name for date, name in saved.get("holidays", {}).items()}
+            self._workdays = {to_date(date) for date in saved.get("workdays", [])}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"휴일 파일을 읽는 중 오류 발생: {e}. 내장 휴일 목록만 사용합니다.")
+
+    def holidays(self, year: int) -> dict[datetime.date, str]:
+        """
+        특정 연도의 휴일(주말 제외)과 이름을 반환합니다.
+
+        Args:
+            year (int): 연도.
+
+        Returns:
+            dict[datetime.date, str]: 휴일 → 이름. 음력 공휴일은 LUNAR_HOLIDAYS에 있는 연도만 포함됩니다.
+        """
+        holidays = self._years.get(year)
+        if holidays is None:
+            holidays = self._build_year(year)
+            self._years[year] = holidays
+        result = dict(holidays)
+        result.update({date: name for date, name in self._extra_holidays.items() if date.year == year})
+        for date in self._workdays:
+            result.pop(date, None)
+        return result
+
+    def _build_year(self, year: int) -> dict[datetime.date, str]:
+        """
+        내장 목록과 대체공휴일 규칙으로 특정 연도의 휴일을 계산합니다.
+        """
+        names: dict[datetime.date, list[str]] = {} # 날짜 → 그날의 공휴일 이름들 (겹침 판단용)
+        periods: dict[str, list[datetime.date]] = {} # 설날/추석 → 연휴 날짜들
+
+        def add(date: datetime.date, name: str):
+            names.setdefault(date, []).append(name)
+
+        for month, day, name in SOLAR_HOLIDAYS:
+            add(datetime.date(year, month, day), name)
+        if year in LUNAR_HOLIDAYS:
+            seollal, buddha, chuseok = LUNAR_HOLIDAYS[year]
+            add(datetime.date(year, *buddha), "부처님 오신 날")
+            for name, (month, day) in (("설날", seollal), ("추석", chuseok)):
+                center = datetime.date(year, month, day)
+                periods[name] = [center + datetime.timedelta(days=offset) for offset in (-1, 0, 1)]
+                for date in periods[name]:
+                    add(date, name)
+        for date_str, name in SPECIAL_HOLIDAYS.items():
+            date = to_date(date_str)
+            if date.year == year:
+                add(date, name)
+
+        holidays = {date: "·".join(day_names) for date, day_names in names.items()}
+
+        # 대체공휴일: 날짜 순으로 겹침을 확인하여, 겹친 날마다 하나씩 다음 평일(휴일 아님)에 지정합니다.
+        for date in sorted(names):
+            day_names = names[date]
+            eligible = [name for name in day_names if name in SUBSTITUTE_RULES and date >= SUBSTITUTE_RULES[name]]
+            if not eligible:
+                continue
+            lunar = [name for name in eligible if name in LUNAR_PERIODS]
+            weekend_hit = any(
+                date.weekday() == 6 if name in LUNAR_PERIODS else date.weekday() >= 5 for name in eligible
+            )
+            if not weekend_hit and len(day_names) < 2:
+                continue
+            # 설날/추석은 연휴가 끝난 다음 날부터, 나머지는 그날 다음부터 찾습니다.
+            anchor = max(periods[name][-1] for name in lunar) if lunar else date
+            candidate = anchor + datetime.timedelta(days=1)
+            while candidate.weekday() >= 5 or candidate in holidays:
+                candidate += datetime.timedelta(days=1)
+            holidays[candidate] = f"대체공휴일({eligible[0]})"
+        return holidays
+
+    def is_holiday(self, date) -> bool:
+        """
+        주말이 아닌 휴일인지 반환합니다.
+        """
+        date = to_date(date)
+        return date in self.holidays(date.year)
+
+    def is_business_day(self, date) -> bool:
+        """
+        영업일(환율이 고시되는 날)인지 반환합니다.
+
+        Args:
+            date: 날짜 (YYYYMMDD 문자열 또는 date 객체).
+        """
+        date = to_date(date)
+        if date in self._workdays:
+            return True
+        return date.weekday() < 5 and not self.is_holiday(date)
+
+    def previous_business_day(self, date) -> datetime.date:
+        """
+        지정한 날짜 이전(포함)의 가장 최근 영업일을 반환합니다.
+        """
+        date = to_date(date)
+        while not self.is_business_day(date):
+            date -= datetime.timedelta(days=1)
+        return date
+
+    def business_days(self, start, end) -> list[datetime.date]:
+        """
+        두 날짜 사이(양 끝 포함)의 영업일을 오름차순으로 반환합니다. 기간 백필에서 요청할 날짜 목록으로 사용합니다.
+
+        Args:
+            start: 시작 날짜 (YYYYMMDD 문자열 또는 date 객체).
+            end: 끝 날짜 (YYYYMMDD 문자열 또는 date 객체).
+
+        Returns:
+            list[datetime.date]: 영업일 리스트.
+        """
+        day, end = to_date(start), to_date(end)
+        days = []
+        while day <= end:
+            if self.is_business_day(day):
+                days.append(day)
+            day += datetime.timedelta(days=1)
+        return days
+
+    @staticmethod
+    def now() -> datetime.datetime:
+        """
+        현재 한국 표준시(KST) 시각을 반환합니다.
+        """
+        return datetime.datetime.now(KST)
+
+    def today(self) -> datetime.date:
+        """
+        오늘 날짜(KST)를 반환합니다.
+        """
+        return self.now().date()
+
+    def latest_publication_day(self, now: datetime.datetime | None = None) -> datetime.date:
+        """
+        지금 조회할 수 있는 가장 최근 환율 고시일을 반환합니다.
+        오늘이 영업일이고 고시 시각(11시 KST)이 지났으면 오늘, 아니면 직전 영업일입니다.
+
+        Args:
+            now (datetime.datetime, optional): 기준 시각. 기본값은 None (현재 KST 시각).
+
+        Returns:
+            datetime.date: 환율 고시일.
+        """
+        now = (now or self.now()).astimezone(KST)
+        today = now.date()
+        if self.is_business_day(today) and now.time() >= PUBLICATION_TIME:
+            return today
+        return self.previous_business_day(today - datetime.timedelta(days=1))
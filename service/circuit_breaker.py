@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import threading # 여러 요청 스레드에서 동시에 상태를 바꿀 때 보호하기 위해 사용
+import time # 차단 해제 대기 시간 계산을 위해 사용
+from enum import Enum # 차단기 상태 정의를 위해 사용
+
+
+class BreakerState(Enum):
+    """
+    서킷 브레이커의 상태를 정의하는 열거형입니다.
+    """
+    CLOSED = "정상"      # 요청을 그대로 보냄
+    OPEN = "차단"        # 연속 실패로 요청을 보내지 않음
+    HALF_OPEN = "확인 중" # 대기 시간이 지나 시험 요청 하나만 보냄
+
+
+class CircuitOpenError(Exception):
+    """
+    서킷 브레이커가 열려 있어 요청을 보내지 않았을 때 발생하는 예외입니다.
+    """
+    def __init__(self, retry_in: float):
+        if retry_in > 0:
+            message = f"API 서버 응답 실패가 계속되어 요청을 잠시 중단합니다. ({retry_in:.0f}초 후 다시 시도)"
+        else:
+            message = "다른 요청이 API 서버 복구 여부를 확인하는 중입니다. 잠시 후 다시 시도하세요."
+        super().__init__(message)
+        self.retry_in = retry_in # 다시 시도할 수 있을 때까지 남은 시간(초)
+
+
+class CircuitBreaker:
+    """
+    계속 실패하는 API 서버에 요청을 반복하지 않도록 막는 서킷 브레이커입니다.
+    연속 실패가 기준 횟수에 도달하면 차단(OPEN)하고, 대기 시간이 지나면 시험 요청 하나로 복구 여부를 확인합니다.
+    """
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 30.0):
+        """
+        CircuitBreaker의 생성자입니다.
+
+        Args:
+            failure_threshold (int, optional): 차단할 연속 실패 횟수. 기본값은 3.
+            cooldown (float, optional): 차단 후 시험 요청을 보내기까지 기다릴 시간(초). 기본값은 30초.
+        """
+        self.failure_threshold = failure_threshold # 차단 기준 연속 실패 횟수
+        self.cooldown = cooldown # 차단 유지 시간
+        self._state = BreakerState.CLOSED # 현재 상태
+        self._failures = 0 # 연속 실패 횟수
+        self._opened_at = 0.0 # 차단된 시각 (time.monotonic 기준)
+        self._probing = False # 시험 요청이 진행 중인지 여부
+        self._lock = threading.Lock() # 상태 보호용 락
+        self._probe_done = threading.Condition(self._lock) # 시험 요청이 끝났을 때 기다리던 스레드를 깨움
+
+    @property
+    def state(self) -> BreakerState:
+        """
+        현재 상태를 반환합니다. 차단 대기 시간이 지났으면 HALF_OPEN으로 표시합니다.
+        """
+        with self._lock:
+            if self._state == BreakerState.OPEN and self._retry_in() <= 0:
+                return BreakerState.HALF_OPEN
+            return self._state
+
+    def retry_in(self) -> float:
+        """
+        차단 중이면 시험 요청을 보낼 수 있을 때까지 남은 시간(초)을, 아니면 0을 반환합니다.
+        """
+        with self._lock:
+            return self._retry_in() if self._state == BreakerState.OPEN else 0.0
+
+    def _retry_in(self) -> float:
+        return max(0.0, self._opened_at + self.cooldown - time.monotonic())
+
+    def before_request(self, wait: float = 0.0):
+        """
+        요청을 보내기 전에 호출합니다. 차단 중이면 예외를 발생시킵니다.
+
+        Args:
+            wait (float, optional): 다른 스레드의 시험 요청이 진행 중일 때 그 결과를 기다릴 최대 시간(초).
+                                    시험 요청이 성공하면 바로 요청을 보내고, 실패하면 남은 차단 시간과 함께 예외가 발생합니다.
+                                    기본값은 0 (기다리지 않음).
+
+        Raises:
+            CircuitOpenError: 차단 중이거나, 다른 시험 요청이 기다리는 시간 안에 끝나지 않은 경우.
+        """
+        deadline = time.monotonic() + wait
+        with self._lock:
+            while self._probing and self._state == BreakerState.HALF_OPEN:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._probe_done.wait(remaining)
+            if self._state == BreakerState.CLOSED:
+                return
+            if self._state == BreakerState.OPEN:
+                if self._retry_in() > 0:
+                    raise CircuitOpenError(self._retry_in())
+                self._state = BreakerState.HALF_OPEN # 대기 시간이 지나 시험 요청 허용
+            if self._probing:
+                raise CircuitOpenError(0.0) # 시험 요청은 하나만 보냄
+            self._probing = True
+
+    def cancel_request(self):
+        """
+        before_request() 이후 실제로 요청을 보내지 않았을 때(예: 할당량 부족) 호출합니다. 상태는 바뀌지 않습니다.
+        """
+        with self._lock:
+            self._probing = False
+            self._probe_done.notify_all()
+
+    def record_success(self):
+        """
+        요청이 성공했음을 기록합니다. 차단 상태가 해제됩니다.
+        """
+        with self._lock:
+            self._state = BreakerState.CLOSED
+            self._failures = 0
+            self._probing = False
+            self._probe_done.notify_all()
+
+    def record_failure(self):
+        """
+        요청이 실패했음을 기록합니다. 연속 실패가 기준 횟수에 도달하거나 시험 요청이 실패하면 차단합니다.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._state == BreakerState.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = BreakerState.OPEN
+                self._opened_at = time.monotonic()
+            self._probing = False
+            self._probe_done.notify_all()
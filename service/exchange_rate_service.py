@@ -2,8 +2,24 @@
 
 # 필요한 모듈들을 임포트합니다.
 from api.client import ExchangeRateClient # API 통신을 위한 클라이언트
+from api.request_scheduler import RequestScheduler, RequestPriority, RequestDeferred # API 할당량 및 요청 속도 관리
 from model.exchange_rate_model import ExchangeRate # 환율 데이터 모델
+from model.interest_rate_model import LoanInterestRate, InternationalInterestRate # 대출금리/국제금리 데이터 모델
+from service.rate_history import RateHistory # 날짜별 환율 이력 저장소
+from service.rate_date_index import RateDateIndex # 저장된 날짜의 기준일 조회 색인
+from service.circuit_breaker import CircuitBreaker, CircuitOpenError # 계속 실패하는 API 서버 요청 차단
+from service.business_calendar import BusinessCalendar # 환율 고시일(은행 영업일) 달력
+from concurrent.futures import ThreadPoolExecutor # 여러 데이터 종류를 동시에 요청하기 위해 사용
 import datetime # 날짜 및 시간 관련 기능
+import time # 마지막으로 환율을 가져온 시각 기록을 위해 사용
+
+# 한국수출입은행 API의 데이터 종류 코드
+DATA_EXCHANGE_RATE = "AP01"          # 환율
+DATA_LOAN_INTEREST = "AP02"          # 대출금리
+DATA_INTERNATIONAL_INTEREST = "AP03" # 국제금리
+
+# 다른 스레드의 서킷 브레이커 시험 요청 결과를 기다릴 최대 시간(초) (API 클라이언트 기본 타임아웃 10초 + 여유)
+PROBE_WAIT = 15.0
 
 
 class ExchangeRateService:
@@ -12,81 +28,437 @@ class ExchangeRateService:
     API 클라이언트를 통해 데이터를 가져오고, 필요한 경우 데이터 파싱 및 재시도 로직을 포함합니다.
     MVVM 아키텍처에서 Model의 일부 역할을 담당합니다.
     """
-    def __init__(self, authkey: str):
+    def __init__(self, authkey: str, base_url: str | None = None, daily_quota: int = 1000,
+                 data_types: tuple[str, ...] = (DATA_EXCHANGE_RATE, DATA_LOAN_INTEREST, DATA_INTERNATIONAL_INTEREST),
+                 cache_ttl: float = 600.0):
         """
         ExchangeRateService의 생성자입니다.
 
         Args:
             authkey (str): 한국수출입은행 API 인증키.
+            base_url (str, optional): API 요청 URL. 기본값은 None (실제 한국수출입은행 API).
+            daily_quota (int, optional): 인증키당 하루 최대 요청 수. 기본값은 1000.
+            data_types (tuple[str, ...], optional): 새로고침 시 함께 요청할 데이터 종류. 환율(AP01)은 항상 포함됩니다.
+                                                    기본값은 환율, 대출금리, 국제금리 모두.
+            cache_ttl (float, optional): 마지막으로 가져온 환율을 최신으로 간주하는 시간(초). 기본값은 600초.
         """
-        self.client = ExchangeRateClient(authkey) # API 클라이언트 인스턴스 생성
+        self.client = ExchangeRateClient(authkey, base_url) # API 클라이언트 인스턴스 생성
+        # 모든 API 요청은 스케줄러를 거쳐 일일 할당량과 요청 속도를 관리합니다.
+        self.scheduler = RequestScheduler(self.client, daily_limit=daily_quota)
+        # 환율(AP01)은 항상 요청하고, 나머지 데이터 종류는 설정에 따라 함께 요청합니다.
+        self.data_types = (DATA_EXCHANGE_RATE,) + tuple(t for t in data_types if t != DATA_EXCHANGE_RATE)
+        # 데이터 종류별 요청을 동시에 보내 새로고침 지연 시간이 데이터 종류 수에 비례해 늘어나지 않도록 합니다.
+        self._executor = ThreadPoolExecutor(max_workers=len(self.data_types), thread_name_prefix="exim-fetch")
         self.exchange_rates: list[ExchangeRate] = [] # 가져온 환율 정보를 저장할 리스트
+        self.exchange_rates_date: str | None = None # 현재 환율 정보의 기준 날짜 (YYYYMMDD)
+        self.loan_interest_rates: list[LoanInterestRate] = [] # 가져온 대출금리 정보를 저장할 리스트
+        self.international_interest_rates: list[InternationalInterestRate] = [] # 가져온 국제금리 정보를 저장할 리스트
+        self.history = RateHistory() # 날짜별 환율 이력 (분석 및 과거 데이터 조회에 사용)
+        # 저장된 날짜 색인과 데이터가 없다고 확인된 날짜 (과거 날짜 조회 시 네트워크 탐색을 줄이기 위해 사용)
+        self.date_index = RateDateIndex(self.history)
+        # 주말과 공휴일에는 환율이 고시되지 않으므로, 영업일 달력으로 요청할 날짜를 미리 고릅니다.
+        self.calendar = BusinessCalendar()
+        self.breaker = CircuitBreaker() # API 서버가 계속 실패하면 잠시 요청을 중단
+        self.cache_ttl = cache_ttl # 마지막으로 가져온 환율을 최신으로 간주하는 시간(초)
+        self._fetched_at: float | None = None # 마지막으로 API에서 환율을 가져온 시각 (time.monotonic 기준)
+        # 이전 실행에서 저장한 가장 최근 환율로 캐시를 채워 둡니다. (API에서 다시 확인하기 전까지는 오래된 데이터로 취급)
+        latest = self.date_index.as_of(self.calendar.today().strftime("%Y%m%d"))
+        if latest is not None:
+            self.exchange_rates = self.history.get_day(latest)
+            self.exchange_rates_date = latest
 
-    def fetch_exchange_rates(self, searchdate: str = None) -> list[ExchangeRate]:
+    def fetch_exchange_rates(self, searchdate: str = None,
+                             priority: RequestPriority = RequestPriority.INTERACTIVE,
+                             probe_wait: float = 0.0) -> list[ExchangeRate]:
         """
         지정된 날짜 또는 현재 날짜의 환율 정보를 API로부터 가져옵니다.
-        데이터를 성공적으로 가져올 때까지 최대 7일까지 이전 날짜를 재시도합니다.
+        주말, 공휴일, 고시 시각(11시 KST) 전의 오늘은 요청하지 않고 가장 최근 고시일부터 조회하며,
+        데이터를 성공적으로 가져올 때까지 최대 7 영업일까지 이전 영업일을 재시도합니다.
+        과거 날짜는 이력에 저장된 날짜와 데이터가 없다고 확인된 날짜를 먼저 확인하여, 필요한 경우에만 요청합니다.
+        남은 API 할당량이 부족하거나, 요청이 실패했거나, 서킷 브레이커가 요청을 차단하면 빈 리스트를 반환합니다.
+        이 경우에도 마지막으로 가져온 환율은 get_all_exchange_rates()로 계속 조회할 수 있습니다.
 
         Args:
             searchdate (str, optional): 조회할 날짜 (YYYYMMDD 형식의 문자열). 기본값은 None (오늘 날짜).
+            priority (RequestPriority, optional): 요청 우선순위. 기본값은 INTERACTIVE (사용자 새로고침).
+            probe_wait (float, optional): 다른 스레드(예: 백필)의 서킷 브레이커 시험 요청이 진행 중일 때 결과를 기다릴 최대 시간(초).
+                                          UI 스레드가 아닌 곳에서만 지정합니다. 기본값은 0 (기다리지 않음).
 
         Returns:
             list[ExchangeRate]: 가져온 환율 정보(ExchangeRate 객체 리스트)를 반환합니다.
                                 데이터를 가져오지 못하면 빈 리스트를 반환합니다.
         """
         # 조회할 날짜를 결정합니다.
+        today = self.calendar.today() # 오늘 날짜 (KST)
         if searchdate is None:
-            current_date = datetime.date.today() # searchdate가 없으면 오늘 날짜 사용
+            requested = today # searchdate가 없으면 오늘 날짜 사용
         else:
             # searchdate가 있으면 해당 문자열을 datetime 객체로 변환
-            current_date = datetime.datetime.strptime(searchdate, "%Y%m%d").date()
+            requested = datetime.datetime.strptime(searchdate, "%Y%m%d").date()
+        # 휴일이면 직전 영업일로, 아직 고시되지 않은 날짜이면 가장 최근 고시일로 바로 이동합니다.
+        latest = self.calendar.latest_publication_day()
+        current_date = min(self.calendar.previous_business_day(requested), latest)
+        # 최신 환율을 요청한 경우, 이력에서 확정한 결과도 새로 가져온 것과 같이 최신으로 취급합니다.
+        wants_latest = current_date == latest
+
+        # 과거 날짜는 이력과 빈 날짜 기록만으로 적용 환율 날짜를 확정할 수 있으면 요청하지 않습니다.
+        if current_date < today:
+            resolved = self.date_index.resolve(current_date.strftime("%Y%m%d"))
+            if resolved is not None:
+                return self._serve_from_history(resolved, wants_latest)
 
+        pending = list(self.data_types) # 아직 데이터를 찾지 못한 데이터 종류
         max_retries = 7  # API 호출 재시도 최대 횟수 (주말 및 공휴일 고려)
         for _ in range(max_retries):
             search_date_str = current_date.strftime("%Y%m%d") # 현재 날짜를 YYYYMMDD 형식으로 변환
-            raw_rates = self.client.get_exchange_rates(search_date_str) # API 클라이언트를 통해 환율 정보 요청
-            
-            # API 응답이 유효한지 확인합니다.
-            # raw_rates가 None이 아니고, (결과가 1개이고 result 코드가 4인 경우)가 아닌 경우
-            # result 4는 '조회 결과 없음'을 의미하며, 이 경우에도 재시도가 필요합니다.
-            if raw_rates and not (len(raw_rates) == 1 and raw_rates[0].get('result') == 4):
-                self.exchange_rates = [] # 기존 환율 정보 초기화
-                for rate_data in raw_rates:
-                    result = rate_data.get('result', 1) # 결과 코드 가져오기 (기본값 1: 성공)
-                    if result != 1:
-                        # 결과 코드가 1이 아니면 오류 메시지 출력 후 다음 데이터로 넘어감
-                        print(f"API 응답 오류: {rate_data.get('cur_nm', 'Unknown Currency')} - Result Code: {result}")
-                        continue
-                    try:
-                        # API 응답 데이터를 ExchangeRate 객체로 파싱하여 리스트에 추가
-                        rate = ExchangeRate(
-                            result=result,
-                            cur_unit=rate_data.get('cur_unit', ''),
-                            ttb=rate_data.get('ttb', ''),
-                            tts=rate_data.get('tts', ''),
-                            deal_bas_r=rate_data.get('deal_bas_r', ''),
-                            bkpr=rate_data.get('bkpr', ''),
-                            yy_efee_r=rate_data.get('yy_efee_r', ''),
-                            ten_dd_efee_r=rate_data.get('ten_dd_efee_r', ''),
-                            kftc_bkpr=rate_data.get('bkpr', ''),
-                            kftc_deal_bas_r=rate_data.get('kftc_deal_bas_r', ''),
-                            cur_nm=rate_data.get('cur_nm', '')
-                        )
-                        self.exchange_rates.append(rate)
-                    except TypeError as e:
-                        # 데이터 파싱 중 타입 오류 발생 시 처리
-                        print(f"환율 데이터 파싱 오류: {e} - Data: {rate_data}")
-                if self.exchange_rates: # 파싱된 데이터가 하나라도 있으면 반환
-                    return self.exchange_rates
+            if self.date_index.is_known_empty(search_date_str):
+                # 데이터가 없다고 이미 확인된 날짜는 요청하지 않고 바로 이전 영업일로 넘어갑니다.
+                current_date = self._previous_business_day(current_date)
+                continue
+            if current_date < today and self.history.has_day(search_date_str):
+                # 이미 저장된 과거 날짜는 공시 값이 바뀌지 않으므로 이력에서 바로 반환합니다.
+                return self._serve_from_history(search_date_str, wants_latest)
+            try:
+                # 스케줄러를 통해 남은 데이터 종류를 동시에 요청 (할당량 차감 및 요청 속도 제한)
+                responses = self._request_concurrently(search_date_str, pending, priority, probe_wait)
+            except (RequestDeferred, CircuitOpenError) as e:
+                # 할당량이 부족하거나 API 서버 요청이 차단된 경우 재시도해도 소용이 없으므로 즉시 중단합니다.
+                print(e)
+                return []
+
+            for data_type in list(pending):
+                raw_data = responses.get(data_type)
+                # API 응답이 유효한지 확인합니다.
+                # result 4는 '조회 결과 없음'을 의미하며, 이 경우에도 재시도가 필요합니다.
+                if self._is_empty_response(raw_data):
+                    continue
+                if self._store(data_type, search_date_str, raw_data): # 파싱된 데이터가 하나라도 있으면 저장
+                    pending.remove(data_type)
+
+            # 환율 정보를 찾았으면 반환합니다. (대출금리/국제금리는 같은 날짜에 없으면 이전 값을 유지)
+            if DATA_EXCHANGE_RATE not in pending:
+                return self.exchange_rates
+
+            # 요청 자체가 실패했으면 이전 날짜로 넘어가도 결과가 같으므로 중단합니다.
+            if responses.get(DATA_EXCHANGE_RATE) is None:
+                print("API 요청에 실패했습니다. 마지막으로 가져온 환율 정보를 유지합니다.")
+                return []
+
+            # 실제로 '데이터 없음' 응답을 받은 과거 날짜만 기록합니다. (요청 실패(None)나 아직 공시 전인 오늘은 제외)
+            if current_date < today and self._is_known_empty_response(responses.get(DATA_EXCHANGE_RATE)):
+                self.date_index.mark_empty(search_date_str)
+                self.date_index.save()
             
-            # 데이터가 없거나 오류 응답인 경우, 하루 전으로 날짜를 변경하여 재시도
-            current_date -= datetime.timedelta(days=1)
+            # 데이터가 없거나 오류 응답인 경우, 이전 영업일로 날짜를 변경하여 재시도
+            current_date = self._previous_business_day(current_date)
             print(f"데이터를 찾을 수 없습니다. 이전 날짜 {current_date.strftime('%Y%m%d')}로 재시도합니다.")
 
         # 최대 재시도 횟수를 초과하면 오류 메시지 출력 후 빈 리스트 반환
         print("최대 재시도 횟수를 초과했습니다. 환율 정보를 가져오지 못했습니다.")
         return []
 
+    def _serve_from_history(self, date: str, fresh: bool) -> list[ExchangeRate]:
+        """
+        이력에 저장된 날짜의 환율을 현재 환율로 사용합니다.
+
+        Args:
+            date (str): 이력에 저장된 날짜 (YYYYMMDD 형식의 문자열).
+            fresh (bool): 최신 환율 요청에 대한 결과이면 True. 과거 고시 값은 바뀌지 않으므로 API에서 다시 확인할 필요가 없어,
+                          방금 가져온 것과 같이 cache_ttl 동안 최신으로 취급합니다.
+        """
+        self.exchange_rates = self.history.get_day(date)
+        self.exchange_rates_date = date
+        if fresh:
+            self._fetched_at = time.monotonic()
+        return self.exchange_rates
+
+    def _previous_business_day(self, date: datetime.date) -> datetime.date:
+        """
+        지정한 날짜 바로 전의 영업일을 반환합니다.
+        """
+        return self.calendar.previous_business_day(date - datetime.timedelta(days=1))
+
+    def _request_concurrently(self, searchdate: str, data_types: list[str],
+                              priority: RequestPriority, probe_wait: float = 0.0) -> dict[str, list | None]:
+        """
+        여러 데이터 종류를 같은 날짜로 동시에 요청합니다.
+
+        Args:
+            searchdate (str): 조회할 날짜 (YYYYMMDD 형식의 문자열).
+            data_types (list[str]): 요청할 데이터 종류 코드 리스트.
+            priority (RequestPriority): 요청 우선순위.
+            probe_wait (float, optional): 다른 스레드의 시험 요청 결과를 기다릴 최대 시간(초). 기본값은 0.
+
+        Returns:
+            dict[str, list | None]: 데이터 종류 코드를 키로 하는 API 응답 딕셔너리.
+
+        Raises:
+            RequestDeferred: 환율(AP01) 요청이 할당량 부족으로 보류된 경우.
+            CircuitOpenError: 서킷 브레이커가 API 서버 요청을 차단한 경우.
+        """
+        self.breaker.before_request(probe_wait) # 차단 중이면 할당량을 쓰기 전에 중단
+        futures = {
+            data_type: self._executor.submit(self.scheduler.get_exchange_rates, searchdate, data_type, priority)
+            for data_type in data_types
+        }
+        responses = {}
+        deferred = None
+        for data_type, future in futures.items():
+            try:
+                responses[data_type] = future.result()
+            except RequestDeferred as e:
+                # 부가 데이터가 보류된 경우는 무시하고, 환율이 보류된 경우만 호출자에게 알립니다.
+                if data_type == DATA_EXCHANGE_RATE:
+                    deferred = e
+        # 한 종류라도 응답을 받았으면 서버는 살아 있는 것으로 봅니다.
+        if any(response is not None for response in responses.values()):
+            self.breaker.record_success()
+        elif responses:
+            self.breaker.record_failure()
+        else:
+            self.breaker.cancel_request() # 모든 요청이 보류되어 실제로 보내지 않음
+        if deferred is not None:
+            raise deferred
+        return responses
+
+    @staticmethod
+    def _is_empty_response(raw_data: list | None) -> bool:
+        """
+        API 응답이 비어 있거나 '조회 결과 없음'(result 4)인지 확인합니다.
+        """
+        return not raw_data or (len(raw_data) == 1 and raw_data[0].get('result') == 4)
+
+    @staticmethod
+    def _is_known_empty_response(raw_data: list | None) -> bool:
+        """
+        API가 정상적으로 '데이터 없음'을 응답했는지 확인합니다. 요청 자체가 실패한 경우(None)는 포함하지 않습니다.
+        """
+        return raw_data is not None and ExchangeRateService._is_empty_response(raw_data)
+
+    def _store(self, data_type: str, searchdate: str, raw_data: list[dict]) -> bool:
+        """
+        데이터 종류에 맞게 API 응답을 파싱하고, 해당 종류의 캐시에 저장합니다.
+
+        Args:
+            data_type (str): 데이터 종류 코드.
+            searchdate (str): 조회한 날짜 (YYYYMMDD 형식의 문자열).
+            raw_data (list[dict]): API 응답.
+
+        Returns:
+            bool: 파싱된 데이터가 있어 저장했으면 True.
+        """
+        if data_type == DATA_EXCHANGE_RATE:
+            rates = self._parse_exchange_rates(raw_data)
+            if rates:
+                self.exchange_rates = rates
+                self.exchange_rates_date = searchdate
+                self._fetched_at = time.monotonic()
+                self._record_history(searchdate, rates) # 조회한 날짜의 환율을 이력에 기록
+            return bool(rates)
+        if data_type == DATA_LOAN_INTEREST:
+            loan_rates = self._parse_loan_interest_rates(raw_data)
+            if loan_rates:
+                self.loan_interest_rates = loan_rates
+            return bool(loan_rates)
+        if data_type == DATA_INTERNATIONAL_INTEREST:
+            international_rates = self._parse_international_interest_rates(raw_data)
+            if international_rates:
+                self.international_interest_rates = international_rates
+            return bool(international_rates)
+        print(f"알 수 없는 데이터 종류: {data_type}")
+        return False
+
+    def backfill_history(self, days: int) -> int:
+        """
+        오늘부터 지정한 일수만큼 과거로 거슬러 올라가며, 이력에 없는 영업일의 환율 정보를 가져옵니다.
+        주말과 공휴일은 영업일 달력으로 미리 제외하므로 요청하지 않습니다.
+        요청은 BACKGROUND 우선순위로 스케줄러 대기열에 추가되므로, 할당량이 부족하면 사용자 요청용 예비분을 남기고 보류됩니다.
+
+        Args:
+            days (int): 거슬러 올라갈 일수.
+
+        Returns:
+            int: 실제로 처리한 요청 수.
+        """
+        today = self.calendar.today()
+        start, end = today - datetime.timedelta(days=days), today - datetime.timedelta(days=1)
+        for day in reversed(self.calendar.business_days(start, end)): # 할당량이 부족하면 최근 날짜부터 채우도록 역순으로 요청
+            date_str = day.strftime("%Y%m%d")
+            # 이미 기록된 날짜와 데이터가 없다고 확인된 날짜는 요청하지 않음
+            if not self.history.has_day(date_str) and not self.date_index.is_known_empty(date_str):
+                self.scheduler.schedule(date_str, self._on_backfill_response)
+        processed = 0
+        while self.scheduler.pending_count:
+            try:
+                # API 서버가 계속 실패하면 남은 요청은 대기열에 둔 채 중단합니다.
+                # 재확인 등 다른 스레드의 시험 요청이 진행 중이면 그 결과를 기다렸다가 이어서 요청합니다.
+                self.breaker.before_request(wait=PROBE_WAIT)
+            except CircuitOpenError as e:
+                print(e)
+                break
+            done = self.scheduler.run_pending(max_requests=1)
+            if not done: # 할당량 부족으로 보류됨
+                self.breaker.cancel_request()
+                break
+            processed += done
+        self._save_history() # 백필 결과를 한 번에 저장
+        self.date_index.save()
+        return processed
+
+    def _on_backfill_response(self, searchdate: str, raw_rates: list | None):
+        """
+        백필 요청의 응답을 받아 이력에 기록하는 콜백입니다.
+
+        Args:
+            searchdate (str): 요청한 날짜 (YYYYMMDD 형식의 문자열).
+            raw_rates (list | None): API 응답.
+        """
+        if raw_rates is None:
+            self.breaker.record_failure()
+            return
+        self.breaker.record_success()
+        if raw_rates:
+            rates = self._parse_exchange_rates(raw_rates)
+            if rates:
+                self.history.add_day(searchdate, rates)
+        if self._is_known_empty_response(raw_rates):
+            self.date_index.mark_empty(searchdate) # 백필은 과거 날짜만 요청하므로 바로 기록
+
+    def _record_history(self, searchdate: str, rates: list[ExchangeRate]):
+        """
+        조회한 날짜의 환율 정보를 이력에 기록하고, 새로운 날짜이면 파일에 저장합니다.
+
+        Args:
+            searchdate (str): 조회한 날짜 (YYYYMMDD 형식의 문자열).
+            rates (list[ExchangeRate]): 해당 날짜의 환율 정보 리스트.
+        """
+        if self.history.add_day(searchdate, rates):
+            self._save_history()
+
+    def _save_history(self):
+        """
+        이력을 파일에 저장합니다. 실패하면 새로 기록한 날짜는 메모리에 남겨 두고 다음 저장 때 다시 시도합니다.
+        """
+        try:
+            self.history.save()
+        except OSError as e:
+            print(f"환율 이력 파일을 저장하지 못했습니다. 다음 저장 때 다시 시도합니다: {e}")
+
+    @staticmethod
+    def _parse_exchange_rates(raw_rates: list[dict]) -> list[ExchangeRate]:
+        """
+        API 응답 데이터를 ExchangeRate 객체 리스트로 파싱합니다.
+        결과 코드가 1(성공)이 아닌 항목은 건너뜁니다.
+
+        Args:
+            raw_rates (list[dict]): API 응답으로 받은 통화별 딕셔너리 리스트.
+
+        Returns:
+            list[ExchangeRate]: 파싱된 ExchangeRate 객체 리스트.
+        """
+        rates = []
+        for rate_data in raw_rates:
+            result = rate_data.get('result', 1) # 결과 코드 가져오기 (기본값 1: 성공)
+            if result != 1:
+                # 결과 코드가 1이 아니면 오류 메시지 출력 후 다음 데이터로 넘어감
+                print(f"API 응답 오류: {rate_data.get('cur_nm', 'Unknown Currency')} - Result Code: {result}")
+                continue
+            try:
+                # API 응답 데이터를 ExchangeRate 객체로 파싱하여 리스트에 추가
+                rate = ExchangeRate(
+                    result=result,
+                    cur_unit=rate_data.get('cur_unit', ''),
+                    ttb=rate_data.get('ttb', ''),
+                    tts=rate_data.get('tts', ''),
+                    deal_bas_r=rate_data.get('deal_bas_r', ''),
+                    bkpr=rate_data.get('bkpr', ''),
+                    yy_efee_r=rate_data.get('yy_efee_r', ''),
+                    ten_dd_efee_r=rate_data.get('ten_dd_efee_r', ''),
+                    kftc_bkpr=rate_data.get('bkpr', ''),
+                    kftc_deal_bas_r=rate_data.get('kftc_deal_bas_r', ''),
+                    cur_nm=rate_data.get('cur_nm', '')
+                )
+                rates.append(rate)
+            except TypeError as e:
+                # 데이터 파싱 중 타입 오류 발생 시 처리
+                print(f"환율 데이터 파싱 오류: {e} - Data: {rate_data}")
+        return rates
+
+    @staticmethod
+    def _parse_loan_interest_rates(raw_data: list[dict]) -> list[LoanInterestRate]:
+        """
+        대출금리(AP02) API 응답을 LoanInterestRate 객체 리스트로 파싱합니다.
+
+        Args:
+            raw_data (list[dict]): API 응답으로 받은 딕셔너리 리스트.
+
+        Returns:
+            list[LoanInterestRate]: 파싱된 LoanInterestRate 객체 리스트.
+        """
+        return [
+            LoanInterestRate(
+                result=1,
+                sfln_intrc_nm=item.get('sfln_intrc_nm', ''),
+                int_r=str(item.get('int_r', '')),
+            )
+            for item in raw_data if item.get('result', 1) == 1
+        ]
+
+    @staticmethod
+    def _parse_international_interest_rates(raw_data: list[dict]) -> list[InternationalInterestRate]:
+        """
+        국제금리(AP03) API 응답을 InternationalInterestRate 객체 리스트로 파싱합니다.
+
+        Args:
+            raw_data (list[dict]): API 응답으로 받은 딕셔너리 리스트.
+
+        Returns:
+            list[InternationalInterestRate]: 파싱된 InternationalInterestRate 객체 리스트.
+        """
+        return [
+            InternationalInterestRate(
+                result=1,
+                cur_fund=item.get('cur_fund', ''),
+                sfln_intrc_nm=item.get('sfln_intrc_nm', ''),
+                int_r=str(item.get('int_r', '')),
+            )
+            for item in raw_data if item.get('result', 1) == 1
+        ]
+
+    def rates_age(self) -> float | None:
+        """
+        현재 환율 정보를 API에서 가져온 뒤 지난 시간(초)을 반환합니다.
+        이번 실행에서 아직 가져오지 않았으면(이력에서 불러온 데이터 포함) None을 반환합니다.
+        """
+        if self._fetched_at is None:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    def is_fresh(self) -> bool:
+        """
+        현재 환율 정보가 cache_ttl 이내에 가져온 최신 데이터인지 반환합니다.
+        """
+        age = self.rates_age()
+        return age is not None and age < self.cache_ttl
+
+    def get_loan_interest_rates(self) -> list[LoanInterestRate]:
+        """
+        현재 서비스에 저장된 대출금리 정보를 반환합니다.
+        """
+        return self.loan_interest_rates
+
+    def get_international_interest_rates(self) -> list[InternationalInterestRate]:
+        """
+        현재 서비스에 저장된 국제금리 정보를 반환합니다.
+        """
+        return self.international_interest_rates
+
+    def shutdown(self):
+        """
+        동시 요청에 사용하는 스레드 풀을 종료합니다. 애플리케이션 종료 시 호출합니다.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def get_exchange_rate_by_currency(self, currency_code: str) -> ExchangeRate | None:
         """
         특정 통화 코드에 해당하는 환율 정보를 반환합니다.
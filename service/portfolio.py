@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import csv # 보유 내역 파일을 읽고 쓰기 위해 사용
+import os # 파일 존재 여부 확인을 위해 사용
+from dataclasses import dataclass # 평가 결과를 담는 데이터 클래스를 만들기 위해 사용
+
+import numpy as np # 보유 내역을 배열로 보관하고 한 번에 평가하기 위해 사용
+
+from model.exchange_rate_model import ExchangeRate, parse_rate # 환율 데이터 모델 및 환율 문자열 변환 함수
+
+PORTFOLIO_COLUMNS = ('name', 'cur_unit', 'amount') # 보유 내역 CSV 열 순서
+REQUIRED_COLUMNS = ('cur_unit', 'amount') # 보유 내역 CSV에 반드시 있어야 하는 열
+CSV_ENCODINGS = ('utf-8-sig', 'cp949') # 보유 내역 CSV 인코딩 (한국어 Excel에서 저장한 파일은 cp949)
+
+
+def split_currency_unit(cur_unit: str) -> tuple[str, int]:
+    """
+    API 통화 코드를 (기본 통화 코드, 고시 단위)로 나눕니다.
+    일본 옌, 인도네시아 루피아 등은 "JPY(100)"처럼 100단위 환율로 고시됩니다.
+
+    Args:
+        cur_unit (str): 통화 코드 (예: "USD", "JPY(100)").
+
+    Returns:
+        tuple[str, int]: (기본 통화 코드, 고시 단위). 예: ("JPY", 100)
+    """
+    code, _, unit = cur_unit.partition('(')
+    try:
+        return code.strip(), int(unit.rstrip(')')) if unit else 1
+    except ValueError:
+        return code.strip(), 1
+
+
+@dataclass
+class CurrencyPosition:
+    """
+    통화별로 합산한 보유 내역 평가 결과를 담는 데이터 클래스입니다.
+    """
+    currency: str    # 기본 통화 코드 (예: JPY)
+    holdings: int    # 보유 건수
+    amount: float    # 외화 보유 금액 합계
+    value: float     # 매매 기준율 기준 원화 평가액
+    pnl: float       # 전일 대비 평가 손익 (원화)
+
+
+@dataclass
+class PortfolioValuation:
+    """
+    보유 내역 전체의 평가 결과를 담는 데이터 클래스입니다.
+    """
+    rate_date: str | None     # 평가에 사용한 환율 기준일 (YYYYMMDD)
+    previous_date: str | None # 손익 비교에 사용한 전일 환율 기준일 (YYYYMMDD)
+    holdings: int             # 전체 보유 건수
+    total_value: float        # 매매 기준율 기준 원화 평가액
+    total_bid: float          # 전신환 받으실 때(ttb) 기준 원화 평가액 (외화를 팔 때 받는 금액)
+    total_ask: float          # 전신환 보내실 때(tts) 기준 원화 평가액 (외화를 살 때 드는 금액)
+    previous_value: float     # 전일 매매 기준율 기준 원화 평가액
+    pnl: float                # 전일 대비 평가 손익 (원화)
+    pnl_pct: float            # 전일 대비 평가 손익률 (%)
+    unpriced: list[str]       # 환율이 없어 평가하지 못한 통화 코드
+    positions: list[CurrencyPosition] # 통화별 평가 결과
+
+
+class Portfolio:
+    """
+    외화 보유 내역을 배열로 보관하고, 환율 벡터와 한 번의 곱셈으로 원화 평가액을 계산합니다.
+    보유 건마다 통화 번호와 금액만 배열에 저장하므로 보유 건수가 많아도 평가 비용은 배열 연산 몇 번입니다.
+    """
+    def __init__(self):
+        """
+        Portfolio의 생성자입니다. 빈 보유 내역으로 시작합니다.
+        """
+        self.currencies: list[str] = [] # 기본 통화 코드 목록 (보유 건의 통화 번호가 가리키는 대상)
+        self._currency_index: dict[str, int] = {} # 기본 통화 코드 → 통화 번호
+        self.names: list[str] = [] # 보유 건 이름 (파일로 저장할 때만 사용)
+        self.currency_ids = np.empty(0, dtype=np.int32) # 보유 건마다의 통화 번호
+        self.amounts = np.empty(0, dtype=np.float64) # 보유 건마다의 외화 금액
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def _currency_id(self, cur_unit: str) -> int:
+        """
+        통화 코드의 통화 번호를 반환합니다. 처음 보는 통화이면 목록에 추가합니다.
+        """
+        code, _ = split_currency_unit(cur_unit)
+        if code not in self._currency_index:
+            self._currency_index[code] = len(self.currencies)
+            self.currencies.append(code)
+        return self._currency_index[code]
+
+    def set_holdings(self, names: list[str], cur_units: list[str], amounts):
+        """
+        보유 내역 전체를 교체합니다.
+
+        Args:
+            names (list[str]): 보유 건 이름 리스트.
+            cur_units (list[str]): 보유 건마다의 통화 코드 ("JPY"와 "JPY(100)"은 같은 통화로 취급).
+            amounts: 보유 건마다의 외화 금액 (리스트 또는 배열).
+        """
+        self.currencies = []
+        self._currency_index = {}
+        self.names = list(names)
+        self.currency_ids = np.array([self._currency_id(code) for code in cur_units], dtype=np.int32)
+        self.amounts = np.asarray(amounts, dtype=np.float64).copy()
+
+    def load_csv(self, path: str) -> int:
+        """
+        PORTFOLIO_COLUMNS 형식의 CSV 파일에서 보유 내역을 불러옵니다. 파일이 없으면 보유 내역을 바꾸지 않습니다.
+        UTF-8로 읽지 못하면 cp949(한국어 Excel 기본 인코딩)로 다시 읽습니다.
+
+        Args:
+            path (str): CSV 파일 경로.
+
+        Returns:
+            int: 불러온 보유 건수. 파일이 없으면 0.
+
+        Raises:
+            ValueError: 파일을 읽지 못했거나, 필수 열(REQUIRED_COLUMNS)이 없거나, 유효한 행이 하나도 없는 경우.
+                        이 경우 기존 보유 내역은 그대로 유지됩니다.
+        """
+        if not os.path.exists(path):
+            return 0
+        for encoding in CSV_ENCODINGS:
+            try:
+                names, cur_units, amounts = self._read_csv(path, encoding)
+                break
+            except UnicodeDecodeError:
+                continue # 다음 인코딩으로 다시 시도
+            except (OSError, csv.Error) as e:
+                raise ValueError(f"파일을 읽을 수 없습니다: {e}") from e
+        else:
+            raise ValueError(f"지원하지 않는 인코딩입니다 ({', '.join(CSV_ENCODINGS)}만 지원)")
+        if not names:
+            raise ValueError("유효한 보유 내역 행이 없습니다.")
+        self.set_holdings(names, cur_units, amounts)
+        return len(names)
+
+    @staticmethod
+    def _read_csv(path: str, encoding: str) -> tuple[list[str], list[str], list[float]]:
+        """
+        보유 내역 CSV 파일을 지정한 인코딩으로 읽어 (이름, 통화 코드, 금액) 리스트를 반환합니다.
+
+        Raises:
+            ValueError: 필수 열이 없는 경우.
+        """
+        names, cur_units, amounts = [], [], []
+        with open(path, 'r', encoding=encoding, newline='') as f:
+            reader = csv.DictReader(f)
+            missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"필수 열이 없습니다: {', '.join(missing)} (필요한 열: {', '.join(PORTFOLIO_COLUMNS)})")
+            for row in reader:
+                amount = parse_rate(row.get('amount') or '')
+                if not row.get('cur_unit') or not np.isfinite(amount):
+                    print(f"보유 내역 행을 건너뜁니다: {row}")
+                    continue
+                names.append(row.get('name') or '')
+                cur_units.append(row['cur_unit'])
+                amounts.append(amount)
+        return names, cur_units, amounts
+
+    def save_csv(self, path: str):
+        """
+        보유 내역을 CSV 파일로 저장합니다.
+        """
+        try:
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(PORTFOLIO_COLUMNS)
+                for name, currency_id, amount in zip(self.names, self.currency_ids.tolist(), self.amounts.tolist()):
+                    writer.writerow((name, self.currencies[currency_id], amount))
+        except OSError as e:
+            print(f"보유 내역 파일을 저장하는 중 오류 발생: {e}")
+
+    def rate_vector(self, rates: list[ExchangeRate], field: str = 'deal_bas_r') -> np.ndarray:
+        """
+        환율 정보를 보유 통화 순서의 '외화 1단위당 원화' 벡터로 변환합니다. 100단위 고시 통화는 100으로 나눕니다.
+
+        Args:
+            rates (list[ExchangeRate]): 환율 정보 리스트.
+            field (str, optional): 사용할 ExchangeRate 필드 이름. 기본값은 'deal_bas_r'.
+
+        Returns:
+            np.ndarray: 통화 번호 순서의 1단위당 환율. 환율이 없는 통화는 NaN.
+        """
+        vector = np.full(len(self.currencies), np.nan)
+        for rate in rates:
+            code, unit = split_currency_unit(rate.cur_unit)
+            column = self._currency_index.get(code)
+            if column is not None:
+                vector[column] = parse_rate(getattr(rate, field)) / unit
+        if 'KRW' in self._currency_index and np.isnan(vector[self._currency_index['KRW']]):
+            vector[self._currency_index['KRW']] = 1.0 # 원화 보유분은 환율 1로 평가
+        return vector
+
+    def revalue(self, rates: list[ExchangeRate], previous_rates: list[ExchangeRate] | None = None,
+                rate_date: str | None = None, previous_date: str | None = None) -> PortfolioValuation:
+        """
+        현재 환율과 전일 환율로 보유 내역 전체를 평가합니다.
+
+        Args:
+            rates (list[ExchangeRate]): 현재 환율 정보.
+            previous_rates (list[ExchangeRate], optional): 손익 비교에 사용할 전일 환율 정보. 기본값은 None (손익 0).
+            rate_date (str, optional): 현재 환율 기준일. 기본값은 None.
+            previous_date (str, optional): 전일 환율 기준일. 기본값은 None.
+
+        Returns:
+            PortfolioValuation: 평가 결과.
+        """
+        ids = self.currency_ids
+        n_currencies = len(self.currencies)
+        deal = self.rate_vector(rates, 'deal_bas_r')
+        # 보유 건마다의 원화 평가액 (통화별 환율을 보유 건으로 펼친 뒤 금액과 한 번에 곱함)
+        values = self.amounts * deal[ids]
+        bid = self.amounts * self.rate_vector(rates, 'ttb')[ids]
+        ask = self.amounts * self.rate_vector(rates, 'tts')[ids]
+        if previous_rates:
+            previous_values = self.amounts * self.rate_vector(previous_rates, 'deal_bas_r')[ids]
+        else:
+            previous_values = values
+
+        # 통화별 합계는 통화 번호를 기준으로 한 번에 집계합니다. (환율이 없는 통화는 NaN이 되지 않도록 0으로 처리)
+        priced_values = np.nan_to_num(values)
+        # 손익은 오늘과 전일 환율이 모두 있는 보유 건만 계산합니다.
+        pnl = np.nan_to_num(values - previous_values)
+        counts = np.bincount(ids, minlength=n_currencies)
+        amount_sums = np.bincount(ids, weights=self.amounts, minlength=n_currencies)
+        value_sums = np.bincount(ids, weights=priced_values, minlength=n_currencies)
+        pnl_sums = np.bincount(ids, weights=pnl, minlength=n_currencies)
+
+        positions = [
+            CurrencyPosition(code, int(counts[i]), float(amount_sums[i]), float(value_sums[i]), float(pnl_sums[i]))
+            for i, code in enumerate(self.currencies) if counts[i]
+        ]
+        positions.sort(key=lambda position: position.value, reverse=True)
+        total_value = float(value_sums.sum())
+        total_pnl = float(pnl_sums.sum())
+        previous_value = total_value - total_pnl
+        return PortfolioValuation(
+            rate_date=rate_date,
+            previous_date=previous_date if previous_rates else None,
+            holdings=len(self),
+            total_value=total_value,
+            total_bid=float(np.nansum(bid)),
+            total_ask=float(np.nansum(ask)),
+            previous_value=previous_value,
+            pnl=total_pnl,
+            pnl_pct=total_pnl / previous_value * 100 if previous_value else 0.0,
+            unpriced=[code for i, code in enumerate(self.currencies) if counts[i] and np.isnan(deal[i])],
+            positions=positions,
+        )
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import math # 제곱근 계산을 위해 사용
+import threading # 캐시 상태 보호를 위해 사용
+from dataclasses import dataclass # 분석 결과를 담는 데이터 클래스 정의에 사용
+
+import numpy as np # 벡터화된 수치 계산을 위해 사용
+
+from service.rate_history import RateHistory # 날짜별 환율 이력 저장소
+
+TRADING_DAYS_PER_YEAR = 252 # 연율화 변동성 계산에 사용하는 연간 영업일 수
+DEFAULT_WINDOWS = (5, 20, 60) # 상세 화면에 표시할 기본 이동 구간 (일)
+
+
+@dataclass
+class CurrencyAnalytics:
+    """
+    특정 통화의 (이동 구간, 기준일)에 대한 분석 결과를 담는 데이터 클래스입니다.
+    값을 계산할 수 없으면 NaN이 들어갑니다.
+    """
+    currency: str           # 통화 코드
+    window: int             # 이동 구간 (일)
+    as_of: str              # 기준일 (YYYYMMDD)
+    rate: float             # 기준일의 매매 기준율
+    moving_average: float   # 이동 평균
+    volatility: float       # 연율화 실현 변동성 (로그 수익률 표준편차 × √252)
+    change: float           # 전일 대비 변동폭
+    change_pct: float       # 전일 대비 변동률 (%)
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """
+    각 열의 NaN을 바로 앞의 유효한 값으로 채웁니다. 첫 관측 이전의 NaN은 그대로 둡니다.
+
+    Args:
+        values (np.ndarray): (날짜 × 통화) 행렬.
+
+    Returns:
+        np.ndarray: NaN이 채워진 새 행렬.
+    """
+    valid = ~np.isnan(values)
+    # 각 위치에서 가장 최근 유효 행 번호를 누적 최댓값으로 구합니다.
+    index = np.where(valid, np.arange(values.shape[0])[:, None], 0)
+    np.maximum.accumulate(index, axis=0, out=index)
+    filled = np.take_along_axis(values, index, axis=0)
+    # 첫 관측 이전 구간은 NaN으로 유지합니다.
+    seen = np.logical_or.accumulate(valid, axis=0)
+    return np.where(seen, filled, np.nan)
+
+
+def log_returns(values: np.ndarray) -> np.ndarray:
+    """
+    열별 일간 로그 수익률을 계산합니다. 첫 행은 NaN입니다.
+
+    Args:
+        values (np.ndarray): (날짜 × 통화) 행렬.
+
+    Returns:
+        np.ndarray: values와 같은 모양의 로그 수익률 행렬.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        logs = np.log(values)
+    returns = np.full(values.shape, np.nan)
+    returns[1:] = logs[1:] - logs[:-1]
+    return returns
+
+
+def correlation_matrix(values: np.ndarray) -> np.ndarray:
+    """
+    통화 간 일간 로그 수익률의 상관계수 행렬을 계산합니다.
+    모든 통화의 수익률이 유효한 날짜만 사용합니다.
+
+    Args:
+        values (np.ndarray): (날짜 × 통화) 행렬.
+
+    Returns:
+        np.ndarray: (통화 × 통화) 상관계수 행렬. 계산할 수 없는 항목은 NaN입니다.
+    """
+    returns = log_returns(values)
+    returns = returns[np.all(np.isfinite(returns), axis=1)]
+    size = values.shape[1]
+    if returns.shape[0] < 3:
+        return np.full((size, size), np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.atleast_2d(np.corrcoef(returns, rowvar=False))
+
+
+class RateAnalytics:
+    """
+    환율 이력 위에서 이동 평균, 실현 변동성, 전일 대비 변동, 통화 간 상관관계를 계산하는 분석 클래스입니다.
+    결과는 (통화, 이동 구간, 기준일) 단위로 캐시되며, 새로운 날짜가 추가되면 직전 결과에서 증분 계산합니다.
+    """
+    def __init__(self, history: RateHistory):
+        """
+        RateAnalytics의 생성자입니다.
+
+        Args:
+            history (RateHistory): 분석할 환율 이력.
+        """
+        self._history = history # 분석 대상 이력
+        self._lock = threading.RLock() # 캐시 상태 보호용 락
+        self._version = -1 # 마지막으로 행렬을 만든 이력 버전
+        self._dates: list[str] = [] # 행렬의 날짜 (오름차순)
+        self._currencies: list[str] = [] # 행렬의 통화 코드
+        self._values = np.empty((0, 0)) # (날짜 × 통화) 매매 기준율 행렬 (결측은 직전 값으로 채움)
+        self._cache: dict[tuple[str, int, str], CurrencyAnalytics] = {} # (통화, 구간, 기준일) → 결과
+        # 증분 계산용 상태. (통화, 구간) → (기준일 행 번호, 가격 합, 수익률 합, 수익률 제곱합)
+        self._window_state: dict[tuple[str, int], tuple[int, float, float, float]] = {}
+
+    def _refresh(self):
+        """
+        이력이 변경되었으면 행렬을 다시 만듭니다.
+        새로운 날짜가 뒤에 추가되기만 했다면 기존 캐시를 유지하고, 과거 날짜가 바뀌었다면 캐시를 비웁니다.
+        """
+        if self._history.version == self._version:
+            return
+        old_dates, old_currencies = self._dates, self._currencies
+        self._version = self._history.version
+        dates, currencies, values = self._history.to_matrix('deal_bas_r')
+        self._dates, self._currencies, self._values = dates, currencies, forward_fill(values)
+        appended_only = dates[:len(old_dates)] == old_dates and currencies[:len(old_currencies)] == old_currencies
+        if not appended_only:
+            self._cache.clear()
+            self._window_state.clear()
+        elif old_dates:
+            # 같은 날짜를 다시 조회하면 마지막 날짜의 값이 바뀔 수 있으므로 그 날짜의 결과만 버립니다.
+            last_date, last_row = old_dates[-1], len(old_dates) - 1
+            self._cache = {key: value for key, value in self._cache.items() if key[2] != last_date}
+            self._window_state = {key: state for key, state in self._window_state.items() if state[0] != last_row}
+
+    def _row_for(self, as_of: str | None) -> int:
+        """
+        기준일 이전(포함)의 가장 최근 날짜에 해당하는 행 번호를 반환합니다. 없으면 -1입니다.
+        """
+        if not self._dates:
+            return -1
+        if as_of is None:
+            return len(self._dates) - 1
+        return int(np.searchsorted(np.asarray(self._dates), as_of, side='right')) - 1
+
+    @property
+    def currencies(self) -> list[str]:
+        """
+        분석 가능한 통화 코드 목록을 반환합니다.
+        """
+        with self._lock:
+            self._refresh()
+            return list(self._currencies)
+
+    def analyze(self, currency: str, window: int, as_of: str | None = None) -> CurrencyAnalytics | None:
+        """
+        특정 통화의 분석 결과를 반환합니다. 캐시에 있으면 캐시를, 직전 영업일 결과가 있으면 증분 계산을 사용합니다.
+
+        Args:
+            currency (str): 통화 코드.
+            window (int): 이동 구간 (일).
+            as_of (str, optional): 기준일 (YYYYMMDD). 기본값은 None (가장 최근 날짜).
+
+        Returns:
+            CurrencyAnalytics | None: 분석 결과. 이력에 해당 통화나 날짜가 없으면 None.
+        """
+        with self._lock:
+            self._refresh()
+            if currency not in self._currencies:
+                return None
+            row = self._row_for(as_of)
+            if row < 0:
+                return None
+            key = (currency, window, self._dates[row])
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+            col = self._currencies.index(currency)
+            state = self._window_state.get((currency, window))
+            if state is not None and state[0] == row - 1:
+                result = self._advance(currency, col, window, row, state)
+            else:
+                result = self._compute(currency, col, window, row)
+            self._cache[key] = result
+            return result
+
+    def _compute(self, currency: str, col: int, window: int, row: int) -> CurrencyAnalytics:
+        """
+        기준일까지의 구간을 처음부터 계산하고, 다음 증분 계산을 위한 상태를 저장합니다.
+        """
+        prices = self._values[max(0, row - window):row + 1, col] # 수익률 계산을 위해 구간보다 하루 더 가져옴
+        window_prices = prices[-window:]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            returns = np.diff(np.log(prices))[-window:]
+        self._window_state[(currency, window)] = (
+            row, float(window_prices.sum()), float(returns.sum()), float((returns * returns).sum())
+        )
+        return self._build(currency, col, window, row)
+
+    def _advance(self, currency: str, col: int, window: int, row: int,
+                 state: tuple[int, float, float, float]) -> CurrencyAnalytics:
+        """
+        직전 기준일의 구간 합을 이용해 하루 분만 더하고 빼서 새 기준일 결과를 계산합니다.
+        """
+        _, price_sum, ret_sum, ret_sq = state
+        column = self._values[:, col]
+        entering = column[row]
+        leaving = column[row - window] if row - window >= 0 else 0.0
+        price_sum += entering - leaving
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ret_in = math.log(entering / column[row - 1]) if row >= 1 else float('nan')
+            ret_out = math.log(column[row - window] / column[row - window - 1]) if row - window >= 1 else 0.0
+        ret_sum += ret_in - ret_out
+        ret_sq += ret_in * ret_in - ret_out * ret_out
+        if not all(math.isfinite(v) for v in (price_sum, ret_sum, ret_sq)):
+            # 결측이 섞여 증분 계산이 불가능하면 처음부터 계산합니다.
+            return self._compute(currency, col, window, row)
+        self._window_state[(currency, window)] = (row, price_sum, ret_sum, ret_sq)
+        return self._build(currency, col, window, row)
+
+    def _build(self, currency: str, col: int, window: int, row: int) -> CurrencyAnalytics:
+        """
+        저장된 구간 상태로부터 분석 결과 객체를 만듭니다.
+        """
+        _, price_sum, ret_sum, ret_sq = self._window_state[(currency, window)]
+        column = self._values[:, col]
+        rate = float(column[row])
+        enough = row + 1 >= window # 이동 평균에 필요한 날짜 수
+        moving_average = price_sum / window if enough else float('nan')
+        variance = (ret_sq - ret_sum * ret_sum / window) / (window - 1) if window > 1 else float('nan')
+        if row >= window and math.isfinite(variance):
+            # 부동소수점 오차로 아주 작은 음수가 나올 수 있으므로 0으로 자릅니다.
+            volatility = math.sqrt(max(variance, 0.0) * TRADING_DAYS_PER_YEAR)
+        else:
+            volatility = float('nan')
+        previous = float(column[row - 1]) if row >= 1 else float('nan')
+        change = rate - previous
+        change_pct = change / previous * 100 if previous else float('nan')
+        return CurrencyAnalytics(currency, window, self._dates[row], rate, moving_average, volatility, change, change_pct)
+
+    def correlations(self, lookback: int | None = None, as_of: str | None = None) -> tuple[list[str], np.ndarray]:
+        """
+        통화 간 일간 로그 수익률 상관계수 행렬을 계산합니다.
+
+        Args:
+            lookback (int, optional): 기준일 이전 사용할 날짜 수. 기본값은 None (전체 이력).
+            as_of (str, optional): 기준일 (YYYYMMDD). 기본값은 None (가장 최근 날짜).
+
+        Returns:
+            tuple[list[str], np.ndarray]: (통화 코드 리스트, 상관계수 행렬).
+        """
+        with self._lock:
+            self._refresh()
+            row = self._row_for(as_of)
+            start = 0 if lookback is None else max(0, row + 1 - lookback - 1)
+            values = self._values[start:row + 1]
+            return list(self._currencies), correlation_matrix(values)
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import json # 아카이브 헤더(색인) 직렬화를 위해 사용
+import os # 임시 파일을 원자적으로 교체하기 위해 사용
+import struct # 파일 앞부분의 고정 길이 헤더를 읽고 쓰기 위해 사용
+
+import numpy as np # 값 인코딩/디코딩 및 메모리 맵을 위해 사용
+
+from model.exchange_rate_model import ExchangeRate # 환율 데이터 모델
+
+ARCHIVE_MAGIC = b"RXARCH01" # 아카이브 파일 식별자 (형식 버전 포함)
+ARCHIVE_SCALE = 10_000 # 실수 값을 정수로 저장할 때 곱하는 배율 (소수점 4자리까지 보존)
+ARCHIVE_CHUNK_DAYS = 256 # 블록 하나에 담는 날짜 수
+# 아카이브에 저장하는 ExchangeRate의 숫자 필드
+ARCHIVE_FIELDS = ('ttb', 'tts', 'deal_bas_r', 'bkpr', 'yy_efee_r', 'ten_dd_efee_r', 'kftc_bkpr', 'kftc_deal_bas_r')
+_MAX_DECIMALS = 4 # 문자열로 되돌릴 때 사용할 수 있는 최대 소수 자릿수
+_ALIGN = 8 # 각 배열 구역의 바이트 정렬 단위
+
+
+def count_decimals(value: str) -> int:
+    """
+    API 문자열 값의 소수 자릿수를 반환합니다. (예: "1,350.00" → 2)
+    """
+    _, dot, fraction = value.partition('.')
+    return min(len(fraction.strip()), _MAX_DECIMALS) if dot else 0
+
+
+def format_rate(value: float, decimals: int) -> str:
+    """
+    실수 값을 API와 같은 쉼표 포함 문자열로 변환합니다. NaN이면 빈 문자열을 반환합니다.
+    """
+    if not np.isfinite(value):
+        return ''
+    return f"{value:,.{decimals}f}"
+
+
+def _narrowest_int_dtype(values: np.ndarray) -> np.dtype:
+    """
+    값을 손실 없이 담을 수 있는 가장 작은 부호 있는 정수 형식을 반환합니다.
+    """
+    if values.size == 0:
+        return np.dtype(np.int8)
+    low, high = int(values.min()), int(values.max())
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def write_archive(path: str, dates: np.ndarray, currencies: list[str], names: dict[str, str],
+                  matrices: dict[str, np.ndarray], decimals: dict[str, dict[str, int]],
+                  chunk_days: int = ARCHIVE_CHUNK_DAYS):
+    """
+    (날짜 × 통화) 행렬들을 압축 아카이브 파일로 저장합니다.
+    값은 ARCHIVE_SCALE을 곱한 정수로 바꾼 뒤 날짜 블록마다 통화별 첫 값과 전일 대비 차이(델타)로 저장하고,
+    델타는 블록마다 값 범위에 맞는 가장 작은 정수 형식을 사용합니다. 값이 없는 칸은 비트 마스크로 표시합니다.
+    파일은 임시 파일에 쓴 뒤 교체합니다. Windows에서는 메모리 맵으로 열려 있는 파일을 교체할 수 없으므로,
+    같은 경로의 RateArchive는 먼저 close()해야 합니다.
+
+    Args:
+        path (str): 저장할 파일 경로.
+        dates (np.ndarray): 오름차순 날짜 배열 (YYYYMMDD 정수).
+        currencies (list[str]): 열 순서의 통화 코드 리스트.
+        names (dict[str, str]): 통화 코드 → 통화명.
+        matrices (dict[str, np.ndarray]): 필드 이름 → (날짜 × 통화) 실수 행렬. 값이 없으면 NaN.
+        decimals (dict[str, dict[str, int]]): 필드 이름 → (통화 코드 → 문자열로 되돌릴 때 사용할 소수 자릿수).
+                                              같은 필드라도 통화마다 API 표기 자릿수가 다르므로 통화별로 저장합니다.
+        chunk_days (int, optional): 블록 하나에 담을 날짜 수. 기본값은 ARCHIVE_CHUNK_DAYS.
+    """
+    dates = np.ascontiguousarray(dates, dtype=np.int64)
+    sections: list[bytes] = [] # 헤더 뒤에 이어 붙일 배열 구역
+    offset = 0 # 데이터 영역 시작 기준 현재 위치
+
+    def add_section(array: np.ndarray) -> int:
+        nonlocal offset
+        data = np.ascontiguousarray(array).tobytes()
+        start = offset
+        padding = -len(data) % _ALIGN
+        sections.append(data + b"\0" * padding)
+        offset += len(data) + padding
+        return start
+
+    header = {
+        "scale": ARCHIVE_SCALE,
+        "chunk_days": chunk_days,
+        "n_days": len(dates),
+        "currencies": list(currencies),
+        "names": [names.get(code, '') for code in currencies],
+        "fields": list(matrices),
+        "decimals": {field: [decimals.get(field, {}).get(code, 2) for code in currencies] for field in matrices},
+        "dates": add_section(dates),
+        "blocks": [],
+    }
+    for start in range(0, len(dates), chunk_days):
+        rows = min(chunk_days, len(dates) - start)
+        block = {"start": start, "rows": rows, "fields": {}}
+        for field, matrix in matrices.items():
+            values = matrix[start:start + rows]
+            present = np.isfinite(values)
+            scaled = np.where(present, np.rint(np.where(present, values, 0.0) * ARCHIVE_SCALE), 0).astype(np.int64)
+            # 값이 없는 칸은 직전 값으로 채워 델타가 0이 되도록 합니다. (마스크로 다시 NaN 처리)
+            index = np.where(present, np.arange(rows)[:, None], 0)
+            np.maximum.accumulate(index, axis=0, out=index)
+            filled = np.take_along_axis(scaled, index, axis=0)
+            deltas = np.diff(filled, axis=0)
+            delta_dtype = _narrowest_int_dtype(deltas)
+            block["fields"][field] = {
+                "base": add_section(filled[0]),
+                "deltas": add_section(deltas.astype(delta_dtype)),
+                "delta_dtype": delta_dtype.str,
+                "mask": add_section(np.packbits(present, axis=None)),
+            }
+        header["blocks"].append(block)
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    header_bytes += b" " * (-(len(ARCHIVE_MAGIC) + 8 + len(header_bytes)) % _ALIGN)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(ARCHIVE_MAGIC)
+        f.write(struct.pack('<Q', len(header_bytes)))
+        f.write(header_bytes)
+        for section in sections:
+            f.write(section)
+    os.replace(temp_path, path)
+
+
+class RateArchive:
+    """
+    write_archive로 저장한 환율 아카이브를 메모리 맵으로 여는 읽기 전용 뷰입니다.
+    파일을 통째로 읽지 않고 필요한 블록만 디코딩하며, 디코딩한 필드 행렬은 캐시합니다.
+    """
+    def __init__(self, path: str):
+        """
+        RateArchive의 생성자입니다.
+
+        Args:
+            path (str): 아카이브 파일 경로.
+
+        Raises:
+            ValueError: 아카이브 형식이 아닌 파일인 경우.
+        """
+        self.path = path # 아카이브 파일 경로
+        self._buffer = np.memmap(path, dtype=np.uint8, mode='r') # 파일 전체에 대한 메모리 맵
+        if bytes(self._buffer[:len(ARCHIVE_MAGIC)]) != ARCHIVE_MAGIC:
+            raise ValueError(f"환율 아카이브 파일이 아닙니다: {path}")
+        header_start = len(ARCHIVE_MAGIC) + 8
+        (header_length,) = struct.unpack('<Q', bytes(self._buffer[len(ARCHIVE_MAGIC):header_start]))
+        self._header = json.loads(bytes(self._buffer[header_start:header_start + header_length]).decode('utf-8'))
+        self._data_start = header_start + header_length # 배열 구역 시작 위치
+        self.scale: int = self._header["scale"]
+        self.chunk_days: int = self._header["chunk_days"]
+        self.currencies: list[str] = self._header["currencies"]
+        self.names: dict[str, str] = dict(zip(self.currencies, self._header["names"]))
+        self.fields: list[str] = self._header["fields"]
+        # 필드 이름 → (통화 코드 → 소수 자릿수). 필드마다 자릿수 하나만 저장하던 이전 헤더도 읽을 수 있습니다.
+        self.decimals: dict[str, dict[str, int]] = {
+            field: dict(zip(self.currencies, digits if isinstance(digits, list) else [digits] * len(self.currencies)))
+            for field, digits in self._header["decimals"].items()
+        }
+        self.dates: np.ndarray = self._view(self._header["dates"], np.int64, self._header["n_days"]) # YYYYMMDD 정수 (복사 없음)
+        self._matrices: dict[str, np.ndarray] = {} # 필드 이름 → 디코딩한 행렬 캐시
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def _view(self, offset: int, dtype, count: int) -> np.ndarray:
+        """
+        데이터 영역의 특정 위치를 복사 없이 지정한 형식의 배열로 봅니다.
+        """
+        start = self._data_start + offset
+        return self._buffer[start:start + count * np.dtype(dtype).itemsize].view(dtype)
+
+    def _decode_block(self, block: dict, field: str, rows: int | None = None) -> np.ndarray:
+        """
+        블록 하나의 필드 값을 (날짜 × 통화) 실수 행렬로 디코딩합니다.
+
+        Args:
+            block (dict): 헤더의 블록 정보.
+            field (str): 필드 이름.
+            rows (int, optional): 블록 앞에서부터 디코딩할 날짜 수. 기본값은 None (블록 전체).
+        """
+        n_currencies = len(self.currencies)
+        total = block["rows"]
+        rows = total if rows is None else rows
+        info = block["fields"][field]
+        scaled = np.empty((rows, n_currencies), dtype=np.int64)
+        scaled[0] = self._view(info["base"], np.int64, n_currencies)
+        deltas = self._view(info["deltas"], np.dtype(info["delta_dtype"]), (total - 1) * n_currencies)
+        scaled[1:] = deltas.reshape(total - 1, n_currencies)[:rows - 1]
+        np.cumsum(scaled, axis=0, out=scaled)
+        present = np.unpackbits(self._view(info["mask"], np.uint8, (total * n_currencies + 7) // 8),
+                                count=total * n_currencies).reshape(total, n_currencies)[:rows].astype(bool)
+        values = scaled / self.scale
+        values[~present] = np.nan
+        return values
+
+    def matrix(self, field: str = 'deal_bas_r') -> np.ndarray:
+        """
+        필드 전체를 (날짜 × 통화) 실수 행렬로 반환합니다. 반환한 행렬은 캐시되므로 수정하지 마십시오.
+
+        Args:
+            field (str, optional): 필드 이름. 기본값은 'deal_bas_r'.
+
+        Returns:
+            np.ndarray: 값 행렬. 값이 없는 칸은 NaN.
+        """
+        cached = self._matrices.get(field)
+        if cached is None:
+            if field not in self.fields:
+                cached = np.full((len(self.dates), len(self.currencies)), np.nan)
+            elif not self._header["blocks"]:
+                cached = np.empty((0, len(self.currencies)))
+            else:
+                cached = np.vstack([self._decode_block(block, field) for block in self._header["blocks"]])
+            cached.setflags(write=False)
+            self._matrices[field] = cached
+        return cached
+
+    def row_of(self, date: str) -> int | None:
+        """
+        날짜에 해당하는 행 번호를 반환합니다. 없으면 None.
+        """
+        row = int(np.searchsorted(self.dates, int(date)))
+        return row if row < len(self.dates) and self.dates[row] == int(date) else None
+
+    def get_day(self, date: str) -> list[ExchangeRate]:
+        """
+        특정 날짜의 환율 정보를 ExchangeRate 객체 리스트로 복원합니다. 해당 블록만 디코딩합니다.
+
+        Args:
+            date (str): 날짜 (YYYYMMDD 형식의 문자열).
+
+        Returns:
+            list[ExchangeRate]: 해당 날짜에 값이 있는 통화의 환율 정보. 날짜가 없으면 빈 리스트.
+        """
+        row = self.row_of(date)
+        if row is None:
+            return []
+        block = self._header["blocks"][row // self.chunk_days]
+        local = row - block["start"]
+        values = {}
+        for field in self.fields:
+            if field in self._matrices:
+                values[field] = self._matrices[field][row]
+            else:
+                values[field] = self._decode_block(block, field, local + 1)[local]
+        rates = []
+        for column, code in enumerate(self.currencies):
+            if all(not np.isfinite(values[field][column]) for field in self.fields):
+                continue # 이 날짜에 공시되지 않은 통화
+            fields = {field: '' for field in ARCHIVE_FIELDS}
+            fields.update({field: format_rate(values[field][column], self.decimals[field][code]) for field in self.fields})
+            rates.append(ExchangeRate(result=1, cur_unit=code, cur_nm=self.names[code], **fields))
+        return rates
+
+    def close(self):
+        """
+        메모리 맵과 그 위의 모든 배열 뷰(dates 포함)를 놓아 파일 핸들을 닫습니다.
+        이미 반환한 행렬과 dates는 복사본이므로 계속 사용할 수 있지만, 이후 get_day()나 새 필드의 matrix()는 사용할 수 없습니다.
+        """
+        self.dates = np.array(self.dates) # 메모리 맵을 가리키는 뷰 대신 복사본을 남김
+        self._buffer = None # 마지막 참조가 사라지면 메모리 맵과 파일 핸들이 닫힘
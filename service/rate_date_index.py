@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import datetime # 날짜 계산을 위해 사용
+import json # 데이터가 없는 날짜 목록을 파일로 저장/로드하기 위해 사용
+import os # 파일 존재 여부 확인을 위해 사용
+import threading # 백필 스레드와 UI 스레드가 동시에 접근할 때 상태를 보호하기 위해 사용
+
+import numpy as np # 정렬된 날짜 배열에 대한 이진 탐색과 대량 조회를 위해 사용
+
+from service.rate_analytics import forward_fill # 통화별로 직전 공시 값을 채우기 위해 사용
+from service.rate_history import RateHistory # 날짜별 환율 이력 저장소
+
+
+def to_date_ints(dates) -> np.ndarray:
+    """
+    여러 형식의 날짜 목록을 YYYYMMDD 정수 배열로 변환합니다.
+
+    Args:
+        dates: YYYYMMDD 문자열/정수 리스트, 정수 배열, 또는 datetime64 배열.
+
+    Returns:
+        np.ndarray: int64 YYYYMMDD 배열.
+    """
+    array = np.asarray(dates)
+    if np.issubdtype(array.dtype, np.datetime64):
+        days = array.astype("datetime64[D]")
+        years = days.astype("datetime64[Y]").astype(np.int64) + 1970
+        months = days.astype("datetime64[M]").astype(np.int64) % 12 + 1
+        day_of_month = (days - days.astype("datetime64[M]")).astype(np.int64) + 1
+        return years * 10000 + months * 100 + day_of_month
+    return array.astype(np.int64)
+
+
+class RateDateIndex:
+    """
+    이력에 저장된 날짜의 정렬된 색인입니다.
+    "기준일 이전(포함)에 공시된 가장 최근 환율"을 이진 탐색으로 찾고,
+    데이터가 없다고 확인된 날짜(주말, 공휴일 등)를 기록하여 다시 요청하지 않도록 합니다.
+    """
+    def __init__(self, history: RateHistory, file_path: str = 'empty_dates.json'):
+        """
+        RateDateIndex의 생성자입니다.
+
+        Args:
+            history (RateHistory): 색인할 환율 이력.
+            file_path (str, optional): 데이터가 없는 날짜 목록을 저장할 파일 경로. 기본값은 'empty_dates.json'.
+        """
+        self._history = history # 색인 대상 이력
+        self.file_path = file_path # 데이터가 없는 날짜 저장 파일 경로
+        self._lock = threading.RLock() # 색인 상태 보호용 락
+        self._version = -1 # 마지막으로 색인을 만든 이력 버전
+        self._days = np.empty(0, dtype=np.int64) # 데이터가 있는 날짜 (YYYYMMDD 정수, 오름차순)
+        self._empty: set[int] = set() # 데이터가 없다고 확인된 날짜
+        self._matrix_version = -1 # 대량 조회용 행렬을 만든 이력 버전
+        # 필드 → (행렬의 날짜 (YYYYMMDD 정수), 통화 코드, 직전 값으로 채운 값 행렬). 날짜와 행렬은 같은 이력 버전에서 함께 만듭니다.
+        self._matrix_fields: dict[str, tuple[np.ndarray, list[str], np.ndarray]] = {}
+        self._load()
+
+    def _load(self):
+        """
+        파일에서 데이터가 없는 날짜 목록을 불러옵니다.
+        """
+        if not os.path.exists(self.file_path):
+            return
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                self._empty = {int(date) for date in json.load(f)}
+        except (OSError, ValueError, TypeError) as e:
+            print(f"빈 날짜 목록 파일을 읽는 중 오류 발생: {e}. 빈 목록으로 시작합니다.")
+
+    def save(self):
+        """
+        데이터가 없는 날짜 목록을 파일에 저장합니다.
+        """
+        with self._lock:
+            empty = sorted(self._empty)
+        try:
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                json.dump([str(date) for date in empty], f)
+        except OSError as e:
+            print(f"빈 날짜 목록 파일을 저장하는 중 오류 발생: {e}")
+
+    def _refresh(self):
+        """
+        이력이 변경되었으면 날짜 색인을 다시 만듭니다.
+        이력의 락을 잡은 상태에서 버전과 날짜를 함께 읽어, 백필이 동시에 기록해도 서로 다른 버전이 섞이지 않게 합니다.
+        """
+        with self._history.lock:
+            if self._history.version != self._version:
+                self._version = self._history.version
+                self._days = self._history.date_array()
+
+    def mark_empty(self, date: str):
+        """
+        특정 날짜에 데이터가 없음을 기록합니다. 저장은 save()를 호출할 때 이루어집니다.
+
+        Args:
+            date (str): 날짜 (YYYYMMDD 형식의 문자열).
+        """
+        with self._lock:
+            self._empty.add(int(date))
+
+    def is_known_empty(self, date: str) -> bool:
+        """
+        특정 날짜에 데이터가 없다고 이미 확인되었는지 반환합니다.
+        """
+        with self._lock:
+            return int(date) in self._empty
+
+    def as_of(self, date: str) -> str | None:
+        """
+        기준일 이전(포함)에 저장된 가장 최근 날짜를 반환합니다.
+
+        Args:
+            date (str): 기준일 (YYYYMMDD 형식의 문자열).
+
+        Returns:
+            str | None: 저장된 날짜 (YYYYMMDD). 기준일 이전에 저장된 날짜가 없으면 None.
+        """
+        with self._lock:
+            self._refresh()
+            position = int(np.searchsorted(self._days, int(date), side='right')) - 1
+            return str(self._days[position]) if position >= 0 else None
+
+    def resolve(self, date: str) -> str | None:
+        """
+        네트워크 요청 없이 기준일의 적용 환율 날짜를 확정할 수 있으면 그 날짜를 반환합니다.
+        저장된 가장 최근 날짜 이후 기준일까지의 모든 날짜가 '데이터 없음'으로 확인된 경우에만 확정됩니다.
+
+        Args:
+            date (str): 기준일 (YYYYMMDD 형식의 문자열).
+
+        Returns:
+            str | None: 적용 환율 날짜 (YYYYMMDD). 확정할 수 없으면 None.
+        """
+        with self._lock:
+            found = self.as_of(date)
+            if found is None:
+                return None
+            day = datetime.datetime.strptime(found, "%Y%m%d").date() + datetime.timedelta(days=1)
+            target = datetime.datetime.strptime(date, "%Y%m%d").date()
+            while day <= target:
+                if int(day.strftime("%Y%m%d")) not in self._empty:
+                    return None # 아직 확인하지 않은 날짜가 있음
+                day += datetime.timedelta(days=1)
+            return found
+
+    def lookup_rates(self, dates, currency: str, field: str = 'deal_bas_r') -> np.ndarray:
+        """
+        기준일 목록(예: 거래 원장의 거래일)에 적용되는 특정 통화의 환율을 한 번의 벡터 연산으로 조회합니다.
+        기준일 이전(포함)에 그 통화가 공시된 가장 최근 값을 사용하므로, 저장된 날짜에 해당 통화만 빠져 있으면 그 전 값을 사용합니다.
+
+        Args:
+            dates: 기준일 목록 (YYYYMMDD 문자열/정수 또는 datetime64 배열).
+            currency (str): 통화 코드 (예: "USD").
+            field (str, optional): 조회할 ExchangeRate 필드 이름. 기본값은 'deal_bas_r'.
+
+        Returns:
+            np.ndarray: 기준일마다 적용되는 환율. 기준일 이전에 그 통화가 한 번도 공시되지 않았으면 NaN.
+        """
+        with self._lock:
+            days, currencies, matrix = self._matrix(field) # 행 번호가 맞도록 행렬과 같은 버전의 날짜를 사용
+        if currency not in currencies:
+            return np.full(np.shape(dates), np.nan)
+        column = matrix[:, currencies.index(currency)]
+        positions = np.searchsorted(days, to_date_ints(dates), side='right') - 1
+        # 해당 날짜 이전 데이터가 없는 기준일은 NaN이 들어간 여분 칸(-1)을 가리키게 합니다.
+        padded = np.append(column, np.nan)
+        return padded[np.where(positions >= 0, positions, -1)]
+
+    def _matrix(self, field: str) -> tuple[np.ndarray, list[str], np.ndarray]:
+        """
+        대량 조회에 사용할 (날짜, 통화 코드, 날짜 × 통화 행렬)을 반환합니다. 이력이 바뀌었을 때만 다시 만듭니다.
+        행렬의 빈 칸은 통화별로 직전 값으로 채워 두므로, 어느 행을 골라도 그날까지의 가장 최근 공시 값이 됩니다.
+        버전 확인과 행렬 생성은 이력의 락을 잡은 상태에서 한 번에 수행하므로, 날짜와 행렬은 항상 같은 버전입니다.
+        """
+        with self._history.lock:
+            if self._matrix_version != self._history.version:
+                self._matrix_fields.clear()
+                self._matrix_version = self._history.version
+            cached = self._matrix_fields.get(field)
+            if cached is None:
+                dates, currencies, matrix = self._history.to_matrix(field)
+                cached = (np.array(dates, dtype=np.int64), currencies, forward_fill(matrix))
+                self._matrix_fields[field] = cached
+            return cached
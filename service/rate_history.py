@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import json # 이전 형식(JSON) 이력 파일을 불러오기 위해 사용
+import os # 파일 존재 여부 확인을 위해 사용
+import threading # 백그라운드 백필과 UI 스레드가 동시에 접근할 때 상태를 보호하기 위해 사용
+
+import numpy as np # 이력 데이터를 행렬로 변환하기 위해 사용
+
+from model.exchange_rate_model import ExchangeRate, parse_rate # 환율 데이터 모델 및 환율 문자열 변환 함수
+from service.rate_archive import RateArchive, write_archive, count_decimals, ARCHIVE_FIELDS # 압축 이력 아카이브
+
+
+class RateHistory:
+    """
+    날짜별 환율 정보를 보관하는 이력 저장소입니다.
+    저장된 이력은 압축 아카이브 파일을 메모리 맵으로 읽고, 그 이후 새로 기록한 날짜만 메모리에 객체로 보관합니다.
+    save()를 호출하면 두 가지를 합쳐 아카이브를 다시 씁니다.
+    """
+    def __init__(self, file_path: str = 'history.rxa', legacy_path: str | None = 'history.json'):
+        """
+        RateHistory의 생성자입니다.
+
+        Args:
+            file_path (str, optional): 이력 아카이브 파일 경로. 기본값은 'history.rxa'.
+            legacy_path (str, optional): 이전 형식(JSON) 이력 파일 경로. 아카이브가 없고 이 파일이 있으면
+                                         불러와서 아카이브로 변환합니다. 기본값은 'history.json'.
+        """
+        self.file_path = file_path # 이력 아카이브 파일 경로
+        self.legacy_path = legacy_path # 이전 형식 이력 파일 경로
+        self._archive: RateArchive | None = None # 저장된 이력 (메모리 맵)
+        self._days: dict[str, list[ExchangeRate]] = {} # 아카이브 이후 기록한 날짜 (키: YYYYMMDD, 값: 환율 정보 리스트)
+        self._lock = threading.RLock() # 이력 상태 보호용 락
+        self.version = 0 # 이력이 변경될 때마다 증가하는 버전 (캐시 무효화 판단에 사용)
+        self.load()
+
+    @property
+    def lock(self) -> threading.RLock:
+        """
+        이력 상태 보호용 락을 반환합니다. 버전과 여러 조회 결과를 같은 상태에서 읽어야 할 때 잡습니다.
+        """
+        return self._lock
+
+    def load(self):
+        """
+        파일에서 이력을 불러옵니다. 아카이브가 없고 이전 형식 파일이 있으면 변환하여 저장합니다.
+        파일이 없거나 손상되었으면 빈 이력으로 시작합니다.
+        """
+        if os.path.exists(self.file_path):
+            try:
+                archive = RateArchive(self.file_path)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"환율 이력 파일을 읽는 중 오류 발생: {e}. 빈 이력으로 시작합니다.")
+                return
+            with self._lock:
+                self._archive = archive
+                self._days = {}
+                self.version += 1
+        elif self.legacy_path and os.path.exists(self.legacy_path):
+            days = load_legacy_history(self.legacy_path)
+            if days:
+                with self._lock:
+                    self._days = days
+                    self.version += 1
+                try:
+                    self.save()
+                except (OSError, ValueError) as e:
+                    # 변환한 이력은 메모리에 남아 있으므로 다음 저장 때 다시 시도합니다.
+                    print(f"이전 형식 환율 이력을 아카이브로 변환하여 저장하지 못했습니다: {e}")
+
+    def save(self):
+        """
+        아카이브와 새로 기록한 날짜를 합쳐 아카이브 파일에 저장합니다. 새로 기록한 날짜가 없으면 아무것도 하지 않습니다.
+        파일을 교체하기 전에 기존 아카이브의 메모리 맵을 닫고, 저장 후 새 파일을 다시 엽니다.
+
+        Raises:
+            OSError: 파일을 쓰거나 교체하지 못한 경우. 새로 기록한 날짜는 메모리에 남아 다음 저장 때 다시 저장됩니다.
+        """
+        with self._lock:
+            if not self._days:
+                return
+            dates, currencies, matrices = self._merged_matrices(ARCHIVE_FIELDS)
+            names = dict(self._archive.names) if self._archive is not None else {}
+            stored = self._archive.decimals if self._archive is not None else {}
+            decimals = {field: dict(stored.get(field, {})) for field in ARCHIVE_FIELDS} # 필드 → (통화 → 소수 자릿수)
+            for rates in self._days.values():
+                for rate in rates:
+                    names[rate.cur_unit] = rate.cur_nm
+                    for field in ARCHIVE_FIELDS:
+                        digits = decimals[field]
+                        digits[rate.cur_unit] = max(digits.get(rate.cur_unit, 0), count_decimals(getattr(rate, field)))
+            # Windows에서는 메모리 맵으로 열린 파일을 교체할 수 없으므로, 쓰기 전에 기존 아카이브를 닫습니다.
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+            try:
+                write_archive(self.file_path, np.array(dates, dtype=np.int64), currencies, names, matrices, decimals)
+                # 저장한 내용은 아카이브에서 읽으므로 메모리의 객체는 버립니다. (값은 같으므로 버전은 바꾸지 않음)
+                self._days = {}
+            finally:
+                # 저장에 실패했으면 기존 파일이 그대로 남아 있으므로 다시 열어 이전 상태로 돌아갑니다.
+                if os.path.exists(self.file_path):
+                    self._archive = RateArchive(self.file_path)
+
+    def add_day(self, date: str, rates: list[ExchangeRate]) -> bool:
+        """
+        특정 날짜의 환율 정보를 이력에 기록합니다.
+
+        Args:
+            date (str): 날짜 (YYYYMMDD 형식의 문자열).
+            rates (list[ExchangeRate]): 해당 날짜의 환율 정보 리스트.
+
+        Returns:
+            bool: 새로운 날짜가 추가되었으면 True, 이미 있던 날짜를 갱신했으면 False.
+        """
+        with self._lock:
+            is_new = not self.has_day(date)
+            self._days[date] = list(rates)
+            self.version += 1
+            return is_new
+
+    def get_day(self, date: str) -> list[ExchangeRate]:
+        """
+        특정 날짜의 환율 정보를 반환합니다.
+
+        Args:
+            date (str): 날짜 (YYYYMMDD 형식의 문자열).
+
+        Returns:
+            list[ExchangeRate]: 해당 날짜의 환율 정보. 기록이 없으면 빈 리스트.
+        """
+        with self._lock:
+            if date in self._days:
+                return list(self._days[date])
+            if self._archive is not None:
+                return self._archive.get_day(date)
+            return []
+
+    def has_day(self, date: str) -> bool:
+        """
+        특정 날짜의 환율 정보가 기록되어 있는지 확인합니다.
+        """
+        with self._lock:
+            return date in self._days or (self._archive is not None and self._archive.row_of(date) is not None)
+
+    def dates(self) -> list[str]:
+        """
+        기록된 모든 날짜를 오름차순으로 반환합니다.
+        """
+        return [str(date) for date in self.date_array()]
+
+    def date_array(self) -> np.ndarray:
+        """
+        기록된 모든 날짜를 오름차순 YYYYMMDD 정수 배열로 반환합니다.
+        """
+        with self._lock:
+            stored = self._archive.dates if self._archive is not None else np.empty(0, dtype=np.int64)
+            if not self._days:
+                return np.array(stored)
+            recent = np.array([int(date) for date in self._days], dtype=np.int64)
+            return np.union1d(stored, recent)
+
+    def to_matrix(self, field: str = 'deal_bas_r') -> tuple[list[str], list[str], np.ndarray]:
+        """
+        이력을 (날짜 × 통화) 형태의 실수 행렬로 변환합니다.
+
+        Args:
+            field (str, optional): 행렬에 담을 ExchangeRate 필드 이름. 기본값은 'deal_bas_r' (매매 기준율).
+
+        Returns:
+            tuple[list[str], list[str], np.ndarray]: (날짜 리스트, 통화 코드 리스트, 값 행렬).
+                                                    해당 날짜에 통화 정보가 없으면 값은 NaN입니다.
+        """
+        with self._lock:
+            dates, currencies, matrices = self._merged_matrices((field,))
+        return [str(date) for date in dates], currencies, matrices[field]
+
+    def _merged_matrices(self, fields) -> tuple[list[int], list[str], dict[str, np.ndarray]]:
+        """
+        아카이브와 새로 기록한 날짜를 합친 (날짜 × 통화) 행렬을 필드별로 만듭니다. 락을 잡은 상태에서 호출합니다.
+        """
+        archive = self._archive
+        stored_dates = archive.dates if archive is not None else np.empty(0, dtype=np.int64)
+        stored_currencies = archive.currencies if archive is not None else []
+        recent_currencies = {rate.cur_unit for rates in self._days.values() for rate in rates}
+        currencies = sorted(set(stored_currencies) | recent_currencies)
+        recent_dates = np.array(sorted(int(date) for date in self._days), dtype=np.int64)
+        dates = np.union1d(stored_dates, recent_dates)
+        column = {code: i for i, code in enumerate(currencies)} # 통화 코드 → 열 번호
+
+        matrices = {}
+        for field in fields:
+            if archive is not None and not self._days:
+                matrices[field] = np.array(archive.matrix(field)) # 아카이브만 있으면 디코딩 결과를 그대로 복사
+                continue
+            matrix = np.full((len(dates), len(currencies)), np.nan)
+            if archive is not None and len(stored_dates):
+                rows = np.searchsorted(dates, stored_dates)
+                columns = [column[code] for code in stored_currencies]
+                matrix[np.ix_(rows, columns)] = archive.matrix(field)
+            for date in recent_dates:
+                row = int(np.searchsorted(dates, date))
+                matrix[row, :] = np.nan # 같은 날짜를 다시 기록했으면 새 값으로 대체
+                for rate in self._days[str(date)]:
+                    matrix[row, column[rate.cur_unit]] = parse_rate(getattr(rate, field))
+            matrices[field] = matrix
+        return dates.tolist(), currencies, matrices
+
+
+def load_legacy_history(path: str) -> dict[str, list[ExchangeRate]]:
+    """
+    이전 형식(JSON) 이력 파일을 불러옵니다.
+
+    Args:
+        path (str): JSON 이력 파일 경로.
+
+    Returns:
+        dict[str, list[ExchangeRate]]: 날짜 → 환율 정보 리스트. 읽지 못하면 빈 딕셔너리.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        return {date: [ExchangeRate(**rate) for rate in rates] for date, rates in saved.items()}
+    except (OSError, ValueError, TypeError) as e:
+        print(f"이전 형식 환율 이력 파일을 읽는 중 오류 발생: {e}")
+        return {}
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import threading # 백필 스레드와 UI 스레드가 동시에 접근할 때 상태를 보호하기 위해 사용
+
+import numpy as np # 통화별 최근 값을 고정 크기 배열에 보관하기 위해 사용
+
+from service.rate_history import RateHistory # 날짜별 환율 이력 저장소
+
+
+class RateRingBuffers:
+    """
+    통화별 최근 환율 값을 고정 크기 링 버퍼에 보관합니다.
+    모든 통화의 값은 (통화 × 용량) 배열 하나에 저장되며, 값마다 파이썬 객체를 만들지 않습니다.
+    통화마다 버전 번호를 두어, 값이 바뀐 통화만 다시 그릴 수 있도록 합니다.
+    """
+    def __init__(self, capacity: int = 60):
+        """
+        RateRingBuffers의 생성자입니다.
+
+        Args:
+            capacity (int, optional): 통화별로 보관할 최근 값의 수. 기본값은 60 (약 3개월의 영업일).
+        """
+        self.capacity = capacity # 통화별 최대 보관 개수
+        self._rows: dict[str, int] = {} # 통화 코드 → 배열 행 번호
+        self._values = np.full((0, capacity), np.nan) # 값 배열 (행: 통화, 열: 링 버퍼 칸)
+        self._last_dates = np.zeros(0, dtype=np.int64) # 통화별 마지막으로 추가한 날짜 (YYYYMMDD 정수)
+        self._heads = np.zeros(0, dtype=np.int64) # 통화별 다음에 쓸 칸 번호
+        self._counts = np.zeros(0, dtype=np.int64) # 통화별 보관 중인 값의 수
+        self._versions = np.zeros(0, dtype=np.int64) # 통화별 변경 버전
+        self._lock = threading.Lock() # 상태 보호용 락
+
+    def _row(self, currency: str) -> int:
+        """
+        통화의 행 번호를 반환합니다. 처음 보는 통화이면 배열에 행을 추가합니다.
+        """
+        row = self._rows.get(currency)
+        if row is None:
+            row = len(self._rows)
+            self._rows[currency] = row
+            self._values = np.vstack([self._values, np.full((1, self.capacity), np.nan)])
+            self._last_dates = np.append(self._last_dates, 0)
+            self._heads = np.append(self._heads, 0)
+            self._counts = np.append(self._counts, 0)
+            self._versions = np.append(self._versions, 0)
+        return row
+
+    def append(self, currency: str, date: str, value: float):
+        """
+        통화의 특정 날짜 값을 추가합니다.
+        마지막 날짜와 같은 날짜이면 마지막 값을 교체하고, 더 이전 날짜이면 무시합니다.
+
+        Args:
+            currency (str): 통화 코드.
+            date (str): 날짜 (YYYYMMDD 형식의 문자열).
+            value (float): 값. NaN이면 무시합니다.
+        """
+        if value != value: # NaN은 자기 자신과 같지 않음
+            return
+        day = int(date)
+        with self._lock:
+            row = self._row(currency)
+            last = self._last_dates[row]
+            if day < last:
+                return
+            if day == last:
+                slot = (self._heads[row] - 1) % self.capacity # 마지막으로 쓴 칸
+                if self._values[row, slot] == value:
+                    return
+            else:
+                slot = self._heads[row]
+                self._heads[row] = (slot + 1) % self.capacity
+                self._counts[row] = min(self._counts[row] + 1, self.capacity)
+                self._last_dates[row] = day
+            self._values[row, slot] = value
+            self._versions[row] += 1
+
+    def fill_from_history(self, history: RateHistory, field: str = 'deal_bas_r'):
+        """
+        이력에 저장된 최근 값으로 모든 통화의 링 버퍼를 다시 채웁니다.
+
+        Args:
+            history (RateHistory): 환율 이력.
+            field (str, optional): 사용할 ExchangeRate 필드 이름. 기본값은 'deal_bas_r'.
+        """
+        dates, currencies, matrix = history.to_matrix(field)
+        with self._lock:
+            for column, currency in enumerate(currencies):
+                values = matrix[:, column]
+                present = np.flatnonzero(~np.isnan(values))[-self.capacity:] # 값이 있는 최근 날짜만 사용
+                row = self._row(currency)
+                count = len(present)
+                self._values[row] = np.nan
+                self._values[row, :count] = values[present]
+                self._heads[row] = count % self.capacity
+                self._counts[row] = count
+                self._last_dates[row] = int(dates[present[-1]]) if count else 0
+                self._versions[row] += 1
+
+    def series(self, currency: str) -> tuple[np.ndarray, int]:
+        """
+        통화의 보관 중인 값을 오래된 것부터 순서대로 반환합니다.
+
+        Args:
+            currency (str): 통화 코드.
+
+        Returns:
+            tuple[np.ndarray, int]: (값 배열 복사본, 버전). 보관 중인 값이 없으면 빈 배열과 버전 0.
+        """
+        with self._lock:
+            row = self._rows.get(currency)
+            if row is None:
+                return np.empty(0), 0
+            count = self._counts[row]
+            start = (self._heads[row] - count) % self.capacity
+            order = (start + np.arange(count)) % self.capacity
+            return self._values[row, order], int(self._versions[row])
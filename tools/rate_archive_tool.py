@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+환율 이력 아카이브(.rxa)를 다른 형식과 주고받는 도구입니다.
+
+사용 예:
+    python -m tools.rate_archive_tool import history.json history.rxa
+    python -m tools.rate_archive_tool export history.rxa history.csv
+    python -m tools.rate_archive_tool verify history.json history.rxa
+    python -m tools.rate_archive_tool join ledger.csv history.rxa ledger_rates.csv
+    python -m tools.rate_archive_tool info history.rxa
+"""
+
+# 필요한 모듈들을 임포트합니다.
+import argparse # 명령행 인자 처리를 위해 사용
+import csv # CSV 가져오기/내보내기를 위해 사용
+import json # JSON 내보내기를 위해 사용
+import os # 파일 크기 확인을 위해 사용
+import sys # 종료 코드 반환을 위해 사용
+import time # 불러오기 시간 측정을 위해 사용
+from dataclasses import asdict # ExchangeRate 객체를 딕셔너리로 변환하기 위해 사용
+
+import numpy as np # 원장 행을 통화별로 묶어 한 번에 조회하기 위해 사용
+
+from model.exchange_rate_model import ExchangeRate # 환율 데이터 모델
+from service.rate_archive import RateArchive, ARCHIVE_FIELDS # 압축 이력 아카이브
+from service.rate_date_index import RateDateIndex # 기준일 환율 대량 조회 색인
+from service.rate_history import RateHistory, load_legacy_history # 날짜별 환율 이력 저장소
+
+CSV_COLUMNS = ('date', 'cur_unit', 'cur_nm') + ARCHIVE_FIELDS # CSV 열 순서
+
+
+def load_csv(path: str) -> dict[str, list[ExchangeRate]]:
+    """
+    CSV_COLUMNS 형식의 CSV 파일을 날짜별 환율 정보로 불러옵니다.
+    """
+    days: dict[str, list[ExchangeRate]] = {}
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            fields = {field: row.get(field, '') for field in ARCHIVE_FIELDS}
+            days.setdefault(row['date'], []).append(
+                ExchangeRate(result=1, cur_unit=row['cur_unit'], cur_nm=row.get('cur_nm', ''), **fields))
+    return days
+
+
+def load_source(path: str) -> dict[str, list[ExchangeRate]]:
+    """
+    JSON(이전 이력 형식) 또는 CSV 파일을 날짜별 환율 정보로 불러옵니다.
+    """
+    return load_csv(path) if path.lower().endswith('.csv') else load_legacy_history(path)
+
+
+def verify_round_trip(days: dict[str, list[ExchangeRate]], archive_path: str) -> list[str]:
+    """
+    아카이브에서 복원한 문자열이 원본 문자열과 같은지 날짜/통화/필드별로 비교합니다.
+
+    Args:
+        days (dict[str, list[ExchangeRate]]): 원본 날짜별 환율 정보.
+        archive_path (str): 비교할 아카이브 파일 경로.
+
+    Returns:
+        list[str]: 일치하지 않는 값의 설명 (예: "20240102 USD deal_bas_r: '1,400' → '1,400.00'"). 모두 같으면 빈 리스트.
+    """
+    archive = RateArchive(archive_path)
+    mismatches = []
+    for date in sorted(days):
+        restored = {rate.cur_unit: rate for rate in archive.get_day(date)}
+        for rate in days[date]:
+            copy = restored.get(rate.cur_unit)
+            for field in ARCHIVE_FIELDS:
+                expected = getattr(rate, field).strip()
+                actual = getattr(copy, field) if copy is not None else ''
+                if expected != actual:
+                    mismatches.append(f"{date} {rate.cur_unit} {field}: {expected!r} → {actual!r}")
+    archive.close()
+    return mismatches
+
+
+def import_history(source: str, target: str) -> int:
+    """
+    JSON(이전 이력 형식) 또는 CSV 파일을 아카이브로 가져옵니다. 대상 아카이브가 이미 있으면 합칩니다.
+    저장한 뒤 원본과 복원한 문자열을 비교하여, 다르게 복원되는 값이 있으면 출력합니다.
+
+    Returns:
+        int: 가져온 날짜 수.
+    """
+    days = load_source(source)
+    if not days:
+        return 0
+    history = RateHistory(target, legacy_path=None)
+    for date in sorted(days):
+        history.add_day(date, days[date])
+    history.save()
+    print_mismatches(verify_round_trip(days, target))
+    return len(days)
+
+
+def print_mismatches(mismatches: list[str], limit: int = 20):
+    """
+    문자열 왕복 비교 결과를 출력합니다. 불일치가 많으면 앞의 limit개만 출력합니다.
+    """
+    if not mismatches:
+        print("복원한 문자열이 원본과 모두 같습니다.")
+        return
+    print(f"원본과 다르게 복원되는 값: {len(mismatches):,}개")
+    for line in mismatches[:limit]:
+        print(f"  {line}")
+
+
+def export_history(source: str, target: str) -> int:
+    """
+    아카이브를 JSON(이전 이력 형식) 또는 CSV 파일로 내보냅니다.
+
+    Returns:
+        int: 내보낸 날짜 수.
+    """
+    history = RateHistory(source, legacy_path=None)
+    dates = history.dates()
+    if target.lower().endswith('.csv'):
+        with open(target, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            for date in dates:
+                for rate in history.get_day(date):
+                    writer.writerow({'date': date, **asdict(rate)})
+    else:
+        snapshot = {date: [asdict(rate) for rate in history.get_day(date)] for date in dates}
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+    return len(dates)
+
+
+def join_ledger(ledger: str, archive: str, target: str, field: str = 'deal_bas_r') -> int:
+    """
+    거래 원장 CSV의 각 행에 거래일에 적용되는 환율을 붙여 저장합니다.
+    통화마다 한 번의 벡터 조회로 처리하므로 행이 많아도 날짜별로 반복 조회하지 않습니다.
+
+    Args:
+        ledger (str): 원장 CSV 파일 경로 (필수 열: date(YYYYMMDD), cur_unit).
+        archive (str): 환율 이력 아카이브 파일 경로.
+        target (str): 결과 CSV 파일 경로. 원장의 열 뒤에 'rate' 열을 추가합니다. 적용할 환율이 없으면 빈 값.
+        field (str, optional): 조회할 ExchangeRate 필드 이름. 기본값은 'deal_bas_r'.
+
+    Returns:
+        int: 처리한 행 수.
+    """
+    with open(ledger, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        columns = list(reader.fieldnames or [])
+        rows = list(reader)
+    index = RateDateIndex(RateHistory(archive, legacy_path=None))
+    dates = np.array([row['date'] for row in rows], dtype=np.int64)
+    codes = np.array([row['cur_unit'] for row in rows])
+    rates = np.full(len(rows), np.nan)
+    for code in np.unique(codes):
+        selected = codes == code
+        rates[selected] = index.lookup_rates(dates[selected], str(code), field)
+    with open(target, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns + ['rate'])
+        writer.writeheader()
+        for row, rate in zip(rows, rates):
+            writer.writerow({**row, 'rate': '' if np.isnan(rate) else f"{rate:g}"})
+    return len(rows)
+
+
+def print_info(path: str):
+    """
+    아카이브의 크기, 날짜 범위, 통화 수와 전체 행렬을 불러오는 데 걸린 시간을 출력합니다.
+    """
+    started = time.perf_counter()
+    archive = RateArchive(path)
+    matrices = [archive.matrix(field) for field in archive.fields]
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"파일: {path} ({os.path.getsize(path) / 1024:,.1f} KB)")
+    if len(archive):
+        print(f"기간: {archive.dates[0]} ~ {archive.dates[-1]} ({len(archive):,}일)")
+    print(f"통화: {len(archive.currencies)}개, 필드: {len(archive.fields)}개, 블록 크기: {archive.chunk_days}일")
+    print(f"전체 불러오기: {elapsed:.1f} ms (디코딩 크기 {sum(m.nbytes for m in matrices) / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="환율 이력 아카이브 가져오기/내보내기")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="JSON/CSV 이력을 아카이브로 가져오기")
+    import_parser.add_argument("source", help="가져올 JSON 또는 CSV 파일")
+    import_parser.add_argument("archive", help="대상 아카이브 파일 (.rxa)")
+    export_parser = commands.add_parser("export", help="아카이브를 JSON/CSV로 내보내기")
+    export_parser.add_argument("archive", help="내보낼 아카이브 파일 (.rxa)")
+    export_parser.add_argument("target", help="대상 JSON 또는 CSV 파일")
+    verify_parser = commands.add_parser("verify", help="원본 JSON/CSV와 아카이브의 문자열 비교")
+    verify_parser.add_argument("source", help="원본 JSON 또는 CSV 파일")
+    verify_parser.add_argument("archive", help="비교할 아카이브 파일 (.rxa)")
+    join_parser = commands.add_parser("join", help="거래 원장 CSV에 거래일 적용 환율 붙이기")
+    join_parser.add_argument("ledger", help="원장 CSV 파일 (열: date, cur_unit, ...)")
+    join_parser.add_argument("archive", help="환율 이력 아카이브 파일 (.rxa)")
+    join_parser.add_argument("target", help="결과 CSV 파일")
+    join_parser.add_argument("--field", default="deal_bas_r", choices=ARCHIVE_FIELDS, help="조회할 환율 필드")
+    info_parser = commands.add_parser("info", help="아카이브 정보 출력")
+    info_parser.add_argument("archive", help="아카이브 파일 (.rxa)")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        print(f"{import_history(args.source, args.archive):,}일을 가져왔습니다.")
+    elif args.command == "export":
+        print(f"{export_history(args.archive, args.target):,}일을 내보냈습니다.")
+    elif args.command == "join":
+        print(f"{join_ledger(args.ledger, args.archive, args.target, args.field):,}행에 환율을 붙였습니다.")
+    elif args.command == "verify":
+        mismatches = verify_round_trip(load_source(args.source), args.archive)
+        print_mismatches(mismatches)
+        sys.exit(1 if mismatches else 0)
+    else:
+        print_info(args.archive)
+    sys.exit(0)
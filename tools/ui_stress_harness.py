@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+오프스크린 Qt 환경에서 ExchangeRateViewModel에 가짜 환율 데이터를 빠르게 반복 공급하여
+UI 갱신 지연, 이벤트 루프 지연, 메모리(RSS), 살아 있는 QObject 수를 측정하는 스트레스 도구입니다.
+워밍업 이후 메모리나 QObject 수가 기준치 이상 늘어나면 종료 코드 1로 실패합니다.
+
+사용 예:
+    python -m tools.ui_stress_harness --iterations 5000
+"""
+
+# 필요한 모듈들을 임포트합니다.
+import argparse # 명령행 인자 처리를 위해 사용
+import gc # 측정 전에 파이썬 객체를 정리하기 위해 사용
+import os # 오프스크린 플랫폼 설정 및 RSS 측정을 위해 사용
+import random # 가짜 환율 데이터 생성을 위해 사용
+import sys # 종료 코드 반환을 위해 사용
+import tempfile # 설정/이력/할당량 파일을 임시 디렉터리에 만들기 위해 사용
+import time # 지연 시간 측정을 위해 사용
+
+# 화면 없이 실행할 수 있도록 QApplication 생성 전에 오프스크린 플랫폼을 지정합니다.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QObject, QTimer, QEvent, QCoreApplication # 이벤트 루프 지연 측정 및 지연 삭제 처리를 위해 사용
+from PySide6.QtWidgets import QApplication # PySide6 애플리케이션 객체
+
+from api.request_scheduler import RequestScheduler # 할당량 표시용 스케줄러 (실제 요청은 보내지 않음)
+from model.exchange_rate_model import ExchangeRate # 환율 데이터 모델
+from service.rate_history import RateHistory # 날짜별 환율 이력 저장소
+from service.circuit_breaker import CircuitBreaker # 서비스와 같은 차단 상태 표시용
+from service.settings_manager import SettingsManager # 통화 표시 설정 저장/로드
+from ui.control_panel import ControlPanelWidget # 통화 선택 및 제어 패널 위젯
+from ui.data_view import DataViewWidget # 환율 데이터를 표시하는 뷰 위젯
+from viewmodel.exchange_rate_viewmodel import ExchangeRateViewModel # 뷰와 모델을 연결하는 뷰모델
+
+# 가짜 환율 데이터에 사용할 통화 목록 (통화 코드, 통화명, 기준 매매 기준율)
+SYNTHETIC_CURRENCIES = [
+    ("AED", "아랍에미리트 디르함", 367.0), ("AUD", "호주 달러", 880.0), ("BHD", "바레인 디나르", 3580.0),
+    ("BND", "브루나이 달러", 1000.0), ("CAD", "캐나다 달러", 990.0), ("CHF", "스위스 프랑", 1520.0),
+    ("CNH", "위안화", 186.0), ("DKK", "덴마아크 크로네", 196.0), ("EUR", "유로", 1460.0),
+    ("GBP", "영국 파운드", 1720.0), ("HKD", "홍콩 달러", 173.0), ("IDR(100)", "인도네시아 루피아", 8.5),
+    ("JPY(100)", "일본 옌", 905.0), ("KWD", "쿠웨이트 디나르", 4400.0), ("MYR", "말레이지아 링기트", 290.0),
+    ("NOK", "노르웨이 크로네", 125.0), ("NZD", "뉴질랜드 달러", 810.0), ("SAR", "사우디 리얄", 360.0),
+    ("SEK", "스웨덴 크로나", 128.0), ("SGD", "싱가포르 달러", 1000.0), ("THB", "태국 바트", 37.0),
+    ("USD", "미국 달러", 1350.0),
+]
+
+
+def make_synthetic_rates(rng: random.Random, full: bool = False) -> list[ExchangeRate]:
+    """
+    무작위로 일부 통화를 고르고 값을 흔들어 가짜 환율 데이터를 만듭니다.
+    통화 수가 매번 달라지므로 타일이 추가/삭제되는 경우까지 함께 검사됩니다.
+    full이 True이면 모든 통화를 포함합니다.
+    """
+    count = len(SYNTHETIC_CURRENCIES) if full else rng.randint(len(SYNTHETIC_CURRENCIES) // 2, len(SYNTHETIC_CURRENCIES))
+    rates = []
+    for code, name, base in sorted(rng.sample(SYNTHETIC_CURRENCIES, count)):
+        deal = base * (1 + rng.uniform(-0.02, 0.02))
+        rates.append(ExchangeRate(
+            result=1, cur_unit=code, ttb=f"{deal * 0.99:,.2f}", tts=f"{deal * 1.01:,.2f}",
+            deal_bas_r=f"{deal:,.2f}", bkpr=f"{int(deal):,}", yy_efee_r="0", ten_dd_efee_r="0",
+            kftc_bkpr=f"{int(deal):,}", kftc_deal_bas_r=f"{deal:,.2f}", cur_nm=name,
+        ))
+    return rates
+
+
+class SyntheticRateService:
+    """
+    네트워크 요청 없이 가짜 환율 데이터를 돌려주는 서비스 대역입니다.
+    ExchangeRateViewModel이 사용하는 ExchangeRateService의 메서드와 속성만 제공합니다.
+    """
+    def __init__(self, work_dir: str, seed: int):
+        self._rng = random.Random(seed) # 재현 가능한 난수 생성기
+        self.scheduler = RequestScheduler(None, quota_file=os.path.join(work_dir, "quota.json"))
+        self.history = RateHistory(os.path.join(work_dir, "history.rxa"), legacy_path=None)
+        self.exchange_rates: list[ExchangeRate] = []
+        self.exchange_rates_date = "20260101"
+        self.breaker = CircuitBreaker()
+        self.full_set = False # True이면 다음 새로고침에서 모든 통화를 돌려줌
+
+    def fetch_exchange_rates(self, searchdate: str = None, priority=None, probe_wait: float = 0.0) -> list[ExchangeRate]:
+        self.exchange_rates = make_synthetic_rates(self._rng, self.full_set)
+        return self.exchange_rates
+
+    def get_all_exchange_rates(self) -> list[ExchangeRate]:
+        return self.exchange_rates
+
+    def rates_age(self) -> float | None:
+        return None
+
+    def is_fresh(self) -> bool:
+        return False # 매번 백그라운드 재확인 경로를 거치도록 항상 오래된 데이터로 취급
+
+    def get_loan_interest_rates(self) -> list:
+        return []
+
+    def get_international_interest_rates(self) -> list:
+        return []
+
+    def shutdown(self):
+        pass
+
+
+class EventLoopLagProbe(QObject):
+    """
+    일정 간격의 타이머가 실제로 얼마나 늦게 호출되는지 기록하여 이벤트 루프 지연을 측정합니다.
+    """
+    def __init__(self, interval_ms: int = 10):
+        super().__init__()
+        self.interval_ms = interval_ms
+        self.lags_ms: list[float] = []
+        self._last = time.perf_counter()
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_timeout)
+        self._timer.start()
+
+    def _on_timeout(self):
+        now = time.perf_counter()
+        self.lags_ms.append(max(0.0, (now - self._last) * 1000 - self.interval_ms))
+        self._last = now
+
+    def stop(self):
+        self._timer.stop()
+
+
+def current_rss_mb() -> float:
+    """
+    현재 프로세스의 상주 메모리(RSS)를 MB 단위로 반환합니다. 측정할 수 없으면 NaN을 반환합니다.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil # 리눅스 이외의 환경에서는 설치되어 있을 때만 사용
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        return float("nan")
+
+
+def live_qobject_count(roots: list[QObject]) -> int:
+    """
+    최상위 위젯과 측정 대상 객체 아래에 살아 있는 QObject 수를 셉니다.
+    """
+    objects = set()
+    for root in list(roots) + QApplication.topLevelWidgets():
+        objects.add(id(root))
+        for child in root.findChildren(QObject):
+            objects.add(id(child))
+    return len(objects)
+
+
+def settle(app: QApplication):
+    """
+    대기 중인 이벤트와 deleteLater()로 예약된 삭제를 모두 처리하고 파이썬 객체를 정리합니다.
+    """
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    app.processEvents()
+    gc.collect()
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    """
+    정렬된 값 목록에서 백분위 값을 반환합니다.
+    """
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def run(args) -> int:
+    """
+    스트레스 시나리오를 실행하고 결과를 출력합니다.
+
+    Returns:
+        int: 기준치를 통과하면 0, 실패하면 1.
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    work_dir = tempfile.mkdtemp(prefix="ui-stress-")
+    rng = random.Random(args.seed)
+
+    service = SyntheticRateService(work_dir, args.seed)
+    settings_manager = SettingsManager(os.path.join(work_dir, "settings.xml"))
+    viewmodel = ExchangeRateViewModel(service, settings_manager)
+    data_view = DataViewWidget(viewmodel)
+    control_panel = ControlPanelWidget()
+    viewmodel.available_currencies_changed.connect(control_panel.populate_currencies)
+    control_panel.visibility_changed.connect(viewmodel.set_currency_visibility)
+    data_view.show()
+    control_panel.show()
+    roots = [data_view, control_panel, viewmodel]
+
+    def close_modal_dialog():
+        dialog = QApplication.activeModalWidget()
+        if dialog is not None:
+            dialog.accept()
+
+    def one_iteration(i: int) -> float:
+        start = time.perf_counter()
+        viewmodel.fetch_exchange_rates() # 새로고침 (백그라운드 재확인 후 타일 전체 재생성)
+        viewmodel.wait_for_revalidation()
+        app.processEvents() # 재확인 결과 반영
+        if i % 5 == 0: # 통화 표시 여부 전환
+            code = rng.choice(SYNTHETIC_CURRENCIES)[0]
+            viewmodel.set_currency_visibility(code, rng.random() < 0.5)
+        app.processEvents()
+        elapsed = (time.perf_counter() - start) * 1000
+        if args.dialog_every and i % args.dialog_every == 0 and service.exchange_rates:
+            # 실제 클릭 경로와 같이 상세 다이얼로그를 열고, 모달 루프가 시작되면 바로 닫습니다.
+            QTimer.singleShot(0, close_modal_dialog)
+            data_view._show_detail_dialog_for_currency(service.exchange_rates[0].cur_unit)
+        return elapsed
+
+    def normalize():
+        # 타일 수가 표본마다 달라 QObject 수가 흔들리지 않도록, 모든 통화를 표시한 같은 상태에서 측정합니다.
+        service.full_set = True
+        viewmodel.fetch_exchange_rates()
+        viewmodel.wait_for_revalidation()
+        app.processEvents()
+        viewmodel.select_all_currencies()
+        service.full_set = False
+        settle(app)
+
+    # 워밍업: 캐시, 폰트, 지연 초기화 등으로 처음에 늘어나는 메모리를 기준선에서 제외합니다.
+    for i in range(args.warmup):
+        one_iteration(i)
+    normalize()
+    baseline_rss = current_rss_mb()
+    baseline_objects = live_qobject_count(roots)
+
+    probe = EventLoopLagProbe()
+    latencies: list[float] = []
+    samples: list[tuple[int, float, int]] = []
+    for i in range(args.iterations):
+        latencies.append(one_iteration(i))
+        if (i + 1) % args.sample_every == 0:
+            normalize()
+            samples.append((i + 1, current_rss_mb(), live_qobject_count(roots)))
+    probe.stop()
+    normalize()
+    final_rss = current_rss_mb()
+    final_objects = live_qobject_count(roots)
+
+    print(f"반복 횟수: {args.iterations} (워밍업 {args.warmup})")
+    print(f"UI 갱신 지연(ms): p50 {percentile(latencies, 0.5):.2f}, p95 {percentile(latencies, 0.95):.2f}, "
+          f"p99 {percentile(latencies, 0.99):.2f}, 최대 {max(latencies):.2f}")
+    print(f"이벤트 루프 지연(ms): p50 {percentile(probe.lags_ms, 0.5):.2f}, p99 {percentile(probe.lags_ms, 0.99):.2f}, "
+          f"최대 {max(probe.lags_ms, default=0.0):.2f}")
+    for iteration, rss, objects in samples:
+        print(f"  {iteration:>7}회: RSS {rss:8.1f} MB, QObject {objects}")
+    rss_growth = final_rss - baseline_rss
+    object_growth = final_objects - baseline_objects
+    print(f"RSS 증가: {rss_growth:+.1f} MB (기준 {args.max_rss_growth_mb} MB)")
+    print(f"QObject 증가: {object_growth:+d} (기준 {args.max_object_growth})")
+
+    failed = False
+    if rss_growth > args.max_rss_growth_mb:
+        print("실패: 메모리 사용량이 기준치 이상 증가했습니다.")
+        failed = True
+    if object_growth > args.max_object_growth:
+        print("실패: 살아 있는 QObject 수가 기준치 이상 증가했습니다.")
+        failed = True
+    if not failed:
+        print("통과")
+    viewmodel.shutdown()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="환율 UI 새로고침 스트레스 및 위젯 누수 검사")
+    parser.add_argument("--iterations", type=int, default=2000, help="측정할 새로고침 횟수")
+    parser.add_argument("--warmup", type=int, default=200, help="기준선 측정 전 워밍업 횟수")
+    parser.add_argument("--sample-every", type=int, default=500, help="RSS/QObject 표본 간격")
+    parser.add_argument("--dialog-every", type=int, default=10, help="상세 다이얼로그를 여닫는 간격 (0이면 열지 않음)")
+    parser.add_argument("--max-rss-growth-mb", type=float, default=20.0, help="허용 RSS 증가량 (MB)")
+    parser.add_argument("--max-object-growth", type=int, default=50, help="허용 QObject 증가 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    sys.exit(run(parser.parse_args()))
@@ -13,12 +13,65 @@ from PySide6.QtWidgets import (
     QGridLayout,     # 그리드 형태의 레이아웃
 )
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal # Qt.DisplayRole, Qt.Horizontal, QAbstractTableModel, QModelIndex, Signal 등을 위해 사용
-from PySide6.QtGui import QFont, QMouseEvent # 폰트 설정, 마우스 이벤트 처리를 위해 사용
+from PySide6.QtGui import QFont, QMouseEvent, QPainter, QPainterPath, QPen, QColor # 폰트 설정, 마우스 이벤트 처리, 스파크라인 그리기를 위해 사용
+import numpy as np # 스파크라인 좌표 계산을 위해 사용
 
 # 프로젝트의 다른 부분에서 정의된 클래스들을 임포트합니다.
 from model.exchange_rate_model import ExchangeRate # 환율 데이터 모델
+from service.rate_analytics import CurrencyAnalytics # 환율 이력 분석 결과
 from viewmodel.exchange_rate_viewmodel import ExchangeRateViewModel # 뷰와 모델을 연결하는 뷰모델
 
+SPARKLINE_WIDTH = 170  # 타일 안 스파크라인 영역 너비 (픽셀)
+SPARKLINE_HEIGHT = 30  # 타일 안 스파크라인 영역 높이 (픽셀)
+RISE_COLOR = "#d32f2f" # 상승 표시 색상 (국내 관례에 따라 빨간색)
+FALL_COLOR = "#1976d2" # 하락 표시 색상 (파란색)
+FLAT_COLOR = "#757575" # 보합 표시 색상
+
+
+def build_sparkline_path(values: np.ndarray, width: int = SPARKLINE_WIDTH, height: int = SPARKLINE_HEIGHT) -> QPainterPath:
+    """
+    최근 값 배열을 지정한 크기에 맞춘 꺾은선 경로로 변환합니다.
+
+    Args:
+        values (np.ndarray): 오래된 것부터 순서대로 정렬된 값 배열.
+        width (int, optional): 경로 너비. 기본값은 SPARKLINE_WIDTH.
+        height (int, optional): 경로 높이. 기본값은 SPARKLINE_HEIGHT.
+
+    Returns:
+        QPainterPath: 꺾은선 경로. 값이 2개 미만이면 빈 경로.
+    """
+    path = QPainterPath()
+    if len(values) < 2:
+        return path
+    low, high = float(values.min()), float(values.max())
+    span = high - low or 1.0 # 값이 모두 같으면 가운데 가로선
+    xs = np.linspace(1, width - 1, len(values))
+    ys = (height - 2) - (values - low) / span * (height - 4) if high > low else np.full(len(values), height / 2)
+    path.moveTo(xs[0], ys[0])
+    for x, y in zip(xs[1:].tolist(), ys[1:].tolist()):
+        path.lineTo(x, y)
+    return path
+
+
+class SparklineWidget(QWidget):
+    """
+    미리 만들어 둔 꺾은선 경로를 그리기만 하는 작은 위젯입니다. 경로 계산은 하지 않습니다.
+    """
+    def __init__(self, path: QPainterPath, color: str, parent=None):
+        super().__init__(parent)
+        self._path = path # 그릴 경로 (DataViewWidget이 통화별로 캐시)
+        self._pen = QPen(QColor(color), 1.5) # 선 색상 및 두께
+        self.setFixedSize(SPARKLINE_WIDTH, SPARKLINE_HEIGHT)
+
+    def paintEvent(self, event):
+        if self._path.isEmpty():
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._pen)
+        painter.drawPath(self._path)
+        painter.end()
+
 
 class ExchangeRateTableModel(QAbstractTableModel):
     def __init__(self, data: list[ExchangeRate]):
@@ -71,17 +124,60 @@ class ExchangeRateTableModel(QAbstractTableModel):
 
 
 
+class CurrencyAnalyticsTableModel(QAbstractTableModel):
+    """
+    이동 구간별 분석 결과를 표시하는 테이블 모델입니다. 행은 이동 구간, 열은 분석 항목입니다.
+    """
+    def __init__(self, data: list[CurrencyAnalytics]):
+        super().__init__()
+        self._data = data
+        self._headers = ["이동 평균", "연율화 변동성", "전일 대비", "전일 대비(%)"]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._data)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self._headers)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            item = self._data[index.row()]
+            column = index.column()
+            # 계산할 수 없는 값(NaN)은 "-"로 표시
+            if column == 0: return self._format(item.moving_average, "{:,.2f}")
+            if column == 1: return self._format(item.volatility * 100, "{:.2f}%")
+            if column == 2: return self._format(item.change, "{:+,.2f}")
+            if column == 3: return self._format(item.change_pct, "{:+.2f}%")
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            if orientation == Qt.Horizontal:
+                return self._headers[section]
+            elif orientation == Qt.Vertical and 0 <= section < len(self._data):
+                return f"{self._data[section].window}일"
+        return None
+
+    @staticmethod
+    def _format(value: float, pattern: str) -> str:
+        return "-" if value != value else pattern.format(value) # NaN은 자기 자신과 같지 않음
+
+
 class ExchangeRateDetailDialog(QDialog):
     """
     특정 환율 정보의 상세 내용을 테이블 형태로 표시하는 다이얼로그 클래스입니다.
     """
-    def __init__(self, exchange_rates: list[ExchangeRate], parent=None):
+    def __init__(self, exchange_rates: list[ExchangeRate], parent=None,
+                 analytics: list[CurrencyAnalytics] | None = None,
+                 correlations: list[tuple[str, float]] | None = None):
         """
         ExchangeRateDetailDialog의 생성자입니다.
 
         Args:
             exchange_rates (list[ExchangeRate]): 상세 정보를 표시할 ExchangeRate 객체 리스트.
             parent (QWidget, optional): 부모 위젯. 기본값은 None.
+            analytics (list[CurrencyAnalytics], optional): 이동 구간별 분석 결과. 기본값은 None (표시하지 않음).
+            correlations (list[tuple[str, float]], optional): (통화 코드, 상관계수) 리스트. 기본값은 None (표시하지 않음).
         """
         super().__init__(parent) # QDialog의 생성자 호출
         self.setWindowTitle("환율 정보") # 다이얼로그 제목 설정
@@ -99,6 +195,21 @@ class ExchangeRateDetailDialog(QDialog):
 
         layout.addWidget(self.table_view) # 레이아웃에 테이블 뷰 추가
 
+        # 환율 이력 분석 결과가 있으면 이동 구간별 분석 테이블을 추가로 표시
+        if analytics:
+            as_of = analytics[0].as_of
+            layout.addWidget(QLabel(f"이력 분석 ({as_of[:4]}-{as_of[4:6]}-{as_of[6:]} 기준)"))
+            self.analytics_view = QTableView()
+            self.analytics_model = CurrencyAnalyticsTableModel(analytics)
+            self.analytics_view.setModel(self.analytics_model)
+            self.analytics_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            layout.addWidget(self.analytics_view)
+
+        # 다른 통화와의 상관계수는 상위 5개만 한 줄로 표시
+        if correlations:
+            text = ", ".join(f"{code} {value:+.2f}" for code, value in correlations[:5])
+            layout.addWidget(QLabel(f"일간 수익률 상관계수: {text}"))
+
         close_button = QPushButton("닫기") # "닫기" 버튼 생성
         close_button.clicked.connect(self.accept) # 버튼 클릭 시 다이얼로그 닫기
         layout.addWidget(close_button) # 레이아웃에 닫기 버튼 추가
@@ -111,7 +222,8 @@ class CurrencyRateWidget(QWidget):
     """
     clicked = Signal(str) # 위젯이 클릭될 때 통화 코드를 전달하는 시그널
 
-    def __init__(self, currency_code: str, currency_name: str, deal_bas_r: str, parent=None):
+    def __init__(self, currency_code: str, currency_name: str, deal_bas_r: str, parent=None,
+                 sparkline: QPainterPath | None = None, change: float = float('nan'), change_pct: float = float('nan')):
         """
         CurrencyRateWidget의 생성자입니다.
 
@@ -120,6 +232,9 @@ class CurrencyRateWidget(QWidget):
             currency_name (str): 통화명 (예: "미국 달러").
             deal_bas_r (str): 매매 기준율.
             parent (QWidget, optional): 부모 위젯. 기본값은 None.
+            sparkline (QPainterPath, optional): 최근 환율 꺾은선 경로. 기본값은 None (그리지 않음).
+            change (float, optional): 직전 값 대비 변동. 기본값은 NaN (표시하지 않음).
+            change_pct (float, optional): 직전 값 대비 변동률(%). 기본값은 NaN.
         """
         super().__init__(parent) # QWidget의 생성자 호출
         self.currency_code = currency_code # 통화 코드 저장
@@ -128,7 +243,9 @@ class CurrencyRateWidget(QWidget):
 
         self.setFixedSize(180, 120) # 위젯의 고정 크기 설정
         # 위젯의 스타일 시트 설정 (배경색, 테두리, 모서리 둥글게)
-        self.setStyleSheet("background-color: white; border: 1px solid #ccc; border-radius: 5px;")
+        # 라벨과 스파크라인이 한 상자 안에 보이도록 타일 자체가 배경과 테두리를 그립니다.
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setStyleSheet("CurrencyRateWidget { background-color: white; border: 1px solid #ccc; border-radius: 5px; }")
 
         layout = QVBoxLayout(self) # 위젯의 메인 레이아웃을 수직 레이아웃으로 설정
         layout.setAlignment(Qt.AlignCenter) # 레이아웃 내용을 중앙 정렬
@@ -139,7 +256,7 @@ class CurrencyRateWidget(QWidget):
         self.info_label = QLabel()
         self.info_label.setAlignment(Qt.AlignCenter) # 라벨 텍스트 중앙 정렬
         self.info_label.setWordWrap(False) # 자동 줄바꿈 비활성화
-        self.info_label.setFixedSize(178, 118) # 라벨의 고정 크기 설정 (위젯 테두리 1px 고려)
+        self.info_label.setFixedSize(178, 118 - SPARKLINE_HEIGHT) # 라벨의 고정 크기 설정 (위젯 테두리 1px와 스파크라인 영역 고려)
 
         # 폰트 설정
         font_code = QFont() # 통화 코드용 폰트
@@ -147,17 +264,26 @@ class CurrencyRateWidget(QWidget):
         font_code.setBold(True)
 
         font_rate = QFont() # 환율 값용 폰트
-        font_rate.setPointSize(28)
+        font_rate.setPointSize(22)
         font_rate.setBold(True)
 
         font_name = QFont() # 통화명용 폰트
         font_name.setPointSize(10)
 
+        # 직전 값 대비 변동 표시 (상승 ▲ 빨간색, 하락 ▼ 파란색)
+        trend_color = FLAT_COLOR
+        change_html = ""
+        if change == change: # NaN은 자기 자신과 같지 않음
+            trend_color = RISE_COLOR if change > 0 else FALL_COLOR if change < 0 else FLAT_COLOR
+            arrow = "▲" if change > 0 else "▼" if change < 0 else "-"
+            change_html = (f' <span style="font-size:{font_name.pointSize()}pt; font-weight:normal; color:{trend_color};">'
+                           f'{arrow} {change_pct:+.2f}%</span>')
+
         # HTML을 사용하여 라벨에 텍스트와 스타일을 적용
-        # 매매 기준율은 큰 글씨, 통화 코드는 작게, 통화명은 더 작게 표시
+        # 매매 기준율은 큰 글씨, 통화 코드와 변동은 작게, 통화명은 더 작게 표시
         html_text = f"""
         <div style="text-align:center;">
-            <div style="font-size:{font_code.pointSize()}pt; font-weight:bold;">{self.currency_code}</div>
+            <div style="font-size:{font_code.pointSize()}pt; font-weight:bold;">{self.currency_code}{change_html}</div>
             <div style="font-size:{font_rate.pointSize()}pt; font-weight:bold;">{self.deal_bas_r}</div>
             <div style="font-size:{font_name.pointSize()}pt;">{self.currency_name}</div>
         </div>
@@ -168,6 +294,10 @@ class CurrencyRateWidget(QWidget):
 
         layout.addWidget(self.info_label) # 레이아웃에 정보 라벨 추가
 
+        # 최근 환율 꺾은선 (경로는 DataViewWidget이 통화별로 캐시하여 전달)
+        self.sparkline = SparklineWidget(sparkline if sparkline is not None else QPainterPath(), trend_color)
+        layout.addWidget(self.sparkline, 0, Qt.AlignHCenter)
+
     def mousePressEvent(self, event: QMouseEvent):
         """
         위젯에 마우스 클릭 이벤트가 발생했을 때 호출됩니다.
@@ -197,6 +327,8 @@ class DataViewWidget(QWidget):
         super().__init__(parent) # QWidget의 생성자 호출
         self.viewmodel = viewmodel # 뷰모델 인스턴스 저장
         self._updating_ui = False # UI 업데이트 중인지 나타내는 플래그 (불필요한 다이얼로그 열림 방지)
+        # 통화 코드 → (링 버퍼 버전, 스파크라인 경로). 타일은 새로고침마다 다시 만들지만 경로는 값이 바뀔 때만 다시 계산
+        self._sparkline_cache: dict[str, tuple[int, QPainterPath]] = {}
 
         main_layout = QVBoxLayout(self) # 위젯의 메인 레이아웃을 수직 레이아웃으로 설정
 
@@ -210,9 +342,11 @@ class DataViewWidget(QWidget):
         # 하단 상태 및 새로고침 영역
         bottom_layout = QHBoxLayout() # 하단 위젯들을 수평으로 배치할 레이아웃 생성
         self.status_label = QLabel("준비") # 상태 메시지를 표시할 라벨
+        self.quota_label = QLabel() # 남은 API 할당량을 표시할 라벨
         self.refresh_button = QPushButton("새로고침") # 새로고침 버튼
         bottom_layout.addWidget(self.status_label) # 레이아웃에 상태 라벨 추가
         bottom_layout.addStretch() # 상태 라벨과 버튼 사이에 공간 확장
+        bottom_layout.addWidget(self.quota_label) # 레이아웃에 할당량 라벨 추가
         bottom_layout.addWidget(self.refresh_button) # 레이아웃에 새로고침 버튼 추가
 
         main_layout.addLayout(bottom_layout) # 메인 레이아웃에 하단 레이아웃 추가
@@ -222,6 +356,8 @@ class DataViewWidget(QWidget):
         self.viewmodel.exchange_rates_changed.connect(self.update_exchange_rates)
         # ViewModel의 status_changed 시그널이 발생하면 status_label의 텍스트 업데이트
         self.viewmodel.status_changed.connect(self.status_label.setText)
+        # ViewModel의 quota_changed 시그널이 발생하면 update_quota 슬롯 호출
+        self.viewmodel.quota_changed.connect(self.update_quota)
         # 새로고침 버튼 클릭 시 ViewModel의 fetch_exchange_rates 슬롯 호출
         self.refresh_button.clicked.connect(self.viewmodel.fetch_exchange_rates)
 
@@ -235,20 +371,29 @@ class DataViewWidget(QWidget):
         """
         self._updating_ui = True # UI 업데이트 시작 플래그 설정
         # 기존 그리드 레이아웃의 모든 위젯을 역순으로 제거
+        # itemAt()으로 얻은 레이아웃 항목은 Qt가 내부적으로 삭제해도 파이썬 래퍼가 남아 있을 수 있으므로,
+        # takeAt()으로 항목의 소유권을 넘겨받은 뒤 위젯을 삭제합니다.
         for i in reversed(range(self.rates_grid_layout.count())):
-            widget_to_remove = self.rates_grid_layout.itemAt(i).widget()
+            item = self.rates_grid_layout.takeAt(i)
+            widget_to_remove = item.widget()
             if widget_to_remove:
-                widget_to_remove.setParent(None) # 부모 위젯에서 분리
+                widget_to_remove.hide() # 삭제되기 전까지 화면에 남지 않도록 숨김
                 widget_to_remove.deleteLater() # 위젯 삭제 예약
 
         if rates: # 환율 데이터가 있을 경우
             row, col = 0, 0 # 그리드 레이아웃의 시작 위치
             for rate in rates:
                 if rate.result == 1: # 결과 코드가 1 (성공)인 경우에만 표시
+                    values, path = self._sparkline(rate.cur_unit)
+                    change = float(values[-1] - values[-2]) if len(values) >= 2 else float('nan')
+                    change_pct = change / float(values[-2]) * 100 if len(values) >= 2 and values[-2] else float('nan')
                     currency_widget = CurrencyRateWidget(
                         currency_code=rate.cur_unit,
                         currency_name=rate.cur_nm,
-                        deal_bas_r=rate.deal_bas_r
+                        deal_bas_r=rate.deal_bas_r,
+                        sparkline=path,
+                        change=change,
+                        change_pct=change_pct,
                     ) # CurrencyRateWidget 인스턴스 생성
                     # CurrencyRateWidget 클릭 시 _show_detail_dialog_for_currency 슬롯 호출
                     currency_widget.clicked.connect(self._show_detail_dialog_for_currency)
@@ -259,6 +404,27 @@ class DataViewWidget(QWidget):
                         row += 1 # 다음 행으로 이동
         self._updating_ui = False # UI 업데이트 종료 플래그 설정
 
+    def _sparkline(self, currency_code: str) -> tuple[np.ndarray, QPainterPath]:
+        """
+        통화의 최근 값과 스파크라인 경로를 반환합니다. 링 버퍼 버전이 그대로이면 캐시된 경로를 사용합니다.
+        """
+        values, version = self.viewmodel.get_sparkline(currency_code)
+        cached = self._sparkline_cache.get(currency_code)
+        if cached is None or cached[0] != version:
+            cached = (version, build_sparkline_path(values))
+            self._sparkline_cache[currency_code] = cached
+        return values, cached[1]
+
+    def update_quota(self, remaining: int, limit: int):
+        """
+        남은 API 할당량을 하단 라벨에 표시합니다.
+
+        Args:
+            remaining (int): 오늘 남은 요청 수.
+            limit (int): 하루 최대 요청 수.
+        """
+        self.quota_label.setText(f"남은 API 할당량: {remaining}/{limit}")
+
     def _show_detail_dialog_for_currency(self, currency_code: str):
         """
         특정 통화 위젯이 클릭되었을 때 해당 통화의 상세 정보를 다이얼로그로 표시합니다.
@@ -272,7 +438,12 @@ class DataViewWidget(QWidget):
         # ViewModel의 _all_exchange_rates에서 클릭된 통화 코드에 해당하는 환율 정보 찾기
         selected_rate = next((r for r in self.viewmodel._all_exchange_rates if r.cur_unit == currency_code), None)
         if selected_rate: # 해당 환율 정보가 존재하면
-            dialog = ExchangeRateDetailDialog([selected_rate], self) # 상세 다이얼로그 생성 (단일 통화 정보 전달)
+            # 상세 다이얼로그 생성 (단일 통화 정보와 이력 분석 결과 전달)
+            dialog = ExchangeRateDetailDialog(
+                [selected_rate], self,
+                analytics=self.viewmodel.get_currency_analytics(currency_code),
+                correlations=self.viewmodel.get_currency_correlations(currency_code)
+            )
             dialog.exec() # 다이얼로그 실행 (모달)
         else:
             # 환율 정보를 찾을 수 없을 경우 상태 라벨에 메시지 표시
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+from PySide6.QtWidgets import (
+    QWidget,         # 기본 위젯 클래스
+    QVBoxLayout,     # 수직 레이아웃
+    QTableView,      # 테이블 형태로 데이터를 표시하는 위젯
+    QLabel,          # 텍스트 라벨 위젯
+    QHeaderView,     # 테이블 헤더 뷰
+)
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex # Qt.DisplayRole, QAbstractTableModel 등을 위해 사용
+
+
+class InterestRateTableModel(QAbstractTableModel):
+    """
+    금리 데이터 객체 리스트를 테이블로 표시하는 모델입니다.
+    행은 데이터 항목, 열은 지정한 필드입니다. 대출금리(AP02)와 국제금리(AP03)에 함께 사용합니다.
+    """
+    def __init__(self, headers: list[str], fields: list[str]):
+        super().__init__()
+        self._headers = headers # 열 제목
+        self._fields = fields   # 각 열에 표시할 데이터 객체의 속성 이름
+        self._data = []
+
+    def set_rates(self, rates: list):
+        """
+        표시할 데이터를 교체하고 뷰를 갱신합니다.
+        """
+        self.beginResetModel()
+        self._data = list(rates)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._data)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self._fields)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return getattr(self._data[index.row()], self._fields[index.column()])
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+
+class InterestRateViewWidget(QWidget):
+    """
+    금리 정보를 테이블로 표시하는 뷰 위젯입니다.
+    MVVM 아키텍처에서 View의 역할을 담당하며, ViewModel의 시그널을 받아 update_rates로 갱신됩니다.
+    """
+    def __init__(self, title: str, headers: list[str], fields: list[str], parent=None):
+        """
+        InterestRateViewWidget의 생성자입니다.
+
+        Args:
+            title (str): 테이블 위에 표시할 제목.
+            headers (list[str]): 열 제목 리스트.
+            fields (list[str]): 각 열에 표시할 데이터 객체의 속성 이름 리스트.
+            parent (QWidget, optional): 부모 위젯. 기본값은 None.
+        """
+        super().__init__(parent) # QWidget의 생성자 호출
+
+        layout = QVBoxLayout(self) # 위젯의 메인 레이아웃을 수직 레이아웃으로 설정
+        layout.addWidget(QLabel(title)) # 제목 라벨 추가
+
+        self.table_model = InterestRateTableModel(headers, fields) # 금리 테이블 모델 생성
+        self.table_view = QTableView() # QTableView 인스턴스 생성
+        self.table_view.setModel(self.table_model) # 테이블 뷰에 모델 설정
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch) # 열 너비를 뷰에 맞춤
+        layout.addWidget(self.table_view) # 레이아웃에 테이블 뷰 추가
+
+        self.empty_label = QLabel("표시할 금리 정보가 없습니다.") # 데이터가 없을 때 표시할 라벨
+        layout.addWidget(self.empty_label)
+
+    def update_rates(self, rates: list):
+        """
+        ViewModel로부터 받은 금리 데이터로 테이블을 갱신합니다.
+
+        Args:
+            rates (list): LoanInterestRate 또는 InternationalInterestRate 객체 리스트.
+        """
+        self.table_model.set_rates(rates)
+        self.empty_label.setVisible(not rates) # 데이터가 없을 때만 안내 라벨 표시
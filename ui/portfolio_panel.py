@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+from PySide6.QtWidgets import (
+    QWidget,         # 기본 위젯 클래스
+    QVBoxLayout,     # 수직 레이아웃
+    QHBoxLayout,     # 수평 레이아웃
+    QGridLayout,     # 합계 항목을 표 형태로 배치하기 위한 레이아웃
+    QTableView,      # 테이블 형태로 데이터를 표시하는 위젯
+    QLabel,          # 텍스트 라벨 위젯
+    QPushButton,     # 버튼 위젯
+    QHeaderView,     # 테이블 헤더 뷰
+    QFileDialog,     # 보유 내역 파일 선택 다이얼로그
+)
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex # Qt.DisplayRole, QAbstractTableModel 등을 위해 사용
+from PySide6.QtGui import QColor # 손익 색상 표시를 위해 사용
+
+# 프로젝트의 다른 부분에서 정의된 클래스들을 임포트합니다.
+from service.portfolio import CurrencyPosition, PortfolioValuation # 포트폴리오 평가 결과
+from viewmodel.portfolio_viewmodel import PortfolioViewModel # 포트폴리오 평가 뷰모델
+
+PROFIT_COLOR = "#d32f2f" # 이익 표시 색상 (국내 관례에 따라 빨간색)
+LOSS_COLOR = "#1976d2"   # 손실 표시 색상 (파란색)
+
+
+def pnl_color(value: float) -> str | None:
+    """
+    손익 값에 맞는 표시 색상을 반환합니다. 0이면 None.
+    """
+    if value > 0:
+        return PROFIT_COLOR
+    if value < 0:
+        return LOSS_COLOR
+    return None
+
+
+class CurrencyPositionTableModel(QAbstractTableModel):
+    """
+    통화별 평가 결과를 표시하는 테이블 모델입니다. 행은 통화, 열은 평가 항목입니다.
+    """
+    def __init__(self):
+        super().__init__()
+        self._data: list[CurrencyPosition] = []
+        self._headers = ["통화", "보유 건수", "외화 금액", "원화 평가액", "전일 대비 손익"]
+
+    def set_positions(self, positions: list[CurrencyPosition]):
+        """
+        표시할 데이터를 교체하고 뷰를 갱신합니다.
+        """
+        self.beginResetModel()
+        self._data = list(positions)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._data)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self._headers)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        item = self._data[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0: return item.currency
+            if column == 1: return f"{item.holdings:,}"
+            if column == 2: return f"{item.amount:,.2f}"
+            if column == 3: return f"{item.value:,.0f}"
+            if column == 4: return f"{item.pnl:+,.0f}"
+        if role == Qt.TextAlignmentRole and column > 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter) # 숫자는 오른쪽 정렬
+        if role == Qt.ForegroundRole and column == 4:
+            color = pnl_color(item.pnl)
+            return QColor(color) if color else None
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+
+class PortfolioPanelWidget(QWidget):
+    """
+    외화 보유 내역의 원화 평가 합계와 통화별 평가 결과를 표시하는 뷰 위젯입니다.
+    MVVM 아키텍처에서 View의 역할을 담당하며, PortfolioViewModel의 시그널을 받아 갱신됩니다.
+    """
+    def __init__(self, viewmodel: PortfolioViewModel, parent=None):
+        """
+        PortfolioPanelWidget의 생성자입니다.
+
+        Args:
+            viewmodel (PortfolioViewModel): 연결할 뷰모델 인스턴스.
+            parent (QWidget, optional): 부모 위젯. 기본값은 None.
+        """
+        super().__init__(parent) # QWidget의 생성자 호출
+        self.viewmodel = viewmodel # 뷰모델 인스턴스 저장
+
+        layout = QVBoxLayout(self) # 위젯의 메인 레이아웃을 수직 레이아웃으로 설정
+
+        # 합계 영역: 항목 이름과 값을 두 줄로 배치
+        totals_layout = QGridLayout()
+        self.total_value_label = QLabel("-") # 매매 기준율 기준 평가액
+        self.total_bid_label = QLabel("-")   # 외화를 팔 때(ttb) 기준 평가액
+        self.total_ask_label = QLabel("-")   # 외화를 살 때(tts) 기준 평가액
+        self.pnl_label = QLabel("-")         # 전일 대비 손익
+        for column, (title, label) in enumerate([
+            ("원화 평가액 (매매 기준율)", self.total_value_label),
+            ("받으실 때 (ttb)", self.total_bid_label),
+            ("보내실 때 (tts)", self.total_ask_label),
+            ("전일 대비 손익", self.pnl_label),
+        ]):
+            totals_layout.addWidget(QLabel(title), 0, column)
+            label.setStyleSheet("font-size: 16pt; font-weight: bold;")
+            totals_layout.addWidget(label, 1, column)
+        layout.addLayout(totals_layout)
+
+        self.date_label = QLabel() # 환율 기준일 및 전일 기준일 표시
+        layout.addWidget(self.date_label)
+
+        self.table_model = CurrencyPositionTableModel() # 통화별 평가 테이블 모델 생성
+        self.table_view = QTableView() # QTableView 인스턴스 생성
+        self.table_view.setModel(self.table_model) # 테이블 뷰에 모델 설정
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch) # 열 너비를 뷰에 맞춤
+        layout.addWidget(self.table_view) # 레이아웃에 테이블 뷰 추가
+
+        # 하단 상태 및 보유 내역 불러오기 영역
+        bottom_layout = QHBoxLayout()
+        self.status_label = QLabel(f"보유 내역 {len(viewmodel.portfolio):,}건")
+        self.import_button = QPushButton("보유 내역 불러오기")
+        bottom_layout.addWidget(self.status_label)
+        bottom_layout.addStretch()
+        bottom_layout.addWidget(self.import_button)
+        layout.addLayout(bottom_layout)
+
+        # --- ViewModel과 View 연결 (데이터 바인딩) ---
+        self.viewmodel.valuation_changed.connect(self.update_valuation)
+        self.viewmodel.status_changed.connect(self.status_label.setText)
+        self.import_button.clicked.connect(self._choose_holdings_file)
+
+    def update_valuation(self, valuation: PortfolioValuation):
+        """
+        ViewModel로부터 받은 평가 결과로 합계와 통화별 테이블을 갱신합니다.
+
+        Args:
+            valuation (PortfolioValuation): 평가 결과.
+        """
+        self.total_value_label.setText(f"{valuation.total_value:,.0f}원")
+        self.total_bid_label.setText(f"{valuation.total_bid:,.0f}원")
+        self.total_ask_label.setText(f"{valuation.total_ask:,.0f}원")
+        self.pnl_label.setText(f"{valuation.pnl:+,.0f}원 ({valuation.pnl_pct:+.2f}%)")
+        color = pnl_color(valuation.pnl)
+        self.pnl_label.setStyleSheet(
+            f"font-size: 16pt; font-weight: bold;{f' color: {color};' if color else ''}"
+        )
+
+        text = f"환율 기준일: {valuation.rate_date or '-'}"
+        text += f" · 비교 기준일: {valuation.previous_date}" if valuation.previous_date else " · 전일 환율 이력 없음"
+        if valuation.unpriced:
+            text += f" · 환율 없음: {', '.join(valuation.unpriced)}"
+        self.date_label.setText(text)
+        self.table_model.set_positions(valuation.positions)
+
+    def _choose_holdings_file(self):
+        """
+        보유 내역 CSV 파일을 선택하여 ViewModel에 불러오기를 요청합니다.
+        """
+        path, _ = QFileDialog.getOpenFileName(self, "보유 내역 불러오기", "", "CSV 파일 (*.csv)")
+        if path:
+            self.viewmodel.import_holdings(path)
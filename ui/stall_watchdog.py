@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import os # 프로젝트 파일 경로 판별을 위해 사용
+import sys # 메인(GUI) 스레드의 현재 스택을 가져오기 위해 사용
+import threading # GUI 스레드와 별도로 멈춤을 감시하는 스레드를 위해 사용
+import time # 하트비트 간격과 멈춤 시간 측정을 위해 사용
+import traceback # 스택 프레임을 파일/줄/함수 정보로 변환하기 위해 사용
+from dataclasses import dataclass, field # 스택별 멈춤 통계를 담는 데이터 클래스를 만들기 위해 사용
+
+from PySide6.QtCore import QObject, QTimer, Qt # GUI 스레드에서 주기적으로 실행되는 하트비트 타이머
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # 프로젝트 코드 판별 기준 경로
+STALL_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000) # 멈춤 시간 히스토그램 구간 경계 (밀리초)
+MAX_STACK_DEPTH = 30 # 보고서에 남길 스택 프레임 수 (안쪽부터)
+
+
+def bucket_labels() -> list[str]:
+    """
+    STALL_BUCKETS_MS 구간의 표시 이름을 반환합니다. 예: ["<100ms", "100-250ms", ..., "≥5000ms"]
+    """
+    edges = STALL_BUCKETS_MS
+    labels = [f"<{edges[0]}ms"]
+    labels += [f"{low}-{high}ms" for low, high in zip(edges, edges[1:])]
+    labels.append(f"≥{edges[-1]}ms")
+    return labels
+
+
+def bucket_index(duration_ms: float) -> int:
+    """
+    멈춤 시간이 속하는 히스토그램 구간 번호를 반환합니다.
+    """
+    for index, edge in enumerate(STALL_BUCKETS_MS):
+        if duration_ms < edge:
+            return index
+    return len(STALL_BUCKETS_MS)
+
+
+@dataclass
+class StallStats:
+    """
+    같은 호출 위치에서 발생한 멈춤의 통계를 담는 데이터 클래스입니다.
+    """
+    count: int = 0          # 멈춤 횟수
+    total_ms: float = 0.0   # 멈춤 시간 합계 (밀리초)
+    max_ms: float = 0.0     # 가장 긴 멈춤 시간 (밀리초)
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(STALL_BUCKETS_MS) + 1)) # 구간별 멈춤 횟수
+    sample_stack: list[str] = field(default_factory=list) # 처음 확보한 전체 스택 (보고서 표시용)
+
+    def add(self, duration_ms: float):
+        """
+        멈춤 한 번을 통계에 더합니다.
+        """
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[bucket_index(duration_ms)] += 1
+
+
+class StallWatchdog(QObject):
+    """
+    GUI 이벤트 루프 멈춤(jank)을 감지하는 감시 도구입니다.
+    GUI 스레드의 하트비트 타이머가 제때 실행되지 않으면, 감시 스레드가 그 순간 메인 스레드의 파이썬 스택을 확보합니다.
+    멈춤은 스택 중 프로젝트 코드 부분(호출 위치)별로 모아 멈춤 시간 히스토그램을 만들고, 종료 시 합계 순으로 보고합니다.
+    """
+    def __init__(self, threshold_ms: float = 200.0, interval_ms: int = 50,
+                 report_path: str | None = 'stall_report.txt', parent=None):
+        """
+        StallWatchdog의 생성자입니다. GUI 스레드에서 생성해야 합니다.
+
+        Args:
+            threshold_ms (float, optional): 멈춤으로 기록할 최소 지연 시간(밀리초). 기본값은 200.
+            interval_ms (int, optional): 하트비트 간격(밀리초). 기본값은 50.
+            report_path (str, optional): 종료 시 보고서를 저장할 파일 경로. None이면 저장하지 않습니다. 기본값은 'stall_report.txt'.
+            parent (QObject, optional): 부모 객체. 기본값은 None.
+        """
+        super().__init__(parent) # QObject의 생성자 호출
+        self.threshold = threshold_ms / 1000.0 # 멈춤 판단 기준 (초)
+        self.interval = interval_ms / 1000.0 # 하트비트 간격 (초)
+        self.report_path = report_path # 보고서 파일 경로
+        self.stats: dict[tuple, StallStats] = {} # 호출 위치 → 멈춤 통계
+        self._gui_thread_id = threading.get_ident() # 스택을 확보할 GUI 스레드
+        self._lock = threading.Lock() # 하트비트 시각과 확보한 스택 보호용 락
+        self._last_beat = time.monotonic() # 마지막 하트비트 시각
+        self._pending: tuple[float, tuple, list[str]] | None = None # (멈춤 직전 하트비트 시각, 호출 위치, 전체 스택)
+        self._stop_event = threading.Event() # 감시 스레드 종료 요청
+        self._monitor: threading.Thread | None = None # 감시 스레드
+
+        self._timer = QTimer(self) # GUI 스레드에서 실행되는 하트비트 타이머
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._beat)
+
+    @property
+    def stall_count(self) -> int:
+        """
+        지금까지 기록한 멈춤 횟수를 반환합니다.
+        """
+        return sum(stats.count for stats in self.stats.values())
+
+    def start(self):
+        """
+        하트비트 타이머와 감시 스레드를 시작합니다.
+        이벤트 루프가 시작되기 전에 호출하면 시작 과정의 멈춤도 기록됩니다.
+        """
+        if self._monitor is not None:
+            return
+        with self._lock:
+            self._last_beat = time.monotonic()
+        self._stop_event.clear()
+        self._monitor = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._monitor.start()
+        self._timer.start()
+
+    def stop(self):
+        """
+        감시를 멈추고 보고서를 출력 및 저장합니다. 애플리케이션 종료 시 호출합니다.
+        """
+        if self._monitor is None:
+            return
+        self._timer.stop()
+        self._stop_event.set()
+        self._monitor.join(timeout=1.0)
+        self._monitor = None
+        report = self.report()
+        print(report)
+        if self.report_path:
+            try:
+                with open(self.report_path, 'w', encoding='utf-8') as f:
+                    f.write(report)
+            except OSError as e:
+                print(f"멈춤 보고서를 저장하는 중 오류 발생: {e}")
+
+    def _beat(self):
+        """
+        GUI 스레드의 하트비트입니다. 예정보다 늦게 실행된 만큼을 멈춤 시간으로 보고, 기준 이상이면 기록합니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            previous, self._last_beat = self._last_beat, now
+            pending, self._pending = self._pending, None
+        delay = now - previous - self.interval # 타이머가 예정보다 늦은 시간
+        if delay < self.threshold:
+            return
+        if pending is not None and pending[0] == previous:
+            _, location, stack = pending
+        else:
+            location, stack = ("(스택 미확보)",), [] # 감시 스레드가 확인하기 전에 멈춤이 끝난 경우
+        self._record(location, stack, delay * 1000.0)
+
+    def _watch(self):
+        """
+        감시 스레드의 본체입니다. 하트비트가 기준 시간 이상 멈추면 멈춤마다 한 번씩 GUI 스레드의 스택을 확보합니다.
+        """
+        poll = min(self.interval, self.threshold) / 2 # 기준 시간보다 촘촘하게 확인
+        while not self._stop_event.wait(poll):
+            with self._lock:
+                last_beat = self._last_beat
+                captured = self._pending is not None and self._pending[0] == last_beat
+            if captured or time.monotonic() - last_beat - self.interval < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._gui_thread_id)
+            if frame is None:
+                continue
+            frames = traceback.extract_stack(frame)[-MAX_STACK_DEPTH:]
+            del frame # 프레임 참조를 오래 잡아 두지 않음
+            location = self._project_location(frames)
+            stack = [f"{entry.filename}:{entry.lineno} {entry.name}" for entry in frames]
+            with self._lock:
+                if self._last_beat == last_beat: # 확보하는 사이에 멈춤이 끝나지 않았을 때만 사용
+                    self._pending = (last_beat, location, stack)
+
+    @staticmethod
+    def _project_location(frames: traceback.StackSummary) -> tuple:
+        """
+        스택에서 프로젝트 코드 프레임만 골라 호출 위치로 사용합니다.
+        라이브러리 내부(소켓, XML 등)에서 멈춘 위치가 매번 달라도 같은 호출 위치로 모을 수 있습니다.
+        """
+        location = tuple(
+            f"{os.path.relpath(entry.filename, PROJECT_ROOT)}:{entry.lineno} {entry.name}"
+            for entry in frames
+            if entry.filename.startswith(PROJECT_ROOT) and "site-packages" not in entry.filename
+        )
+        return location or (f"{frames[-1].filename}:{frames[-1].lineno} {frames[-1].name}",)
+
+    def _record(self, location: tuple, stack: list[str], duration_ms: float):
+        """
+        멈춤 한 번을 호출 위치별 통계에 기록하고 한 줄로 출력합니다.
+        """
+        stats = self.stats.get(location)
+        if stats is None:
+            stats = StallStats(sample_stack=stack)
+            self.stats[location] = stats
+        stats.add(duration_ms)
+        print(f"UI 멈춤 {duration_ms:.0f}ms: {location[-1]}")
+
+    def report(self, top: int = 10) -> str:
+        """
+        멈춤 시간 합계가 큰 호출 위치 순으로 멈춤 보고서를 만듭니다.
+
+        Args:
+            top (int, optional): 보고서에 포함할 호출 위치 수. 기본값은 10.
+
+        Returns:
+            str: 전체 히스토그램과 호출 위치별 통계, 대표 스택을 담은 보고서 문자열.
+        """
+        labels = bucket_labels()
+        ranked = sorted(self.stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+        total = StallStats()
+        for stats in self.stats.values():
+            total.count += stats.count
+            total.total_ms += stats.total_ms
+            total.max_ms = max(total.max_ms, stats.max_ms)
+            total.buckets = [a + b for a, b in zip(total.buckets, stats.buckets)]
+
+        def histogram(stats: StallStats) -> str:
+            return ", ".join(f"{label}: {count}" for label, count in zip(labels, stats.buckets) if count)
+
+        lines = [
+            f"UI 멈춤 보고서 (기준 {self.threshold * 1000:.0f}ms)",
+            f"전체: {total.count}회, 합계 {total.total_ms:.0f}ms, 최대 {total.max_ms:.0f}ms",
+        ]
+        if total.count:
+            lines.append(f"  분포: {histogram(total)}")
+        for rank, (location, stats) in enumerate(ranked[:top], start=1):
+            lines.append("")
+            lines.append(
+                f"#{rank} {location[-1]} — {stats.count}회, 합계 {stats.total_ms:.0f}ms, "
+                f"평균 {stats.total_ms / stats.count:.0f}ms, 최대 {stats.max_ms:.0f}ms"
+            )
+            lines.append(f"  분포: {histogram(stats)}")
+            lines.extend(f"    {frame}" for frame in stats.sample_stack or location)
+        return "\n".join(lines) + "\n"
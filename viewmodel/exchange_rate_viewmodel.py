@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 
 # 필요한 모듈들을 임포트합니다.
+import math # NaN 판별을 위해 사용
+import threading # 과거 이력 백필을 UI 스레드 밖에서 실행하기 위해 사용
 from PySide6.QtCore import QObject, Signal, Slot # PySide6의 시그널/슬롯 메커니즘을 위해 사용
-from service.exchange_rate_service import ExchangeRateService # 환율 데이터를 가져오는 서비스
+from service.exchange_rate_service import ExchangeRateService, PROBE_WAIT # 환율 데이터를 가져오는 서비스
 from service.settings_manager import SettingsManager         # 애플리케이션 설정을 저장/로드하는 매니저
-from model.exchange_rate_model import ExchangeRate # 환율 데이터 모델
+from service.rate_analytics import RateAnalytics, CurrencyAnalytics, DEFAULT_WINDOWS # 환율 이력 분석
+from service.circuit_breaker import BreakerState # API 서버 요청 차단 상태
+from service.rate_ring_buffer import RateRingBuffers # 통화별 최근 환율 링 버퍼 (스파크라인용)
+from model.exchange_rate_model import ExchangeRate, parse_rate # 환율 데이터 모델 및 환율 문자열 변환 함수
 
 
 class ExchangeRateViewModel(QObject):
@@ -19,6 +24,18 @@ class ExchangeRateViewModel(QObject):
     status_changed = Signal(str)
     # 사용 가능한 통화 목록 및 현재 가시성 설정이 변경될 때 View에 알리는 시그널
     available_currencies_changed = Signal(list, dict)
+    # 남은 API 할당량이 변경될 때 (남은 요청 수, 일일 한도)를 View에 알리는 시그널
+    quota_changed = Signal(int, int)
+    # 새로고침으로 환율을 새로 가져왔을 때 (표시 설정과 무관한) 전체 환율을 알리는 시그널
+    rates_refreshed = Signal(list)
+    # 대출금리(AP02) 데이터가 변경될 때 View에 알리는 시그널
+    loan_interest_rates_changed = Signal(list)
+    # 국제금리(AP03) 데이터가 변경될 때 View에 알리는 시그널
+    international_interest_rates_changed = Signal(list)
+    # 과거 환율 이력이 갱신되었을 때 View에 알리는 시그널 (추가된 날짜 수 전달)
+    history_updated = Signal(int)
+    # 백그라운드 재확인(revalidation)이 끝났을 때 가져온 환율을 UI 스레드로 전달하는 시그널 (실패 시 빈 리스트)
+    revalidation_finished = Signal(list)
 
     def __init__(self, service: ExchangeRateService, settings_manager: SettingsManager):
         """
@@ -35,6 +52,16 @@ class ExchangeRateViewModel(QObject):
         # settings.xml에서 이전에 저장된 통화 가시성 설정을 로드합니다.
         # 키: 통화 코드 (str), 값: 표시 여부 (bool)
         self._visible_currencies: dict[str, bool] = self._settings_manager.load_settings()
+        # 스케줄러가 요청을 보낼 때마다 남은 할당량을 View에 전달합니다.
+        self._service.scheduler.add_listener(self.quota_changed.emit)
+        self._analytics = RateAnalytics(self._service.history) # 환율 이력 분석기
+        # 타일에 표시할 통화별 최근 매매 기준율 (이력으로 채우고 새로고침마다 추가)
+        self._sparklines = RateRingBuffers()
+        self._sparklines.fill_from_history(self._service.history)
+        self.history_updated.connect(self._refresh_sparklines)
+        self._backfill_thread: threading.Thread | None = None # 실행 중인 과거 이력 백필 스레드
+        self._revalidate_thread: threading.Thread | None = None # 실행 중인 백그라운드 재확인 스레드
+        self.revalidation_finished.connect(self._on_revalidated)
 
     @property
     def exchange_rates(self) -> list[ExchangeRate]:
@@ -49,12 +76,90 @@ class ExchangeRateViewModel(QObject):
     @Slot() # PySide6 슬롯으로 등록하여 시그널과 연결 가능하게 함
     def fetch_exchange_rates(self):
         """
-        환율 데이터를 비동기적으로 가져오는 메서드입니다.
-        Service를 통해 데이터를 요청하고, 가져온 데이터를 처리하여 View에 업데이트를 알립니다.
+        환율 데이터를 가져오는 메서드입니다.
+        마지막으로 가져온 환율이 있으면 즉시 표시하고, 최신이 아니면 백그라운드에서 API로 다시 확인합니다.
+        (stale-while-revalidate) 표시할 데이터가 전혀 없을 때만 API 응답을 기다립니다.
         """
+        self._emit_quota() # 요청 전 현재 할당량 표시 (날짜가 바뀌어 초기화된 경우 포함)
+        cached = self._service.get_all_exchange_rates()
+        if cached and self._service.is_fresh():
+            # 유효 시간 안에 가져온 데이터는 API를 다시 호출하지 않습니다.
+            if self._all_exchange_rates is not cached:
+                self._apply_rates(cached)
+            self.status_changed.emit(self._freshness_message())
+            return
+        if cached:
+            if self._all_exchange_rates is not cached:
+                self._apply_rates(cached) # 이전 실행에서 저장한 환율 등을 먼저 표시
+            if self._service.breaker.state == BreakerState.OPEN:
+                # API 서버 요청이 차단된 동안에는 재확인하지 않고 오래된 데이터임을 알립니다.
+                self.status_changed.emit(f"{self._freshness_message()} · {self._failure_message()}")
+                return
+            self._start_revalidation()
+            return
+
         self.status_changed.emit("환율 정보를 가져오는 중...") # View에 상태 메시지 업데이트 요청
         rates = self._service.fetch_exchange_rates() # Service를 통해 환율 데이터 가져오기
+        if rates:
+            self._apply_rates(rates)
+            self.rates_refreshed.emit(rates) # 로컬 환율 서버 등 전체 환율이 필요한 구성 요소에 알림
+        self.status_changed.emit(self._failure_message() if not rates else self._freshness_message())
+
+    def wait_for_revalidation(self, timeout: float | None = None):
+        """
+        실행 중인 백그라운드 재확인이 끝날 때까지 기다립니다. 결과는 이벤트 루프가 처리할 때 반영됩니다.
+
+        Args:
+            timeout (float, optional): 최대 대기 시간(초). 기본값은 None (끝날 때까지).
+        """
+        if self._revalidate_thread is not None:
+            self._revalidate_thread.join(timeout)
+
+    def _start_revalidation(self):
+        """
+        백그라운드 스레드에서 API로 환율을 다시 가져옵니다. 이미 실행 중이면 새로 시작하지 않습니다.
+        """
+        if self._revalidate_thread is not None and self._revalidate_thread.is_alive():
+            return
+        self.status_changed.emit(self._freshness_message(revalidating=True))
+
+        def run():
+            # 다른 스레드에서 발생한 시그널은 UI 스레드로 전달되어 처리됩니다.
+            # 백필 스레드의 시험 요청과 겹치면 그 결과를 기다립니다. (UI 스레드가 아니므로 기다려도 화면은 멈추지 않음)
+            rates = self._service.fetch_exchange_rates(probe_wait=PROBE_WAIT)
+            self.revalidation_finished.emit(rates)
+            self._warm_analytics(rates) # 새로운 날짜의 분석 결과는 UI 스레드가 아닌 이 스레드에서 계산해 둠
+
+        self._revalidate_thread = threading.Thread(target=run, daemon=True)
+        self._revalidate_thread.start()
+
+    @Slot(list)
+    def _on_revalidated(self, rates: list):
+        """
+        백그라운드 재확인 결과를 반영합니다. 실패하면 화면의 환율을 지우지 않고 오래된 데이터임을 알립니다.
+
+        Args:
+            rates (list): 새로 가져온 환율 정보. 실패하면 빈 리스트.
+        """
+        self._emit_quota()
+        if rates:
+            self._apply_rates(rates)
+            self.rates_refreshed.emit(rates)
+            self.status_changed.emit(self._freshness_message())
+        elif self._all_exchange_rates:
+            self.status_changed.emit(f"{self._freshness_message()} · {self._failure_message()}")
+        else:
+            self.status_changed.emit(self._failure_message())
+
+    def _apply_rates(self, rates: list[ExchangeRate]):
+        """
+        환율 데이터를 저장하고 View에 전달합니다.
+        """
         self._all_exchange_rates = rates # 가져온 모든 환율 데이터를 저장
+        rates_date = self._service.exchange_rates_date
+        if rates_date:
+            for rate in rates:
+                self._sparklines.append(rate.cur_unit, rates_date, parse_rate(rate.deal_bas_r))
 
         # 애플리케이션 최초 로드 시, _visible_currencies가 비어있다면
         # 현재 가져온 모든 통화를 기본적으로 표시(True)하도록 설정하고 저장
@@ -65,11 +170,38 @@ class ExchangeRateViewModel(QObject):
 
         self._emit_filtered_rates() # 필터링된 환율 데이터 변경 시그널 발생
         self._emit_available_currencies() # 사용 가능한 통화 목록 변경 시그널 발생
+        # 환율과 함께 동시에 가져온 대출금리/국제금리 데이터를 각 View에 전달
+        self.loan_interest_rates_changed.emit(self._service.get_loan_interest_rates())
+        self.international_interest_rates_changed.emit(self._service.get_international_interest_rates())
 
-        if rates:
-            self.status_changed.emit(f"총 {len(rates)}개 환율 정보 로드 완료") # 성공 메시지
+    def _freshness_message(self, revalidating: bool = False) -> str:
+        """
+        현재 표시 중인 환율의 기준일과 신선도를 나타내는 상태 메시지를 만듭니다.
+        """
+        message = f"총 {len(self._all_exchange_rates)}개 환율 정보"
+        if self._service.exchange_rates_date:
+            message += f" ({self._service.exchange_rates_date} 기준)"
+        age = self._service.rates_age()
+        if age is None:
+            message += " · 저장된 데이터"
+        elif self._service.is_fresh():
+            message += f" · {int(age // 60)}분 전 갱신"
         else:
-            self.status_changed.emit("환율 정보를 가져오지 못했습니다.") # 실패 메시지
+            message += f" · 오래된 데이터 ({int(age // 60)}분 전 갱신)"
+        if revalidating:
+            message += " · 최신 정보 확인 중..."
+        return message
+
+    def _failure_message(self) -> str:
+        """
+        환율을 새로 가져오지 못한 이유를 나타내는 상태 메시지를 만듭니다.
+        """
+        breaker = self._service.breaker
+        if breaker.state == BreakerState.OPEN:
+            return f"API 서버 응답 없음 · {breaker.retry_in():.0f}초 후 다시 시도합니다."
+        if self._service.scheduler.remaining == 0:
+            return "오늘의 API 요청 할당량을 모두 사용했습니다." # 할당량 소진 메시지
+        return "환율 정보를 가져오지 못했습니다." # 실패 메시지
 
     @Slot(str, bool) # PySide6 슬롯으로 등록
     def set_currency_visibility(self, currency_code: str, is_visible: bool):
@@ -106,6 +238,102 @@ class ExchangeRateViewModel(QObject):
         self._emit_filtered_rates() # 필터링된 환율 데이터 변경 시그널 발생
         self._emit_available_currencies() # 사용 가능한 통화 목록 변경 시그널 발생 (UI 업데이트)
 
+    @Slot(int) # PySide6 슬롯으로 등록
+    def backfill_history(self, days: int):
+        """
+        과거 환율 이력을 백그라운드 스레드에서 가져옵니다.
+        완료되면 `history_updated` 시그널로 추가된 날짜 수를 알립니다.
+
+        Args:
+            days (int): 오늘부터 거슬러 올라갈 일수.
+        """
+        if self._backfill_thread is not None and self._backfill_thread.is_alive():
+            self.status_changed.emit("과거 환율 이력을 이미 가져오는 중입니다.")
+            return
+
+        def run():
+            before = len(self._service.history.dates())
+            self._service.backfill_history(days)
+            self._warm_analytics(self._service.get_all_exchange_rates()) # 이력이 바뀌었으므로 백필 스레드에서 다시 계산
+            # 다른 스레드에서 발생한 시그널은 UI 스레드로 전달되어 처리됩니다.
+            self.history_updated.emit(len(self._service.history.dates()) - before)
+
+        self.status_changed.emit(f"최근 {days}일 환율 이력을 가져오는 중...")
+        self._backfill_thread = threading.Thread(target=run, daemon=True)
+        self._backfill_thread.start()
+
+    def get_sparkline(self, currency_code: str) -> tuple:
+        """
+        특정 통화의 최근 매매 기준율을 오래된 것부터 순서대로 반환합니다.
+
+        Args:
+            currency_code (str): 통화 코드.
+
+        Returns:
+            tuple[np.ndarray, int]: (값 배열, 버전). 버전은 값이 바뀔 때마다 증가하므로 그리기 캐시 판단에 사용합니다.
+        """
+        return self._sparklines.series(currency_code)
+
+    @Slot(int)
+    def _refresh_sparklines(self, added: int):
+        """
+        과거 이력이 추가되면 링 버퍼를 이력으로 다시 채우고 타일을 갱신합니다.
+        """
+        if added:
+            self._sparklines.fill_from_history(self._service.history)
+            self._emit_filtered_rates()
+
+    def get_currency_analytics(self, currency_code: str) -> list[CurrencyAnalytics]:
+        """
+        특정 통화의 기본 이동 구간별 분석 결과(이동 평균, 변동성, 전일 대비 변동)를 반환합니다.
+
+        Args:
+            currency_code (str): 통화 코드.
+
+        Returns:
+            list[CurrencyAnalytics]: 이동 구간별 분석 결과. 이력이 없으면 빈 리스트.
+        """
+        results = [self._analytics.analyze(currency_code, window) for window in DEFAULT_WINDOWS]
+        return [result for result in results if result is not None]
+
+    def get_currency_correlations(self, currency_code: str, lookback: int = 250) -> list[tuple[str, float]]:
+        """
+        특정 통화와 다른 통화 간의 일간 수익률 상관계수를 절댓값이 큰 순서로 반환합니다.
+
+        Args:
+            currency_code (str): 통화 코드.
+            lookback (int, optional): 계산에 사용할 최근 날짜 수. 기본값은 250 (약 1년).
+
+        Returns:
+            list[tuple[str, float]]: (통화 코드, 상관계수) 리스트.
+        """
+        currencies, matrix = self._analytics.correlations(lookback)
+        if currency_code not in currencies:
+            return []
+        row = matrix[currencies.index(currency_code)]
+        pairs = [(code, float(value)) for code, value in zip(currencies, row)
+                 if code != currency_code and not math.isnan(value)]
+        return sorted(pairs, key=lambda pair: abs(pair[1]), reverse=True)
+
+    def shutdown(self):
+        """
+        애플리케이션 종료 시 서비스의 스레드 풀 등 자원을 정리합니다.
+        """
+        self.revalidation_finished.disconnect(self._on_revalidated) # 종료 후 도착한 재확인 결과는 무시
+        self._service.shutdown()
+
+    def _warm_analytics(self, rates: list[ExchangeRate]):
+        """
+        주어진 통화들의 기본 이동 구간 분석 결과를 미리 계산해 캐시에 넣어 둡니다.
+        재확인/백필 스레드에서 호출하므로 UI 스레드는 상세 화면을 열 때 캐시된 결과만 읽습니다.
+        분석기는 자체 락으로 보호되므로 UI 스레드의 조회와 겹쳐도 안전합니다.
+
+        Args:
+            rates (list[ExchangeRate]): 분석할 통화의 환율 정보. 비어 있으면 아무것도 하지 않습니다.
+        """
+        for rate in rates:
+            self.get_currency_analytics(rate.cur_unit)
+
     def _emit_filtered_rates(self):
         """
         현재 필터링된 환율 데이터를 View에 전달하기 위해 `exchange_rates_changed` 시그널을 발생시킵니다.
@@ -119,4 +347,10 @@ class ExchangeRateViewModel(QObject):
         """
         # API 응답 결과가 1(성공)인 통화만 목록에 포함
         currencies_list = [(rate.cur_unit, rate.cur_nm) for rate in self._all_exchange_rates if rate.result == 1]
-        self.available_currencies_changed.emit(currencies_list, self._visible_currencies)
\ No newline at end of file
+        self.available_currencies_changed.emit(currencies_list, self._visible_currencies)
+
+    def _emit_quota(self):
+        """
+        현재 남은 API 할당량을 View에 전달하기 위해 `quota_changed` 시그널을 발생시킵니다.
+        """
+        self.quota_changed.emit(self._service.scheduler.remaining, self._service.scheduler.daily_limit)
\ No newline at end of file
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# 필요한 모듈들을 임포트합니다.
+import datetime # 전일 기준일 계산을 위해 사용
+from PySide6.QtCore import QObject, Signal, Slot # PySide6의 시그널/슬롯 메커니즘을 위해 사용
+from service.exchange_rate_service import ExchangeRateService # 환율 데이터와 이력을 제공하는 서비스
+from service.portfolio import Portfolio, PortfolioValuation # 외화 보유 내역 및 평가 결과
+from viewmodel.exchange_rate_viewmodel import ExchangeRateViewModel # 환율 새로고침을 알려주는 뷰모델
+from model.exchange_rate_model import ExchangeRate # 환율 데이터 모델
+
+
+class PortfolioViewModel(QObject):
+    """
+    외화 보유 내역의 원화 평가를 담당하는 ViewModel입니다.
+    ExchangeRateViewModel이 환율을 새로 가져올 때마다 보유 내역 전체를 다시 평가하고 View에 알립니다.
+    """
+    # 평가 결과(PortfolioValuation)가 변경될 때 View에 알리는 시그널
+    valuation_changed = Signal(object)
+    # 보유 내역 관련 상태 메시지가 변경될 때 View에 알리는 시그널
+    status_changed = Signal(str)
+
+    def __init__(self, service: ExchangeRateService, exchange_viewmodel: ExchangeRateViewModel,
+                 file_path: str = 'portfolio.csv'):
+        """
+        PortfolioViewModel의 생성자입니다.
+
+        Args:
+            service (ExchangeRateService): 현재 환율과 환율 이력을 제공하는 서비스 인스턴스.
+            exchange_viewmodel (ExchangeRateViewModel): 환율 새로고침을 알려주는 뷰모델.
+            file_path (str, optional): 보유 내역 CSV 파일 경로. 기본값은 'portfolio.csv'.
+        """
+        super().__init__() # QObject의 생성자 호출
+        self._service = service # 환율 서비스 인스턴스 저장
+        self.file_path = file_path # 보유 내역 파일 경로
+        self.portfolio = Portfolio() # 외화 보유 내역
+        try:
+            self.portfolio.load_csv(file_path)
+        except ValueError as e:
+            print(f"보유 내역 파일을 읽는 중 오류 발생: {e}")
+        self.valuation: PortfolioValuation | None = None # 마지막 평가 결과
+        # 새로고침으로 환율을 새로 가져올 때마다 다시 평가합니다.
+        exchange_viewmodel.rates_refreshed.connect(self.revalue)
+
+    @Slot(str)
+    def import_holdings(self, path: str):
+        """
+        CSV 파일에서 보유 내역을 불러와 기본 보유 내역 파일로 저장하고 다시 평가합니다.
+        불러오지 못하면 기존 보유 내역과 파일은 그대로 두고 상태 메시지로 알립니다.
+
+        Args:
+            path (str): 불러올 CSV 파일 경로 (열: name, cur_unit, amount).
+        """
+        try:
+            count = self.portfolio.load_csv(path)
+        except ValueError as e:
+            self.status_changed.emit(f"보유 내역을 불러오지 못했습니다: {e}")
+            return
+        if not count: # 선택한 파일이 사라진 경우
+            self.status_changed.emit(f"보유 내역 파일을 찾을 수 없습니다: {path}")
+            return
+        self.portfolio.save_csv(self.file_path)
+        self.status_changed.emit(f"보유 내역 {count:,}건을 불러왔습니다.")
+        self.revalue(self._service.get_all_exchange_rates())
+
+    @Slot(list)
+    def revalue(self, rates: list[ExchangeRate]):
+        """
+        현재 환율과 이력에 저장된 전일 환율로 보유 내역 전체를 평가하고 `valuation_changed` 시그널을 발생시킵니다.
+
+        Args:
+            rates (list[ExchangeRate]): 현재 환율 정보.
+        """
+        if not rates:
+            return
+        rate_date = self._service.exchange_rates_date
+        previous_date, previous_rates = None, None
+        if rate_date:
+            # 기준일 전날 이전(포함)에 저장된 가장 최근 날짜를 전일로 사용합니다. (주말/공휴일 건너뜀)
+            day_before = datetime.datetime.strptime(rate_date, "%Y%m%d").date() - datetime.timedelta(days=1)
+            previous_date = self._service.date_index.as_of(day_before.strftime("%Y%m%d"))
+            if previous_date is not None:
+                previous_rates = self._service.history.get_day(previous_date)
+        self.valuation = self.portfolio.revalue(rates, previous_rates, rate_date, previous_date)
+        self.valuation_changed.emit(self.valuation)